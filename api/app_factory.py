@@ -0,0 +1,77 @@
+import importlib
+
+from flask import Flask
+
+from api.openapi_spec import init_static_spec
+from infrastructure.compression.compressioninit import compression
+from infrastructure.cache.response_cacheinit import response_cache
+from infrastructure.database.flask_sqlalchemyinit import init_database
+from infrastructure.json_provider import init_json_provider
+from infrastructure.metrics.metricsinit import metrics
+from infrastructure.security.auth.flask_jwtextendedinit import jwt, token_blocklist
+from infrastructure.security.rate_limitinit import rate_limiter
+from infrastructure.settings import CONFIG_MODULE
+
+# Aplicação única com todas as APIs registradas como blueprints.
+# Cada blueprint é importado apenas quando habilitado (APP_BLUEPRINTS), então as dependências
+# pesadas ficam fora do processo quando não são usadas: requests e o extrator de títulos só com
+# 'scraping' (o BeautifulSoup só é importado se a análise completa da página for necessária) e o
+# flasgger só com SWAGGER_ENABLED e sem especificação pré-gerada (OPENAPI_SPEC_FILE, ver api/openapi_spec.py).
+#
+#   python -m api.app_factory
+
+# Nome do blueprint -> (módulo, atributo)
+BLUEPRINTS = {
+    'auth': ('api.auth_jwt_impl_example', 'auth_bp'),
+    'recipes': ('api.recipes_api', 'recipes_bp'),
+    'items': ('api.items_api', 'items_bp'),
+    'scraping': ('api.web_scraping_api', 'scraping_bp'),
+}
+
+
+def create_app(config=None, blueprints=None, **overrides):
+    """
+    Cria e configura a aplicação Flask.
+
+    Args:
+        config (str or object): Módulo ou objeto de configuração. Por padrão, o perfil de APP_CONFIG.
+        blueprints (list): Blueprints a registrar. Por padrão, os de APP_BLUEPRINTS.
+        **overrides: Valores que substituem os da configuração (ex.: SWAGGER_ENABLED=False).
+
+    Returns:
+        Flask: Aplicação configurada.
+    """
+    app = Flask(__name__)
+    app.config.from_object(config or CONFIG_MODULE)
+    app.config.update(overrides)
+
+    init_json_provider(app)
+    compression.init_app(app)
+    init_database(app)
+    metrics.init_app(app)
+    jwt.init_app(app)
+    token_blocklist.init_app(app)
+    response_cache.init_app(app)
+    rate_limiter.init_app(app)
+
+    for name in blueprints or app.config['APP_BLUEPRINTS']:
+        if name not in BLUEPRINTS:
+            raise ValueError(f"Blueprint desconhecido: {name}")
+
+        module_name, attribute = BLUEPRINTS[name]
+        app.register_blueprint(getattr(importlib.import_module(module_name), attribute))
+
+    if app.config.get('SWAGGER_ENABLED', True):
+        if app.config.get('OPENAPI_SPEC_FILE'):
+            # Especificação pré-gerada: nenhuma docstring é lida em tempo de execução
+            init_static_spec(app)
+        else:
+            from flasgger import Swagger  # Importado apenas com a documentação gerada em tempo de execução
+
+            Swagger(app)
+
+    return app
+
+
+if __name__ == '__main__':
+    create_app().run(debug=True)
@@ -1,11 +1,16 @@
-from infrastructure.security.auth.flask_jwtextendedinit import (app, db, jwt_required, get_jwt_identity, create_access_token)
+from infrastructure.security.auth.flask_jwtextendedinit import (
+    db, jwt_required, get_jwt, get_jwt_identity, create_access_token, create_refresh_token, token_blocklist
+)
 from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy
-from flasgger import Swagger
-from flask import Flask, jsonify, request  # Importação dos componentes principais do Flask
+from infrastructure.security.passwords import hash_password, needs_rehash, verify_password
+from infrastructure.security.rate_limitinit import rate_limiter
+from flask import Blueprint, current_app, jsonify, request  # Importação dos componentes principais do Flask
 
-swagger = Swagger(app)
+# Registrado no app por create_app (api/app_factory.py)
+auth_bp = Blueprint('auth', __name__)
 
-@app.route('/register', methods=['POST'])
+@auth_bp.route('/register', methods=['POST'])
+@rate_limiter.limit('register')
 def register_user():
     """
     Registra um novo usuário.
@@ -46,6 +51,20 @@ def register_user():
                 message:
                   type: string
                   example: "User already exists"
+      429:
+        description: Muitas tentativas a partir deste IP; tente novamente após o tempo do cabeçalho Retry-After
+        headers:
+          Retry-After:
+            schema:
+              type: integer
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                error:
+                  type: string
+                  example: "Too many requests"
     """
 
     data = request.get_json()
@@ -53,17 +72,21 @@ def register_user():
     if ConfigSQLAlchemy.User.query.filter_by(username=data['username']).first():
         return jsonify({"message": "User already exists"}), 400
 
-    new_user = ConfigSQLAlchemy.User(username=data['username'], password=data['password'])
+    new_user = ConfigSQLAlchemy.User(
+        username=data['username'],
+        password=hash_password(data['password'], method=current_app.config['PASSWORD_HASH_METHOD'])
+    )
 
     db.session.add(new_user)
     db.session.commit()
 
     return jsonify({"msg": "User created"}), 201
 
-@app.route('/login', methods=['POST'])
+@auth_bp.route('/login', methods=['POST'])
+@rate_limiter.limit('login')
 def login():
     """
-    Faz login do usuário e retorna um JWT.
+    Faz login do usuário e retorna um JWT de acesso e um refresh token.
     ---
     tags:
       - Autenticação
@@ -91,6 +114,9 @@ def login():
                 access_token:
                   type: string
                   example: "eyJ0eXAiOiJKV1QiLCJh..."
+                refresh_token:
+                  type: string
+                  example: "eyJ0eXAiOiJKV1QiLCJh..."
       401:
         description: Credenciais inválidas
         content:
@@ -101,19 +127,112 @@ def login():
                 error:
                   type: string
                   example: "Invalid credentials"
+      429:
+        description: Muitas tentativas a partir deste IP; tente novamente após o tempo do cabeçalho Retry-After
+        headers:
+          Retry-After:
+            schema:
+              type: integer
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                error:
+                  type: string
+                  example: "Too many requests"
     """
     data = request.get_json()
     
     user = ConfigSQLAlchemy.User.query.filter_by(username=data['username']).first()
     
-    if user and user.password == data['password']:
-        token = create_access_token(identity=str(user.id))
-        return jsonify({"access_token": token}), 200
+    if user and verify_password(user.password, data['password']):
+        # Senhas em texto plano (cadastros antigos) ou com custo desatualizado são regravadas com o método atual
+        if needs_rehash(user.password, current_app.config['PASSWORD_HASH_METHOD']):
+            user.password = hash_password(data['password'], method=current_app.config['PASSWORD_HASH_METHOD'])
+            db.session.commit()
+
+        return jsonify({
+            "access_token": create_access_token(identity=str(user.id)),
+            "refresh_token": create_refresh_token(identity=str(user.id))
+        }), 200
     
     return jsonify(error="Invalid credentials"), 401
 
 
-@app.route('/protected', methods=['GET'])
+@auth_bp.route('/refresh', methods=['POST'])
+@jwt_required(refresh=True)
+def refresh():
+    """
+    Gera um novo JWT de acesso a partir do refresh token.
+    ---
+    tags:
+      - Autenticação
+    security:
+      - BearerAuth: []
+    responses:
+      200:
+        description: Novo JWT de acesso
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                access_token:
+                  type: string
+                  example: "eyJ0eXAiOiJKV1QiLCJh..."
+      401:
+        description: Refresh token ausente, inválido, expirado ou revogado
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                msg:
+                  type: string
+                  example: "Token has been revoked"
+    """
+    return jsonify({"access_token": create_access_token(identity=get_jwt_identity())}), 200
+
+
+@auth_bp.route('/logout', methods=['POST'])
+@jwt_required(verify_type=False)
+def logout():
+    """
+    Revoga o token enviado (de acesso ou refresh).
+    ---
+    tags:
+      - Autenticação
+    security:
+      - BearerAuth: []
+    responses:
+      200:
+        description: Token revogado
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                msg:
+                  type: string
+                  example: "Token revogado"
+      401:
+        description: Token JWT ausente ou inválido
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                msg:
+                  type: string
+                  example: "Missing Authorization Header"
+    """
+    claims = get_jwt()
+    token_blocklist.revoke(claims['jti'], claims['exp'])
+    return jsonify({"msg": "Token revogado"}), 200
+
+
+@auth_bp.route('/protected', methods=['GET'])
 @jwt_required()
 def protected():
     """
@@ -150,4 +269,7 @@ def protected():
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    from api.app_factory import create_app
+
+    create_app(blueprints=['auth']).run(debug=True)
+
@@ -1,39 +1,89 @@
-from flask import Flask, jsonify, request  # Importação dos componentes principais do Flask
+from flask import Blueprint, current_app, jsonify, request  # Importação dos componentes principais do Flask
 from infrastructure.security.auth.basicAuth import BasicAuthentication
-from flasgger import Swagger
+from infrastructure.repositories.items_repository import (FIELD_NAME, BatchOperationError,
+                                                            create_item_repository)
 
-# Criando uma instância da classe Flask, que representa a aplicação web
-items_api = Flask(__name__)
+# Blueprint dos itens, registrado no app por create_app (api/app_factory.py)
+items_bp = Blueprint('items', __name__)
 
-# Lista que servirá como armazenamento temporário de itens
-items = []
 
-items_api.config['Swagger'] = {
-    'title': 'My Flask API',
-    'universion': 3
-}
+@items_bp.record_once
+def init_item_repository(state):
+    # Repositório de itens: em memória (um processo) ou SQLite (compartilhado entre workers), conforme ITEMS_REPOSITORY
+    state.app.extensions['items_repository'] = create_item_repository(
+        state.app.config['ITEMS_REPOSITORY'], state.app.config['ITEMS_DATABASE_PATH']
+    )
+    BasicAuthentication.init_app(state.app)
 
-swagger = Swagger(items_api)
 
-@items_api.route('/items', methods=['GET'])  # Define um endpoint que responde a requisições GET na rota /items
+def item_repository():
+    return current_app.extensions['items_repository']
+
+
+@items_bp.route('/items', methods=['GET'])  # Define um endpoint que responde a requisições GET na rota /items
 @BasicAuthentication.auth.login_required
 def get_items():
     """
-    Obtém a lista de itens armazenados.
+    Obtém a lista de itens armazenados, paginada por ID.
+    Qualquer outro parâmetro da query string filtra os itens por igualdade no campo
+    de mesmo nome (ex.: /items?nome=Coca-Cola). Valores como 10, true e null também
+    encontram os campos numéricos, booleanos e nulos (ex.: /items?ativo=true).
     ---
     tags:
       - Items
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        default: 100
+        description: Quantidade máxima de itens na página (ITEMS_PAGE_SIZE / ITEMS_MAX_PAGE_SIZE).
+      - name: cursor
+        in: query
+        type: integer
+        required: false
+        description: Valor de next_cursor retornado pela página anterior.
     responses:
       200:
-        description: Retorna a lista de itens armazenados.
+        description: Retorna uma página de itens armazenados.
         schema:
-          type: array
-          items:
-            type: object
+          type: object
+          properties:
+            items:
+              type: array
+              items:
+                type: object
+                properties:
+                  id:
+                    type: integer
+                    description: ID do item.
+            next_cursor:
+              type: integer
+              description: Cursor da próxima página, ou null quando não há mais itens.
+      400:
+        description: Parâmetro de paginação ou filtro inválido.
     """
-    return jsonify(items)
+    limit = request.args.get('limit', current_app.config['ITEMS_PAGE_SIZE'], type=int)
+    cursor = request.args.get('cursor', type=int)
+    filters = {field: value for field, value in request.args.items() if field not in ('limit', 'cursor')}
+
+    if not 1 <= limit <= current_app.config['ITEMS_MAX_PAGE_SIZE']:
+        return jsonify({"error": f"limit must be between 1 and {current_app.config['ITEMS_MAX_PAGE_SIZE']}"}), 400
+
+    if 'cursor' in request.args and cursor is None:
+        return jsonify({"error": "invalid cursor"}), 400
 
-@items_api.route('/items', methods=['POST'])  # Define um endpoint que responde a requisições POST na rota /items
+    if not all(FIELD_NAME.match(field) for field in filters):
+        return jsonify({"error": "invalid filter field"}), 400
+
+    # Busca um item a mais apenas para saber se existe uma próxima página
+    page = item_repository().list(limit=limit + 1, after_id=cursor, filters=filters)
+    has_next = len(page) > limit
+    page = page[:limit]
+
+    return jsonify({"items": page, "next_cursor": page[-1]['id'] if has_next else None})
+
+@items_bp.route('/items', methods=['POST'])  # Define um endpoint que responde a requisições POST na rota /items
 @BasicAuthentication.auth.login_required
 def create_item():
     """
@@ -56,21 +106,24 @@ def create_item():
               description: Descrição do item.
     responses:
       201:
-        description: O item foi criado com sucesso.
+        description: O item foi criado com sucesso (com o ID gerado).
         schema:
           type: object
       400:
         description: Erro ao criar item.
     """
     data = request.get_json()
-    items.append(data)
-    return jsonify(data), 201
 
-@items_api.route('/items/<int:item_id>', methods=['PUT'])  # Define um endpoint que responde a requisições PUT para atualizar um item específico
+    if not isinstance(data, dict):
+        return jsonify({"error": "item must be a JSON object"}), 400
+
+    return jsonify(item_repository().add(data)), 201
+
+@items_bp.route('/items/<int:item_id>', methods=['PUT'])  # Define um endpoint que responde a requisições PUT para atualizar um item específico
 @BasicAuthentication.auth.login_required
 def update_item(item_id):
     """
-    Atualiza um item existente pelo índice.
+    Atualiza um item existente pelo ID.
     ---
     tags:
       - Items
@@ -79,7 +132,7 @@ def update_item(item_id):
         in: path
         type: integer
         required: true
-        description: Índice do item a ser atualizado.
+        description: ID do item a ser atualizado.
       - name: item
         in: body
         required: true
@@ -90,22 +143,27 @@ def update_item(item_id):
         description: Item atualizado com sucesso.
         schema:
           type: object
+      400:
+        description: Corpo da requisição inválido.
       404:
         description: Item não encontrado.
     """
     data = request.get_json()
 
-    if 0 <= item_id < len(items):
-        items[item_id].update(data)
-        return jsonify(items[item_id])
+    if not isinstance(data, dict):
+        return jsonify({"error": "item must be a JSON object"}), 400
+
+    item = item_repository().update(item_id, data)
+    if item is not None:
+        return jsonify(item)
 
     return jsonify({"error": "item not found"}), 404
 
-@items_api.route('/items/<int:item_id>', methods=['DELETE'])  # Define um endpoint que responde a requisições DELETE para remover um item específico
+@items_bp.route('/items/<int:item_id>', methods=['DELETE'])  # Define um endpoint que responde a requisições DELETE para remover um item específico
 @BasicAuthentication.auth.login_required
 def delete_item(item_id):
     """
-    Remove um item pelo índice.
+    Remove um item pelo ID.
     ---
     tags:
       - Items
@@ -114,7 +172,7 @@ def delete_item(item_id):
         in: path
         type: integer
         required: true
-        description: Índice do item a ser removido.
+        description: ID do item a ser removido.
     responses:
       200:
         description: Item removido com sucesso.
@@ -123,11 +181,143 @@ def delete_item(item_id):
       404:
         description: Item não encontrado.
     """
-    if 0 <= item_id < len(items):
-        removed = items.pop(item_id)
+    removed = item_repository().delete(item_id)
+    if removed is not None:
         return jsonify(removed)
 
     return jsonify({"error": "item not found"}), 404
 
+@items_bp.route('/items/<int:item_id>', methods=['PATCH'])  # Define um endpoint que responde a requisições PATCH para alterar parte de um item
+@BasicAuthentication.auth.login_required
+def patch_item(item_id):
+    """
+    Altera apenas os campos enviados de um item (JSON Merge Patch, RFC 7396).
+    Campos com valor null são removidos do item.
+    ---
+    tags:
+      - Items
+    parameters:
+      - name: item_id
+        in: path
+        type: integer
+        required: true
+        description: ID do item a ser alterado.
+      - name: patch
+        in: body
+        required: true
+        schema:
+          type: object
+          example: {"valor": "R$18,00", "descricao": null}
+    responses:
+      200:
+        description: Item alterado com sucesso.
+        schema:
+          type: object
+      400:
+        description: Corpo da requisição inválido.
+      404:
+        description: Item não encontrado.
+    """
+    data = request.get_json()
+
+    if not isinstance(data, dict):
+        return jsonify({"error": "patch must be a JSON object"}), 400
+
+    item = item_repository().patch(item_id, data)
+    if item is not None:
+        return jsonify(item)
+
+    return jsonify({"error": "item not found"}), 404
+
+@items_bp.route('/items:batch', methods=['POST'])  # Define um endpoint que aplica várias operações em uma única requisição
+@BasicAuthentication.auth.login_required
+def batch_items():
+    """
+    Aplica várias operações de criação, atualização, alteração parcial e remoção de forma atômica:
+    se alguma operação falhar, nenhuma é aplicada.
+    ---
+    tags:
+      - Items
+    parameters:
+      - name: batch
+        in: body
+        required: true
+        schema:
+          type: object
+          properties:
+            operations:
+              type: array
+              items:
+                type: object
+                properties:
+                  op:
+                    type: string
+                    enum: [create, update, patch, delete]
+                  id:
+                    type: integer
+                    description: ID do item (update, patch e delete).
+                  item:
+                    type: object
+                    description: Dados do item (create, update e patch).
+          example:
+            operations:
+              - {"op": "create", "item": {"nome": "Guaraná", "valor": "R$8,00"}}
+              - {"op": "patch", "id": 1, "item": {"valor": "R$18,00"}}
+              - {"op": "delete", "id": 2}
+    responses:
+      200:
+        description: Todas as operações foram aplicadas; retorna o resultado de cada uma.
+        schema:
+          type: object
+          properties:
+            results:
+              type: array
+              items:
+                type: object
+      400:
+        description: Lote inválido.
+      409:
+        description: Alguma operação falhou e nenhuma foi aplicada. results tem o erro da que falhou
+          e, para cada uma das demais, status 424 (não aplicada).
+    """
+    data = request.get_json(silent=True)
+    operations = data.get('operations') if isinstance(data, dict) else None
+
+    if not isinstance(operations, list) or not operations:
+        return jsonify({"error": "operations must be a non-empty list"}), 400
+
+    if len(operations) > current_app.config['ITEMS_MAX_BATCH_SIZE']:
+        return jsonify({"error": f"At most {current_app.config['ITEMS_MAX_BATCH_SIZE']} operations per batch"}), 400
+
+    for index, operation in enumerate(operations):
+        error = validate_batch_operation(operation)
+        if error:
+            return jsonify({"error": f"operations[{index}]: {error}"}), 400
+
+    try:
+        results = item_repository().apply_batch(operations)
+    except BatchOperationError as e:
+        return jsonify({"results": e.results}), 409
+
+    return jsonify({"results": results})
+
+def validate_batch_operation(operation):
+    """
+    Valida o formato de uma operação do lote.
+
+    Returns:
+        str or None: Mensagem de erro, ou None se a operação for válida.
+    """
+    if not isinstance(operation, dict) or operation.get('op') not in ('create', 'update', 'patch', 'delete'):
+        return "op must be one of create, update, patch, delete"
+
+    if operation['op'] != 'create' and (isinstance(operation.get('id'), bool) or not isinstance(operation.get('id'), int)):
+        return "id must be an integer"
+
+    if operation['op'] != 'delete' and not isinstance(operation.get('item'), dict):
+        return "item must be a JSON object"
+
 if __name__ == '__main__':
-    items_api.run(debug=True)
+    from api.app_factory import create_app
+
+    create_app(blueprints=['items']).run(debug=True)
@@ -0,0 +1,99 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from flask import Response, current_app, request
+
+# Especificação OpenAPI pré-gerada.
+# Em desenvolvimento o Flasgger monta /apispec_1.json lendo as docstrings YAML das rotas. Com
+# OPENAPI_SPEC_FILE configurado (perfil de produção) o app serve o arquivo gerado aqui, com cache
+# de longa duração e ETag, e o Flasgger nem chega a ser importado.
+#
+#   python -m api.openapi_spec build   # gera o arquivo a partir das docstrings
+#   python -m api.openapi_spec check   # falha se o arquivo não corresponder às docstrings
+
+SPEC_ROUTE = '/apispec_1.json'
+DEFAULT_SPEC_FILE = 'openapi.json'
+
+
+def build_spec(config=None):
+    """
+    Gera a especificação a partir das docstrings de todos os blueprints, usando o Flasgger.
+
+    Args:
+        config (str or object): Configuração usada para criar o app (por padrão, a de APP_CONFIG).
+
+    Returns:
+        str: Especificação em JSON, com chaves ordenadas para que o arquivo gerado seja estável.
+    """
+    from api.app_factory import BLUEPRINTS, create_app
+
+    app = create_app(config, blueprints=list(BLUEPRINTS), SWAGGER_ENABLED=True, OPENAPI_SPEC_FILE=None)
+    with app.test_request_context():
+        spec = app.swag.get_apispecs('apispec_1')
+
+    return json.dumps(spec, indent=2, sort_keys=True, ensure_ascii=False, default=str) + '\n'
+
+
+def spec_path(app):
+    # Caminho relativo à pasta api/ (raiz do app)
+    return os.path.join(app.root_path, app.config.get('OPENAPI_SPEC_FILE') or DEFAULT_SPEC_FILE)
+
+
+def init_static_spec(app):
+    """
+    Registra a rota que serve a especificação pré-gerada (OPENAPI_SPEC_FILE).
+    O arquivo é lido uma única vez, na criação do app.
+
+    Args:
+        app (Flask): Aplicação Flask.
+    """
+    path = spec_path(app)
+    if not os.path.exists(path):
+        raise RuntimeError(f"{path} não encontrado; gere-o com: python -m api.openapi_spec build")
+
+    with open(path, 'rb') as spec_file:
+        data = spec_file.read()
+    etag = hashlib.sha1(data).hexdigest()
+
+    def openapi_spec():
+        response = Response(data, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = current_app.config.get('OPENAPI_SPEC_MAX_AGE', 86400)
+        return response.make_conditional(request)
+
+    app.add_url_rule(SPEC_ROUTE, 'openapi_spec', openapi_spec, methods=['GET'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Gera ou confere a especificação OpenAPI pré-gerada')
+    parser.add_argument('command', choices=('build', 'check'))
+    parser.add_argument('--output', help=f'Arquivo da especificação (padrão: api/{DEFAULT_SPEC_FILE})')
+    args = parser.parse_args()
+
+    spec = build_spec()
+    path = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), DEFAULT_SPEC_FILE)
+
+    if args.command == 'build':
+        with open(path, 'w', encoding='utf-8') as spec_file:
+            spec_file.write(spec)
+        print(f"Especificação gravada em {path}")
+        return
+
+    try:
+        with open(path, encoding='utf-8') as spec_file:
+            current = spec_file.read()
+    except FileNotFoundError:
+        current = None
+
+    if current != spec:
+        print(f"{path} está desatualizado em relação às docstrings; rode: python -m api.openapi_spec build")
+        sys.exit(1)
+    print(f"{path} corresponde às docstrings")
+
+
+if __name__ == '__main__':
+    main()
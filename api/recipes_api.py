@@ -1,12 +1,294 @@
-from infrastructure.security.auth.flask_jwtextendedinit import (app, db, jwt_required, get_jwt_identity, create_access_token)
+import csv
+import io
+
+from infrastructure.security.auth.flask_jwtextendedinit import (db, jwt_required, get_jwt_identity, create_access_token)
 from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy
-from flasgger import Swagger
-from flask import Flask, jsonify, request  # Importação dos componentes principais do Flask
+from infrastructure.database.table_version import bump_table_version, get_table_version
+from infrastructure.cache.response_cacheinit import response_cache
+from infrastructure.cache.etag import conditional_get, weak_etag
+from infrastructure.database.ingredient_index import (MATCH_ALL, MATCH_ANY, filter_by_ingredients,
+                                                      ingredient_index_rows, normalize_ingredients,
+                                                      parse_ingredient_args, sync_recipe_ingredients)
+from infrastructure.json_provider import dumps_rows
+from sqlalchemy import Text, insert, select, type_coerce
+from sqlalchemy.exc import SQLAlchemyError
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context  # Importação dos componentes principais do Flask
+
+# Registrado no app por create_app (api/app_factory.py)
+recipes_bp = Blueprint('recipes', __name__)
+
+# Campos que podem ser pedidos em ?fields= e como cada um é convertido para JSON
+RECIPE_FIELDS = {
+    'id': lambda r: r.id,
+    'title': lambda r: r.title,
+    'time_minutes': lambda r: r.time_minutes,
+    'ingredients': lambda r: r.ingredients,
+}
+# Campos lidos do banco já como texto JSON em GET /recipes (serialize_recipe_rows)
+RECIPE_RAW_JSON_FIELDS = frozenset({'ingredients'})
+
+
+def parse_recipe_fields(value):
+    """
+    Converte o parâmetro `fields` na lista de campos a carregar.
+
+    Args:
+        value (str or None): Campos separados por vírgula.
+
+    Returns:
+        list or None: Campos pedidos (sempre incluindo o id), todos os campos quando `value` é vazio,
+        ou None se algum campo não existir.
+    """
+    if not value:
+        return list(RECIPE_FIELDS)
+
+    fields = ['id']
+    for field in (f.strip() for f in value.split(',')):
+        if field not in RECIPE_FIELDS:
+            return None
+        if field not in fields:
+            fields.append(field)
+    return fields
+
+
+def validate_recipe_payload(data):
+    """
+    Valida os dados de uma receita recebida em lote.
+
+    Returns:
+        tuple: (dicionário com as colunas da receita, None) ou (None, mensagem de erro).
+    """
+    if not isinstance(data, dict):
+        return None, "A receita deve ser um objeto JSON"
+
+    title = data.get('title')
+    ingredients = data.get('ingredients')
+    time_minutes = data.get('time_minutes')
+
+    if not isinstance(title, str) or not title.strip() or len(title) > 100:
+        return None, "title deve ser um texto de 1 a 100 caracteres"
+
+    if not isinstance(ingredients, (str, list)) or not normalize_ingredients(ingredients):
+        return None, "ingredients deve ser um texto ou uma lista com ao menos um ingrediente"
+
+    if isinstance(time_minutes, bool) or not isinstance(time_minutes, int) or time_minutes < 0:
+        return None, "time_minutes deve ser um inteiro não negativo"
+
+    return {'title': title, 'ingredients': normalize_ingredients(ingredients), 'time_minutes': time_minutes}, None
+
+
+def read_ndjson_rows(stream):
+    """
+    Lê um stream NDJSON linha a linha, sem carregar o corpo inteiro na memória.
+
+    Yields:
+        tuple: (número da linha, objeto decodificado ou None se a linha não for JSON válido).
+    """
+    for row_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield row_number, current_app.json.loads(line)
+        except ValueError:
+            yield row_number, None
+
+
+def insert_recipe_batch(batch, result, add_error):
+    """
+    Insere um lote de receitas (e o índice de ingredientes) com executemany em uma única transação.
+    Se o lote falhar no banco, todas as linhas dele são reportadas como erro e os lotes seguintes continuam.
+
+    Args:
+        batch (list): Tuplas (número da linha, colunas da receita).
+        result (dict): Resumo da importação, atualizado com a quantidade inserida.
+        add_error (callable): Função que registra o erro de uma linha.
+    """
+    recipes = [recipe for _, recipe in batch]
+
+    try:
+        recipe_ids = db.session.scalars(
+            insert(ConfigSQLAlchemy.Recipe.__table__).returning(
+                ConfigSQLAlchemy.Recipe.__table__.c.id, sort_by_parameter_order=True
+            ),
+            recipes
+        ).all()
+
+        index_rows = [
+            entry
+            for recipe_id, recipe in zip(recipe_ids, recipes)
+            for entry in ingredient_index_rows(recipe_id, recipe['ingredients'])
+        ]
+        if index_rows:
+            db.session.execute(insert(ConfigSQLAlchemy.RecipeIngredient.__table__), index_rows)
+
+        bump_table_version('recipe')
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        for row_number, _ in batch:
+            add_error(row_number, f"Erro ao gravar o lote: {e.__class__.__name__}")
+        return
+
+    result['inserted'] += len(recipe_ids)
+
+
+def filter_recipes(query, args):
+    """
+    Aplica os filtros `ingredient`, `match` e `max_time` da query string.
+    Funciona tanto com Recipe.query quanto com um select() do SQLAlchemy.
+
+    Args:
+        query (Query or Select): Consulta sobre ConfigSQLAlchemy.Recipe.
+        args (MultiDict): Argumentos da requisição (request.args).
+
+    Returns:
+        Query or Select or None: Consulta filtrada, ou None se o parâmetro match for inválido.
+    """
+    ingredients = parse_ingredient_args(args)
+    match = args.get('match', MATCH_ALL)
+    max_time = args.get('max_time', type=int)
+
+    if match not in (MATCH_ALL, MATCH_ANY):
+        return None
+
+    if ingredients:
+        query = filter_by_ingredients(query, ingredients, match)
+
+    if max_time is not None:
+        query = query.filter(ConfigSQLAlchemy.Recipe.time_minutes <= max_time)
+
+    return query
+
+
+def recipes_cache_key(args):
+    """
+    Chave de cache de GET /recipes: os mesmos filtros escritos de formas diferentes
+    (ordem, maiúsculas, espaços) resultam na mesma chave.
+    """
+    return (
+        tuple(sorted(parse_ingredient_args(args))),
+        args.get('match', MATCH_ALL),
+        args.get('max_time', type=int),
+        args.get('limit'),
+        args.get('cursor'),
+        parse_recipe_fields(args.get('fields'))
+    )
+
+
+def recipes_version():
+    return get_table_version('recipe')
+
+
+def recipes_etag(args=None, version=None):
+    """
+    ETag de GET /recipes: versão da tabela recipe + filtros normalizados da consulta.
+    O modo assíncrono (api/recipes_asgi.py) informa a query string e a versão lida pela sua sessão.
+    """
+    args = request.args if args is None else args
+    version = recipes_version() if version is None else version
+    return weak_etag('recipes', version, recipes_cache_key(args))
+
+
+def recipe_etag(recipe_id):
+    """
+    ETag de GET /recipes/<id>, derivado do updated_at da receita (None se ela não existir).
+    """
+    updated_at = db.session.scalar(
+        select(ConfigSQLAlchemy.Recipe.updated_at).where(ConfigSQLAlchemy.Recipe.id == recipe_id)
+    )
+    if updated_at is None:
+        return None
+    return weak_etag('recipe', recipe_id, updated_at.isoformat())
+
+
+def serialize_recipe(recipe, fields):
+    """
+    Converte uma receita em dicionário contendo apenas os campos pedidos.
+    """
+    return {field: RECIPE_FIELDS[field](recipe) for field in fields}
+
+
+def serialize_recipe_rows(rows, fields, json_provider=None):
+    """
+    Serializa as linhas de um select das colunas `fields` (tuplas, sem objetos do ORM) como uma lista
+    JSON, sem montar um dicionário por linha. Os ingredientes já vêm como texto JSON do banco
+    (recipes_page_query) e entram como estão. Colunas além de `fields` no fim da linha (ex.: o id
+    usado no cursor) ficam de fora.
+
+    Returns:
+        bytes: Lista JSON das receitas.
+    """
+    json_provider = current_app.json if json_provider is None else json_provider
+    return dumps_rows(json_provider, rows, fields, raw_fields=RECIPE_RAW_JSON_FIELDS)
+
+
+def recipes_page_query(args):
+    """
+    Monta a consulta de uma página de GET /recipes a partir da query string.
+    Usada também pelo modo assíncrono (api/recipes_asgi.py).
+
+    Args:
+        args (MultiDict): Argumentos da requisição (request.args).
+
+    Returns:
+        tuple: (select da página, limit, campos, None) ou (None, None, None, mensagem de erro).
+        O select traz as colunas de `campos`, na mesma ordem, seguidas do id quando ele não foi pedido.
+    """
+    limit = args.get('limit', current_app.config['RECIPES_PAGE_SIZE'], type=int)
+    cursor = args.get('cursor', type=int)
+    fields = parse_recipe_fields(args.get('fields'))
+
+    if not 1 <= limit <= current_app.config['RECIPES_MAX_PAGE_SIZE']:
+        return None, None, None, f"limit deve estar entre 1 e {current_app.config['RECIPES_MAX_PAGE_SIZE']}"
+
+    if 'cursor' in args and cursor is None:
+        return None, None, None, "cursor inválido"
+
+    if fields is None:
+        return None, None, None, f"fields aceita apenas: {', '.join(RECIPE_FIELDS)}"
+
+    # Colunas, e não a entidade: as linhas vêm como tuplas, sem o custo de montar objetos do ORM.
+    # Os ingredientes (coluna JSON) vêm como o texto gravado, sem decodificar a lista de cada linha.
+    # O id vai sempre ao final (se não foi pedido) para o next_cursor; serialize_recipe_rows o ignora.
+    columns = [
+        type_coerce(getattr(ConfigSQLAlchemy.Recipe, field), Text) if field in RECIPE_RAW_JSON_FIELDS
+        else getattr(ConfigSQLAlchemy.Recipe, field)
+        for field in fields
+    ]
+    if 'id' not in fields:
+        columns.append(ConfigSQLAlchemy.Recipe.id)
+    query = filter_recipes(select(*columns), args)
+
+    if query is None:
+        return None, None, None, "match deve ser 'all' ou 'any'"
 
-swagger = Swagger(app)
+    if cursor is not None:
+        query = query.where(ConfigSQLAlchemy.Recipe.id > cursor)
 
+    # Busca um registro a mais apenas para saber se existe uma próxima página
+    return query.order_by(ConfigSQLAlchemy.Recipe.id).limit(limit + 1), limit, fields, None
 
-@app.route('/recipes', methods=['POST'])
+
+def recipes_page(recipes, limit, fields, json_provider=None):
+    """
+    Monta o corpo JSON (bytes) de GET /recipes a partir das linhas buscadas por recipes_page_query.
+    O modo assíncrono (api/recipes_asgi.py), que roda fora do contexto do app, informa o provider.
+    """
+    json_provider = current_app.json if json_provider is None else json_provider
+    has_next = len(recipes) > limit
+    recipes = recipes[:limit]
+
+    members = [
+        (b'"recipes":', serialize_recipe_rows(recipes, fields, json_provider)),
+        (b'"next_cursor":', b'%d' % recipes[-1].id if has_next else b'null'),
+    ]
+    if json_provider.sort_keys:
+        members.reverse()
+    return b'{' + b','.join(key + value for key, value in members) + b'}\n'
+
+
+@recipes_bp.route('/recipes', methods=['POST'])
 @jwt_required()
 def create_recipe():
     """
@@ -31,7 +313,12 @@ def create_recipe():
                 type: string
                 example: "Bolo de cenoura"
               ingredients:
-                type: string
+                oneOf:
+                  - type: string
+                  - type: array
+                    items:
+                      type: string
+                description: Separados por vírgula ou em lista; gravados em minúsculas, sem espaços extras e sem repetição
                 example: "cenoura, farinha, ovos, açúcar"
               time_minutes:
                 type: integer
@@ -64,14 +351,136 @@ def create_recipe():
         ingredients=data['ingredients'],
         time_minutes=data['time_minutes']
     )
+    sync_recipe_ingredients(new_recipe)
 
     db.session.add(new_recipe)
+    bump_table_version('recipe')
     db.session.commit()
+    response_cache.invalidate('recipes')
 
     return jsonify({"msg": "Recipe created"}), 201
 
-@app.route('/recipes', methods=['GET'])
+@recipes_bp.route('/recipes/bulk', methods=['POST'])
+@jwt_required()
+def create_recipes_bulk():
+    """
+    Cria receitas em lote.
+    Aceita um array JSON ou um stream NDJSON (uma receita por linha). O NDJSON é lido
+    linha a linha, então o arquivo enviado pode ser maior que a memória disponível.
+    As receitas são inseridas em lotes (uma transação por lote) e as linhas inválidas
+    são informadas individualmente, sem impedir a gravação das demais.
+    ---
+    tags:
+      - Receitas
+    security:
+      - BearerAuth: []
+    parameters:
+      - in: query
+        name: batch_size
+        schema:
+          type: integer
+          default: 500
+        required: false
+        description: Quantidade de receitas inseridas por transação (RECIPES_BULK_BATCH_SIZE)
+    requestBody:
+      required: true
+      content:
+        application/json:
+          schema:
+            type: array
+            items:
+              type: object
+              properties:
+                title:
+                  type: string
+                  example: "Bolo de cenoura"
+                ingredients:
+                  oneOf:
+                    - type: string
+                    - type: array
+                      items:
+                        type: string
+                  description: Separados por vírgula ou em lista; gravados em minúsculas, sem espaços extras e sem repetição
+                  example: "cenoura, farinha, ovos, açúcar"
+                time_minutes:
+                  type: integer
+                  example: 45
+        application/x-ndjson:
+          schema:
+            type: string
+            example: '{"title": "Bolo de cenoura", "ingredients": "cenoura, farinha", "time_minutes": 45}'
+    responses:
+      201:
+        description: Lote processado; linhas com erro são listadas em errors
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                inserted:
+                  type: integer
+                  example: 998
+                failed:
+                  type: integer
+                  example: 2
+                errors:
+                  type: array
+                  items:
+                    type: object
+                    properties:
+                      row:
+                        type: integer
+                        example: 15
+                      error:
+                        type: string
+                        example: "time_minutes deve ser um inteiro não negativo"
+      400:
+        description: Corpo da requisição ou batch_size inválido
+    """
+    batch_size = request.args.get('batch_size', current_app.config['RECIPES_BULK_BATCH_SIZE'], type=int)
+
+    if not 1 <= batch_size <= current_app.config['RECIPES_BULK_MAX_BATCH_SIZE']:
+        return jsonify({"message": f"batch_size deve estar entre 1 e {current_app.config['RECIPES_BULK_MAX_BATCH_SIZE']}"}), 400
+
+    if request.mimetype in ('application/x-ndjson', 'application/jsonlines'):
+        rows = read_ndjson_rows(request.stream)
+    else:
+        data = request.get_json(silent=True)
+        if not isinstance(data, list):
+            return jsonify({"message": "O corpo deve ser um array JSON ou NDJSON"}), 400
+        rows = enumerate(data, start=1)
+
+    result = {'inserted': 0, 'failed': 0, 'errors': []}
+
+    def add_error(row_number, error):
+        result['failed'] += 1
+        if len(result['errors']) < current_app.config['RECIPES_BULK_MAX_ERRORS']:
+            result['errors'].append({'row': row_number, 'error': error})
+
+    batch = []
+    for row_number, data in rows:
+        recipe, error = validate_recipe_payload(data)
+        if error:
+            add_error(row_number, error)
+            continue
+
+        batch.append((row_number, recipe))
+        if len(batch) >= batch_size:
+            insert_recipe_batch(batch, result, add_error)
+            batch = []
+
+    if batch:
+        insert_recipe_batch(batch, result, add_error)
+
+    if result['inserted']:
+        response_cache.invalidate('recipes')
+
+    return jsonify(result), 201
+
+@recipes_bp.route('/recipes', methods=['GET'])
 @jwt_required()
+@conditional_get(recipes_etag)
+@response_cache.cached('recipes', key_func=recipes_cache_key, version_func=recipes_version)
 def get_recipes():
     """
     Lista receitas com filtros opcionais.
@@ -86,62 +495,266 @@ def get_recipes():
         schema:
           type: string
         required: false
-        description: Filtra por ingrediente
+        description: >
+          Filtra por ingrediente (comparação exata, sem diferenciar maiúsculas).
+          Aceita vários ingredientes separados por vírgula ou repetindo o parâmetro.
+      - in: query
+        name: match
+        schema:
+          type: string
+          enum: [all, any]
+          default: all
+        required: false
+        description: Com vários ingredientes, 'all' exige todos (AND) e 'any' aceita qualquer um (OR)
       - in: query
         name: max_time
         schema:
           type: integer
         required: false
         description: Tempo máximo de preparo (minutos)
+      - in: query
+        name: limit
+        schema:
+          type: integer
+          default: 50
+          maximum: 500
+        required: false
+        description: Quantidade máxima de receitas na página (RECIPES_PAGE_SIZE / RECIPES_MAX_PAGE_SIZE)
+      - in: query
+        name: cursor
+        schema:
+          type: integer
+        required: false
+        description: >
+          Valor de next_cursor retornado pela página anterior. A paginação é feita por id
+          (keyset), então o custo de cada página não cresce com a posição na tabela.
+      - in: query
+        name: fields
+        schema:
+          type: string
+          example: "title,time_minutes"
+        required: false
+        description: >
+          Campos a retornar, separados por vírgula (id, title, time_minutes, ingredients).
+          Apenas as colunas pedidas são carregadas do banco; o id é sempre retornado.
     responses:
       200:
-        description: Lista de receitas filtradas.
+        description: Página de receitas filtradas.
         content:
           application/json:
             schema:
-              type: array
-              items:
-                type: object
-                properties:
-                  id:
-                    type: integer
-                    example: 1
-                  title:
-                    type: string
-                    example: "Bolo de chocolate"
-                  time_minutes:
-                    type: integer
-                    example: 45
-                  ingredients:
-                    type: array
-                    items:
-                      type: string
-                    example: ["chocolate", "farinha", "açúcar"]
+              type: object
+              properties:
+                recipes:
+                  type: array
+                  items:
+                    type: object
+                    properties:
+                      id:
+                        type: integer
+                        example: 1
+                      title:
+                        type: string
+                        example: "Bolo de chocolate"
+                      time_minutes:
+                        type: integer
+                        example: 45
+                      ingredients:
+                        type: array
+                        items:
+                          type: string
+                        example: ["chocolate", "farinha", "açúcar"]
+                next_cursor:
+                  type: integer
+                  nullable: true
+                  description: Cursor da próxima página, ou null quando não há mais receitas
+                  example: 50
+      400:
+        description: Parâmetro match, limit, cursor ou fields inválido
     """
-    ingredient = request.args.get('ingredient')
-    max_time = request.args.get('max_time', type=int)
+    query, limit, fields, error = recipes_page_query(request.args)
 
-    query = ConfigSQLAlchemy.Recipe.query
+    if error:
+        return jsonify({"message": error}), 400
 
-    if ingredient:
-        query = query.filter(ConfigSQLAlchemy.Recipe.ingredients.ilike(f'%{ingredient}%'))
-    
-    if max_time is not None:
-        query = query.filter(ConfigSQLAlchemy.Recipe.time_minutes <= max_time)
+    body = recipes_page(db.session.execute(query).all(), limit, fields)
+    return current_app.response_class(body, mimetype=current_app.json.mimetype)
 
-    recipes = query.all()
-    
-    return jsonify([
-        {
-            'id': r.id,
-            'title': r.title,
-            'time_minutes': r.time_minutes,
-            'ingredients': r.ingredients.split(',')
-        }
-        for r in recipes 
-    ])
-
-@app.route('/recipes/<int:recipe_id>', methods=['PUT'])
+@recipes_bp.route('/recipes/export', methods=['GET'])
+@jwt_required()
+def export_recipes():
+    """
+    Exporta o catálogo de receitas em NDJSON ou CSV.
+    A resposta é gerada aos poucos a partir de um cursor no banco, então o consumo
+    de memória não depende do tamanho da tabela.
+    ---
+    tags:
+      - Receitas
+    security:
+      - BearerAuth: []
+    parameters:
+      - in: query
+        name: format
+        schema:
+          type: string
+          enum: [ndjson, csv]
+          default: ndjson
+        required: false
+        description: Formato do arquivo exportado
+      - in: query
+        name: ingredient
+        schema:
+          type: string
+        required: false
+        description: Mesmo filtro de GET /recipes
+      - in: query
+        name: match
+        schema:
+          type: string
+          enum: [all, any]
+          default: all
+        required: false
+        description: Mesmo filtro de GET /recipes
+      - in: query
+        name: max_time
+        schema:
+          type: integer
+        required: false
+        description: Tempo máximo de preparo (minutos)
+      - in: query
+        name: fields
+        schema:
+          type: string
+        required: false
+        description: Campos a exportar, separados por vírgula
+    responses:
+      200:
+        description: Receitas exportadas, uma por linha
+        content:
+          application/x-ndjson:
+            schema:
+              type: string
+              example: '{"id": 1, "title": "Bolo de chocolate", "time_minutes": 45, "ingredients": ["chocolate"]}'
+          text/csv:
+            schema:
+              type: string
+              example: "id,title,time_minutes,ingredients"
+      400:
+        description: Formato ou filtro inválido
+    """
+    export_format = request.args.get('format', 'ndjson')
+    fields = parse_recipe_fields(request.args.get('fields'))
+
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({"message": "format deve ser 'ndjson' ou 'csv'"}), 400
+
+    if fields is None:
+        return jsonify({"message": f"fields aceita apenas: {', '.join(RECIPE_FIELDS)}"}), 400
+
+    query = filter_recipes(
+        select(*(getattr(ConfigSQLAlchemy.Recipe, field) for field in fields)),
+        request.args
+    )
+
+    if query is None:
+        return jsonify({"message": "match deve ser 'all' ou 'any'"}), 400
+
+    # yield_per busca as linhas em lotes (e ativa stream_results), sem carregar o resultado inteiro
+    query = query.order_by(ConfigSQLAlchemy.Recipe.id).execution_options(
+        yield_per=current_app.config['RECIPES_EXPORT_BATCH_SIZE']
+    )
+
+    def generate_ndjson():
+        for row in db.session.execute(query):
+            yield current_app.json.dumps(serialize_recipe(row, fields)) + '\n'
+
+    def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def flush():
+            value = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return value
+
+        writer.writerow(fields)
+        yield flush()
+
+        for row in db.session.execute(query):
+            recipe = serialize_recipe(row, fields)
+            if 'ingredients' in recipe:
+                recipe['ingredients'] = ','.join(recipe['ingredients'])
+            writer.writerow(recipe[field] for field in fields)
+            yield flush()
+
+    if export_format == 'csv':
+        return Response(stream_with_context(generate_csv()), mimetype='text/csv',
+                        headers={'Content-Disposition': 'attachment; filename=recipes.csv'})
+
+    return Response(stream_with_context(generate_ndjson()), mimetype='application/x-ndjson')
+
+@recipes_bp.route('/recipes/<int:recipe_id>', methods=['GET'])
+@jwt_required()
+@conditional_get(recipe_etag)
+def get_recipe(recipe_id):
+    """
+    Obtém uma receita pelo ID.
+    Envie o ETag recebido em If-None-Match para receber 304 quando a receita não mudou.
+    ---
+    tags:
+      - Receitas
+    security:
+      - BearerAuth: []
+    parameters:
+      - name: recipe_id
+        in: path
+        required: true
+        schema:
+          type: integer
+        description: ID da receita
+      - name: If-None-Match
+        in: header
+        required: false
+        schema:
+          type: string
+        description: ETag retornado anteriormente para esta receita
+    responses:
+      200:
+        description: Receita encontrada
+        headers:
+          ETag:
+            schema:
+              type: string
+            description: Versão da receita
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                id:
+                  type: integer
+                  example: 1
+                title:
+                  type: string
+                  example: "Bolo de chocolate"
+                time_minutes:
+                  type: integer
+                  example: 45
+                ingredients:
+                  type: array
+                  items:
+                    type: string
+                  example: ["chocolate", "farinha", "açúcar"]
+      304:
+        description: A receita não mudou desde o ETag informado
+      404:
+        description: Receita não encontrada
+    """
+    recipe = ConfigSQLAlchemy.Recipe.query.get_or_404(recipe_id)
+    return jsonify(serialize_recipe(recipe, list(RECIPE_FIELDS)))
+
+@recipes_bp.route('/recipes/<int:recipe_id>', methods=['PUT'])
 @jwt_required()
 def update_recipe(recipe_id):
     """
@@ -169,7 +782,12 @@ def update_recipe(recipe_id):
                 type: string
                 example: "Torta de maçã"
               ingredients:
-                type: string
+                oneOf:
+                  - type: string
+                  - type: array
+                    items:
+                      type: string
+                description: Separados por vírgula ou em lista; gravados em minúsculas, sem espaços extras e sem repetição
                 example: "maçã, farinha, açúcar"
               time_minutes:
                 type: integer
@@ -215,15 +833,18 @@ def update_recipe(recipe_id):
         
     if 'ingredients' in data:
         recipe.ingredients = data['ingredients']
+        sync_recipe_ingredients(recipe)
         
     if 'time_minutes' in data:
         recipe.time_minutes = data['time_minutes']
         
+    bump_table_version('recipe')
     db.session.commit()
+    response_cache.invalidate('recipes')
     
     return jsonify({"message": "Receita atualizada!"})
 
-@app.route('/recipes/<int:recipe_id>', methods=['DELETE'])
+@recipes_bp.route('/recipes/<int:recipe_id>', methods=['DELETE'])
 @jwt_required()
 def delete_recipe(recipe_id):
     """
@@ -275,10 +896,48 @@ def delete_recipe(recipe_id):
     recipe = ConfigSQLAlchemy.Recipe.query.get_or_404(recipe_id)
 
     db.session.delete(recipe)
+    bump_table_version('recipe')
     db.session.commit()
+    response_cache.invalidate('recipes')
 
     return jsonify({"message": "Receita removida!"}), 200
 
 
+@recipes_bp.route('/cache/stats', methods=['GET'])
+@jwt_required()
+def cache_stats():
+    """
+    Retorna os contadores do cache de respostas.
+    ---
+    tags:
+      - Cache
+    security:
+      - BearerAuth: []
+    responses:
+      200:
+        description: Contadores de hits e misses do cache
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                backend:
+                  type: string
+                  example: "SimpleCacheBackend"
+                hits:
+                  type: integer
+                  example: 120
+                misses:
+                  type: integer
+                  example: 3
+                hit_ratio:
+                  type: number
+                  example: 0.9756
+    """
+    return jsonify(response_cache.stats()), 200
+
+
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    from api.app_factory import create_app
+
+    create_app(blueprints=['auth', 'recipes']).run(debug=True)
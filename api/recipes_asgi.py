@@ -0,0 +1,306 @@
+import contextlib
+import functools
+import math
+import time
+
+from a2wsgi import WSGIMiddleware
+from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Mount, Route
+from werkzeug.datastructures import MultiDict
+from werkzeug.http import parse_etags, quote_etag
+
+from api.app_factory import create_app
+from api.recipes_api import recipes_cache_key, recipes_etag, recipes_page, recipes_page_query
+from infrastructure.cache.response_cache import SimpleCacheBackend
+from infrastructure.cache.response_cacheinit import response_cache
+from infrastructure.compression.compression import ASGICompressionMiddleware
+from infrastructure.database.async_engine import create_async_engine_for, create_async_session_factory
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+from infrastructure.database.ingredient_index import sync_recipe_ingredients
+from infrastructure.database.table_version import bump_table_version_async, get_table_version_async
+from infrastructure.metrics.metrics import finish_tracking, server_timing, track_request
+from infrastructure.metrics.metricsinit import metrics
+from infrastructure.security.passwords import hash_password, needs_rehash, verify_password
+from infrastructure.security.rate_limitinit import rate_limiter
+
+# Modo assíncrono (ASGI) da API de receitas.
+# GET/POST /recipes, /login e /register são atendidos por handlers async com o engine assíncrono
+# do SQLAlchemy (aiosqlite); o hash das senhas, que é lento de propósito, roda em um pool de threads
+# sem bloquear o event loop. As demais rotas são repassadas ao app Flask (WSGI) pelo adaptador
+# a2wsgi, então os dois modos compartilham modelos, configuração, JWT e cache.
+#
+#   uvicorn api.recipes_asgi:asgi_app --workers 4
+#   python -m api.recipes_asgi
+
+app = create_app()
+engine = create_async_engine_for(app, db)
+async_session = create_async_session_factory(engine)
+if app.config.get('METRICS_ENABLED', True):
+    metrics.instrument_engine(engine.sync_engine)
+
+
+class AppJSONResponse(JSONResponse):
+    """
+    JSONResponse gerado pelo provider JSON do app Flask (app.json), o mesmo das rotas WSGI.
+    """
+
+    def render(self, content):
+        dumps_bytes = getattr(app.json, 'dumps_bytes', None)
+        if dumps_bytes is not None:
+            return dumps_bytes(content)
+        return app.json.dumps(content).encode('utf-8')
+
+
+def flask_response(response):
+    """
+    Converte uma resposta do Flask em uma resposta do Starlette.
+    """
+    return Response(response.get_data(), status_code=response.status_code, headers=dict(response.headers))
+
+
+def instrumented(endpoint):
+    """
+    Registra a latência, as consultas e o Server-Timing dos handlers async, com os mesmos nomes
+    de endpoint do app Flask (as rotas repassadas ao Flask já são medidas por ele).
+    """
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(request):
+            if not app.config.get('METRICS_ENABLED', True):
+                return await handler(request)
+
+            started_at = time.perf_counter()
+            timings, token = track_request()
+            try:
+                response = await handler(request)
+            finally:
+                finish_tracking(token)
+
+            seconds = time.perf_counter() - started_at
+            metrics.observe_request(request.method, endpoint, response.status_code, seconds, timings)
+            if app.config.get('SERVER_TIMING_ENABLED', True):
+                response.headers['Server-Timing'] = server_timing(seconds, timings)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def jwt_required_async(handler):
+    """
+    Equivalente assíncrono de @jwt_required(): valida o token com o Flask-JWT-Extended (mesma chave,
+    mesmos callbacks e mesmas respostas de erro do app Flask) e guarda a identidade em request.state.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(request):
+        # A lista de tokens revogados pode consultar o SQLite (e esperar por lock): fora do event loop
+        identity, error = await run_in_threadpool(verify_jwt, request.headers.get('Authorization', ''))
+        if error is not None:
+            return error
+        request.state.jwt_identity = identity
+        return await handler(request)
+
+    return wrapper
+
+
+def verify_jwt(authorization):
+    """
+    Valida o cabeçalho Authorization em um contexto de requisição do Flask.
+
+    Returns:
+        tuple: (identidade, None) ou (None, resposta de erro do Flask-JWT-Extended).
+    """
+    with app.test_request_context(headers={'Authorization': authorization}):
+        try:
+            verify_jwt_in_request()
+            return get_jwt_identity(), None
+        except (JWTExtendedException, PyJWTError) as e:
+            return None, flask_response(app.make_response(app.handle_user_exception(e)))
+
+
+async def json_body(request):
+    """
+    Lê o corpo JSON da requisição. Um corpo malformado recebe 400, como no request.get_json() do Flask.
+
+    Returns:
+        tuple: (dados, None) ou (None, resposta 400).
+    """
+    try:
+        return await request.json(), None
+    except ValueError:  # json.JSONDecodeError ou UnicodeDecodeError
+        return None, AppJSONResponse({"message": "Invalid JSON body"}, status_code=400)
+
+
+async def cache_call(func, *args):
+    # O backend 'redis' do cache faz I/O de rede: fora do event loop. O 'simple' é só um dicionário em memória
+    if response_cache.backend is None or isinstance(response_cache.backend, SimpleCacheBackend):
+        return func(*args)
+    return await run_in_threadpool(func, *args)
+
+
+@instrumented('recipes.get_recipes')
+@jwt_required_async
+async def get_recipes(request):
+    # Mesmo comportamento da view Flask: ETag/304 (conditional_get) e cache de respostas, com as
+    # mesmas chaves, então as entradas do cache valem para os dois modos
+    args = MultiDict(request.query_params.multi_items())
+    with app.app_context():
+        query, limit, fields, error = recipes_page_query(args)
+        cache_query_key = recipes_cache_key(args)
+
+    if error:
+        return AppJSONResponse({"message": error}, status_code=400)
+
+    async with async_session() as session:
+        version = await get_table_version_async(session, 'recipe')
+        etag = recipes_etag(args, version)
+        headers = {'ETag': quote_etag(etag, weak=True)}
+        if parse_etags(request.headers.get('if-none-match')).contains_weak(etag):
+            return Response(status_code=304, headers=headers)
+
+        cache_key = None
+        if response_cache.backend is not None:
+            cache_key = await cache_call(response_cache.cache_key, 'recipes', request.url.path, cache_query_key, version)
+            cached_value = await cache_call(response_cache.lookup, cache_key)
+            if cached_value is not None:
+                body, status, mimetype = cached_value
+                return Response(body, status_code=status, media_type=mimetype, headers={**headers, 'X-Cache': 'HIT'})
+
+        recipes = (await session.execute(query)).all()
+
+    response = Response(recipes_page(recipes, limit, fields, app.json), media_type='application/json', headers=headers)
+    if cache_key is not None:
+        await cache_call(response_cache.store, cache_key, response.body, 200, 'application/json')
+        response.headers['X-Cache'] = 'MISS'
+    return response
+
+
+@instrumented('recipes.create_recipe')
+@jwt_required_async
+async def create_recipe(request):
+    data, error = await json_body(request)
+    if error is not None:
+        return error
+    new_recipe = ConfigSQLAlchemy.Recipe(
+        title=data['title'],
+        ingredients=data['ingredients'],
+        time_minutes=data['time_minutes']
+    )
+    sync_recipe_ingredients(new_recipe)
+
+    async with async_session() as session:
+        session.add(new_recipe)
+        await bump_table_version_async(session, 'recipe')
+        await session.commit()
+    response_cache.invalidate('recipes')
+
+    return AppJSONResponse({"msg": "Recipe created"}, status_code=201)
+
+
+async def rate_limited(request, name):
+    """
+    Aplica o limite `name` de RATE_LIMITS ao IP do cliente, como @rate_limiter.limit no app Flask.
+    Retorna a resposta 429 quando o limite foi excedido.
+    """
+    client_ip = request.client.host if request.client else 'unknown'
+    # O armazenamento compartilhado (SQLite) pode esperar por lock: fora do event loop
+    retry_after = await run_in_threadpool(rate_limiter.hit, name, client_ip, app.config)
+    if retry_after > 0:
+        return AppJSONResponse({"error": "Too many requests"}, status_code=429,
+                            headers={'Retry-After': str(max(math.ceil(retry_after), 1))})
+    return None
+
+
+@instrumented('auth.register_user')
+async def register_user(request):
+    if (response := await rate_limited(request, 'register')) is not None:
+        return response
+
+    data, error = await json_body(request)
+    if error is not None:
+        return error
+
+    async with async_session() as session:
+        if await session.scalar(select(ConfigSQLAlchemy.User.id).filter_by(username=data['username'])):
+            return AppJSONResponse({"message": "User already exists"}, status_code=400)
+
+        password = await run_in_threadpool(hash_password, data['password'], method=app.config['PASSWORD_HASH_METHOD'])
+        session.add(ConfigSQLAlchemy.User(username=data['username'], password=password))
+
+        try:
+            await session.commit()
+        except IntegrityError:
+            # Outro registro com o mesmo usuário foi gravado entre a consulta e o commit
+            return AppJSONResponse({"message": "User already exists"}, status_code=400)
+
+    return AppJSONResponse({"msg": "User created"}, status_code=201)
+
+
+@instrumented('auth.login')
+async def login(request):
+    if (response := await rate_limited(request, 'login')) is not None:
+        return response
+
+    data, error = await json_body(request)
+    if error is not None:
+        return error
+
+    async with async_session() as session:
+        user = await session.scalar(select(ConfigSQLAlchemy.User).filter_by(username=data['username']))
+
+        if user and await run_in_threadpool(verify_password, user.password, data['password']):
+            if needs_rehash(user.password, app.config['PASSWORD_HASH_METHOD']):
+                user.password = await run_in_threadpool(
+                    hash_password, data['password'], method=app.config['PASSWORD_HASH_METHOD']
+                )
+                await session.commit()
+
+            with app.app_context():
+                tokens = {
+                    "access_token": create_access_token(identity=str(user.id)),
+                    "refresh_token": create_refresh_token(identity=str(user.id)),
+                }
+            return AppJSONResponse(tokens, status_code=200)
+
+    return AppJSONResponse({"error": "Invalid credentials"}, status_code=401)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_):
+    yield
+    await engine.dispose()
+
+
+# Compressão dos handlers async; as rotas repassadas ao Flask são comprimidas por ele
+compression_middleware = (
+    [Middleware(ASGICompressionMiddleware, config=app.config)] if app.config.get('COMPRESSION_ENABLED', True) else []
+)
+
+asgi_app = Starlette(
+    routes=[
+        Route('/recipes', get_recipes, methods=['GET'], middleware=compression_middleware),
+        Route('/recipes', create_recipe, methods=['POST'], middleware=compression_middleware),
+        Route('/register', register_user, methods=['POST'], middleware=compression_middleware),
+        Route('/login', login, methods=['POST'], middleware=compression_middleware),
+        # Demais rotas (export, bulk, /recipes/<id>, itens, scraping, documentação...) continuam no app Flask
+        Mount('/', app=WSGIMiddleware(app)),
+    ],
+    lifespan=lifespan,
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(asgi_app, port=8000)
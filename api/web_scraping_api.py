@@ -1,18 +1,31 @@
-from flask import Flask, jsonify, request  # Importação dos componentes principais do Flask
+from flask import Blueprint, current_app, jsonify, request, url_for  # Importação dos componentes principais do Flask
 from infrastructure.security.auth.basicAuth import BasicAuthentication
-from flasgger import Swagger
-from bs4 import BeautifulSoup
-import requests
+from infrastructure.security.rate_limitinit import rate_limiter
+from usecases.scrape_jobsinit import scrape_jobs
+from usecases.title_scraper import ScrapeCapacityExceeded
+from usecases.title_scraperinit import title_scraper
 
-# Criando uma instância da classe Flask, que representa a aplicação web
-wsapi = Flask(__name__)
+# Blueprint de web scraping, registrado no app por create_app (api/app_factory.py)
+scraping_bp = Blueprint('scraping', __name__)
 
-wsapi.config['Swagger'] = {
-    'title': 'My Flask API',
-    'universion': 3
-}
 
-swagger = Swagger(wsapi)
+@scraping_bp.record_once
+def init_extensions(state):
+    # Scraper, fila e Basic Auth configurados a partir do app que registra o blueprint
+    BasicAuthentication.init_app(state.app)
+    title_scraper.init_app(state.app)
+    scrape_jobs.init_app(state.app)
+
+
+
+@scraping_bp.errorhandler(ScrapeCapacityExceeded)
+def scrape_capacity_exceeded(e):
+    # Limite global de buscas simultâneas atingido: o cliente tenta de novo mais tarde, em vez de esperar na fila
+    response = jsonify({"error": "Too many concurrent scrapes, try again later"})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(e.retry_after)
+    return response
+
 
 def get_title(url):
     """
@@ -26,15 +39,16 @@ def get_title(url):
         tuple: Em caso de erro, retorna um dicionário com a mensagem de erro e um código HTTP 500.
     """
     try:
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        title = soup.title.string.strip()
+        title = title_scraper.fetch_title(url)  # Com timeouts de conexão e leitura (SCRAPE_CONNECT_TIMEOUT / SCRAPE_READ_TIMEOUT)
         return {"title": title}  # Corrigido para retornar um dicionário JSON válido
+    except ScrapeCapacityExceeded:
+        raise  # Respondido com 503 pelo errorhandler do blueprint
     except Exception as e:
         return {"error": str(e)}, 500
 
-@wsapi.route('/scrape/title', methods=['GET'])
+@scraping_bp.route('/scrape/title', methods=['GET'])
 @BasicAuthentication.auth.login_required
+@rate_limiter.limit('scrape_title', key_func=BasicAuthentication.auth.current_user)
 def scrape_title():
     """
     Extrai o título de uma página web a partir da URL fornecida.
@@ -66,6 +80,26 @@ def scrape_title():
             error:
               type: string
               description: Mensagem informando que a URL é obrigatória.
+      429:
+        description: Limite de requisições do usuário excedido; tente novamente após o tempo do cabeçalho Retry-After.
+        headers:
+          Retry-After:
+            type: integer
+        schema:
+          type: object
+          properties:
+            error:
+              type: string
+      503:
+        description: Limite global de buscas simultâneas atingido; tente novamente após o tempo do cabeçalho Retry-After.
+        headers:
+          Retry-After:
+            type: integer
+        schema:
+          type: object
+          properties:
+            error:
+              type: string
     """
     url = request.args.get('url')
     if not url:
@@ -73,5 +107,228 @@ def scrape_title():
 
     return jsonify(get_title(url))  # Retorno corrigido
 
+def scrape_titles_cost():
+    # Cada URL do lote é uma busca: consome uma ficha do mesmo limite de /scrape/title
+    data = request.get_json(silent=True)
+    urls = data.get('urls') if isinstance(data, dict) else None
+    return len(urls) if isinstance(urls, list) else 1
+
+@scraping_bp.route('/scrape/titles', methods=['POST'])
+@BasicAuthentication.auth.login_required
+@rate_limiter.limit('scrape_title', key_func=BasicAuthentication.auth.current_user, cost_func=scrape_titles_cost)
+def scrape_titles():
+    """
+    Extrai o título de várias páginas web em paralelo.
+    As páginas são buscadas ao mesmo tempo (com limite de requisições simultâneas por host),
+    cada requisição tem timeout de conexão e leitura e o lote inteiro tem um prazo total.
+    ---
+    security:
+        - BasicAuth: []
+    tags:
+      - Web Scraping
+    parameters:
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          required:
+            - urls
+          properties:
+            urls:
+              type: array
+              items:
+                type: string
+              example: ["https://www.python.org", "https://flask.palletsprojects.com"]
+    responses:
+      200:
+        description: Resultado de cada URL, na mesma ordem do pedido.
+        schema:
+          type: object
+          properties:
+            results:
+              type: array
+              items:
+                type: object
+                properties:
+                  url:
+                    type: string
+                    description: A URL analisada.
+                  title:
+                    type: string
+                    description: O título da página (quando a extração foi concluída).
+                  error:
+                    type: string
+                    description: O motivo da falha (timeout, erro HTTP, prazo do lote excedido...).
+      400:
+        description: Lista de URLs ausente, inválida ou maior que o permitido.
+        schema:
+          type: object
+          properties:
+            error:
+              type: string
+              description: Mensagem de erro.
+      429:
+        description: Limite de requisições do usuário excedido (cada URL conta como uma busca de /scrape/title); tente novamente após o tempo do cabeçalho Retry-After.
+        headers:
+          Retry-After:
+            type: integer
+        schema:
+          type: object
+          properties:
+            error:
+              type: string
+    """
+    data = request.get_json(silent=True)
+    urls = data.get('urls') if isinstance(data, dict) else None
+
+    if not isinstance(urls, list) or not urls or not all(isinstance(url, str) and url for url in urls):
+        return jsonify({"error": "urls must be a non-empty list of strings"}), 400
+
+    if len(urls) > current_app.config['SCRAPE_MAX_URLS']:
+        return jsonify({"error": f"At most {current_app.config['SCRAPE_MAX_URLS']} urls per request"}), 400
+
+    if not all(url.startswith(('http://', 'https://')) for url in urls):
+        return jsonify({"error": "Only http and https urls are supported"}), 400
+
+    return jsonify({"results": title_scraper.fetch_titles(urls)})
+
+@scraping_bp.route('/scrape/jobs', methods=['POST'])
+@BasicAuthentication.auth.login_required
+@rate_limiter.limit('scrape_jobs', key_func=BasicAuthentication.auth.current_user)
+def create_scrape_job():
+    """
+    Agenda a extração do título de uma página em segundo plano.
+    Responde na hora com o id do job; o resultado é consultado em GET /scrape/jobs/<id>.
+    Se a mesma URL já tiver um job em andamento, o id dele é retornado.
+    ---
+    security:
+        - BasicAuth: []
+    tags:
+      - Web Scraping
+    parameters:
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          required:
+            - url
+          properties:
+            url:
+              type: string
+              example: "https://www.python.org"
+    responses:
+      202:
+        description: Job agendado (ou já em andamento para a mesma URL).
+        headers:
+          Location:
+            type: string
+            description: Endereço para consultar o job.
+        schema:
+          type: object
+          properties:
+            id:
+              type: string
+              description: Identificador do job.
+            url:
+              type: string
+            status:
+              type: string
+              enum: [queued, running, done, failed]
+            created_at:
+              type: string
+      400:
+        description: URL ausente ou inválida.
+        schema:
+          type: object
+          properties:
+            error:
+              type: string
+      429:
+        description: Limite de requisições do usuário excedido; tente novamente após o tempo do cabeçalho Retry-After.
+        headers:
+          Retry-After:
+            type: integer
+        schema:
+          type: object
+          properties:
+            error:
+              type: string
+    """
+    data = request.get_json(silent=True)
+    url = data.get('url') if isinstance(data, dict) else None
+
+    if not isinstance(url, str) or not url:
+        return jsonify({"error": "URL is required"}), 400
+
+    if not url.startswith(('http://', 'https://')):
+        return jsonify({"error": "Only http and https urls are supported"}), 400
+
+    job_id = scrape_jobs.enqueue(url)
+    scrape_jobs.start_workers(current_app._get_current_object())
+
+    response = jsonify(scrape_jobs.get(job_id))
+    response.status_code = 202
+    response.headers['Location'] = url_for('scraping.get_scrape_job', job_id=job_id)
+    return response
+
+@scraping_bp.route('/scrape/jobs/<job_id>', methods=['GET'])
+@BasicAuthentication.auth.login_required
+def get_scrape_job(job_id):
+    """
+    Consulta o estado de um job de extração de título.
+    ---
+    security:
+        - BasicAuth: []
+    tags:
+      - Web Scraping
+    parameters:
+      - name: job_id
+        in: path
+        type: string
+        required: true
+        description: Identificador retornado por POST /scrape/jobs.
+    responses:
+      200:
+        description: Estado do job; title quando concluído (done), error quando falhou (failed).
+        schema:
+          type: object
+          properties:
+            id:
+              type: string
+            url:
+              type: string
+            status:
+              type: string
+              enum: [queued, running, done, failed]
+            title:
+              type: string
+              description: O título da página (status done).
+            error:
+              type: string
+              description: O motivo da falha (status failed).
+            created_at:
+              type: string
+            finished_at:
+              type: string
+      404:
+        description: Job não encontrado (ou já removido após o prazo de retenção).
+        schema:
+          type: object
+          properties:
+            error:
+              type: string
+    """
+    # Também retoma, após um reinício do processo, os jobs que ficaram na fila
+    scrape_jobs.start_workers(current_app._get_current_object())
+
+    job = scrape_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job)
+
 if __name__ == '__main__':
-    wsapi.run(debug=True)
+    from api.app_factory import create_app
+
+    create_app(blueprints=['scraping']).run(debug=True)
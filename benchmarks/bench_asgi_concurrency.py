@@ -0,0 +1,142 @@
+# Compara o modo WSGI (app Flask com servidor multi-thread) com o modo ASGI (api/recipes_asgi.py no
+# uvicorn): para cada nível de concorrência mede vazão e latências, e no fim informa a maior
+# concorrência atendida com o p95 abaixo do limite (--latency-ms).
+# Usa o banco configurado (SQLALCHEMY_DATABASE_URI): cria um usuário de teste e algumas receitas se preciso.
+#
+#   python -m benchmarks.bench_asgi_concurrency --endpoint recipes --concurrency 1 8 32 64
+#   python -m benchmarks.bench_asgi_concurrency --endpoint login --latency-ms 500
+
+import argparse
+import logging
+import multiprocessing
+import socket
+import statistics
+import threading
+import time
+
+import requests
+
+USER = {'username': 'benchmark', 'password': 'benchmark'}
+# O ASGI roda primeiro porque é quem cria o usuário de teste (/register)
+MODES = ('asgi', 'wsgi')
+
+
+def serve(mode, port):
+    if mode == 'wsgi':
+        from werkzeug.serving import make_server
+        from api.app_factory import create_app
+
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
+        make_server('127.0.0.1', port, create_app(RATE_LIMIT_ENABLED=False), threaded=True).serve_forever()
+    else:
+        import uvicorn
+        from api.recipes_asgi import app, asgi_app
+
+        # O benchmark mede a vazão do servidor: o limite por IP de /login recusaria quase tudo
+        app.config['RATE_LIMIT_ENABLED'] = False
+
+        uvicorn.run(asgi_app, host='127.0.0.1', port=port, log_level='warning')
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(('127.0.0.1', port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError(f"Servidor não respondeu na porta {port}")
+
+
+def prepare(base_url, recipes):
+    requests.post(f'{base_url}/register', json=USER)
+    token = requests.post(f'{base_url}/login', json=USER).json()['access_token']
+    headers = {'Authorization': f'Bearer {token}'}
+
+    existing = len(requests.get(f'{base_url}/recipes?limit={recipes}', headers=headers).json()['recipes'])
+    for index in range(existing, recipes):
+        requests.post(f'{base_url}/recipes', headers=headers, json={
+            'title': f'Receita {index}', 'ingredients': 'farinha, ovos, leite', 'time_minutes': index % 120
+        })
+    return headers
+
+
+def run_level(base_url, endpoint, headers, concurrency, seconds):
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def target():
+        session = requests.Session()
+        local = []
+        failed = 0
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            if endpoint == 'recipes':
+                response = session.get(f'{base_url}/recipes?limit=50', headers=headers)
+            else:
+                response = session.post(f'{base_url}/login', json=USER)
+            local.append(time.perf_counter() - start)
+            failed += response.status_code >= 400
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    pool = [threading.Thread(target=target) for _ in range(concurrency)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        'rps': len(latencies) / seconds,
+        'p50': quantiles[49] * 1000,
+        'p95': quantiles[94] * 1000,
+        'errors': errors[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concorrência do modo ASGI comparada ao WSGI')
+    parser.add_argument('--endpoint', choices=('recipes', 'login'), default='recipes')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16, 32, 64])
+    parser.add_argument('--seconds', type=float, default=5, help='Duração de cada nível')
+    parser.add_argument('--latency-ms', type=float, default=100, help='Limite de p95')
+    parser.add_argument('--recipes', type=int, default=200, help='Receitas garantidas no banco')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    base_url = f'http://127.0.0.1:{args.port}'
+    headers = None
+    best = {}
+
+    for mode in MODES:
+        server = context.Process(target=serve, args=(mode, args.port), daemon=True)
+        server.start()
+        try:
+            wait_for_port(args.port)
+            if headers is None:
+                headers = prepare(base_url, args.recipes)
+
+            print(f"\n{mode.upper()} ({args.endpoint})")
+            print(f"{'concorrência':>12} {'req/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'erros':>7}")
+            for concurrency in args.concurrency:
+                result = run_level(base_url, args.endpoint, headers, concurrency, args.seconds)
+                print(f"{concurrency:>12} {result['rps']:>10.1f} {result['p50']:>10.1f} "
+                      f"{result['p95']:>10.1f} {result['errors']:>7}")
+                if result['p95'] <= args.latency_ms and not result['errors']:
+                    best[mode] = concurrency
+        finally:
+            server.terminate()
+            server.join()
+
+    print(f"\nMaior concorrência com p95 <= {args.latency_ms:g} ms:")
+    for mode in MODES:
+        print(f"  {mode}: {best.get(mode, 'nenhuma')}")
+
+
+if __name__ == '__main__':
+    main()
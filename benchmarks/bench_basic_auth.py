@@ -0,0 +1,47 @@
+# Benchmark do Basic Auth: requisições por segundo em GET /items com e sem o cache de credenciais.
+#
+#   python -m benchmarks.bench_basic_auth --requests 200
+
+import argparse
+import base64
+import time
+
+from api.app_factory import create_app
+from infrastructure.cache.ttl_cache import TTLCache
+from infrastructure.security.auth.basicAuth import BasicAuthentication
+
+
+def run(client, headers, total):
+    start = time.perf_counter()
+    for _ in range(total):
+        response = client.get('/items', headers=headers)
+        assert response.status_code == 200, response.status_code
+    elapsed = time.perf_counter() - start
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do cache de credenciais do Basic Auth')
+    parser.add_argument('--requests', type=int, default=200, help='Requisições por cenário')
+    args = parser.parse_args()
+
+    client = create_app(blueprints=['items']).test_client()
+    credentials = base64.b64encode(b'user1:password1').decode()
+    headers = {'Authorization': f'Basic {credentials}'}
+
+    original_cache = BasicAuthentication.credential_cache
+    try:
+        BasicAuthentication.credential_cache = None
+        without_cache = run(client, headers, args.requests)
+
+        BasicAuthentication.credential_cache = TTLCache(maxsize=1024, ttl=60)
+        with_cache = run(client, headers, args.requests)
+    finally:
+        BasicAuthentication.credential_cache = original_cache
+
+    print(f"Sem cache: {without_cache:10.1f} req/s")
+    print(f"Com cache: {with_cache:10.1f} req/s ({with_cache / without_cache:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
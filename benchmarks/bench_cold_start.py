@@ -0,0 +1,58 @@
+# Cold start do create_app: para cada combinação de blueprints, sobe um processo Python novo,
+# importa e cria o app, e mede o tempo, o pico de memória (RSS) e quais dependências pesadas
+# foram carregadas.
+#
+#   python -m benchmarks.bench_cold_start --runs 5
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ('bs4', 'requests', 'pandas', 'flasgger')
+
+SCENARIOS = {
+    'recipes': (['auth', 'recipes'], False),
+    'items': (['items'], False),
+    'scraping': (['scraping'], False),
+    'todos': (['auth', 'recipes', 'items', 'scraping'], False),
+    'todos + docs': (['auth', 'recipes', 'items', 'scraping'], True),
+}
+
+SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+from api.app_factory import create_app
+app = create_app(blueprints={blueprints!r}, SWAGGER_ENABLED={swagger!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'ms': elapsed * 1000,
+    'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'modules': [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure(blueprints, swagger):
+    script = SCRIPT.format(blueprints=blueprints, swagger=swagger, heavy=HEAVY_MODULES)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, ['.', os.environ.get('PYTHONPATH')])))
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True, env=env).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tempo de inicialização e memória do create_app')
+    parser.add_argument('--runs', type=int, default=5, help='Processos por cenário (mediana)')
+    args = parser.parse_args()
+
+    print(f"{'cenário':>14} {'ms':>8} {'RSS MB':>8}  dependências pesadas")
+    for name, (blueprints, swagger) in SCENARIOS.items():
+        results = [measure(blueprints, swagger) for _ in range(args.runs)]
+        print(f"{name:>14} {statistics.median(r['ms'] for r in results):>8.0f} "
+              f"{statistics.median(r['rss_mb'] for r in results):>8.1f}  {', '.join(results[0]['modules']) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
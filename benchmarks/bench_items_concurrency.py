@@ -0,0 +1,129 @@
+# Teste de carga do armazenamento de itens: várias threads (e, no SQLite, vários processos, como
+# workers do gunicorn) fazendo PUT/DELETE/GET ao mesmo tempo. No fim confere se cada item foi
+# removido no máximo uma vez e se a quantidade restante bate com as remoções bem-sucedidas.
+#
+#   python -m benchmarks.bench_items_concurrency --repository memory --threads 8
+#   python -m benchmarks.bench_items_concurrency --repository sqlite --processes 4 --threads 4
+
+import argparse
+import base64
+import multiprocessing
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import Counter
+
+from api.app_factory import create_app
+from infrastructure.repositories.items_repository import create_item_repository
+
+HEADERS = {'Authorization': 'Basic ' + base64.b64encode(b'user1:password1').decode()}
+
+app = create_app(blueprints=['items'])
+
+
+def use_repository(kind, path):
+    app.extensions['items_repository'] = create_item_repository(kind, path)
+
+
+def worker(item_ids, operations, seed):
+    client = app.test_client()
+    rng = random.Random(seed)
+    deleted = Counter()
+    status = Counter()
+
+    for _ in range(operations):
+        item_id = rng.choice(item_ids)
+        operation = rng.choice(('put', 'put', 'get', 'delete'))
+
+        if operation == 'put':
+            response = client.put(f'/items/{item_id}', json={'valor': rng.random()}, headers=HEADERS)
+        elif operation == 'get':
+            response = client.get('/items', headers=HEADERS)
+        else:
+            response = client.delete(f'/items/{item_id}', headers=HEADERS)
+            if response.status_code == 200:
+                deleted[item_id] += 1
+
+        status[(operation, response.status_code)] += 1
+
+    return deleted, status
+
+
+def run_threads(item_ids, threads, operations, seed):
+    results = []
+    lock = threading.Lock()
+
+    def target(index):
+        result = worker(item_ids, operations, seed + index)
+        with lock:
+            results.append(result)
+
+    pool = [threading.Thread(target=target, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return results
+
+
+def run_process(args):
+    kind, path, item_ids, threads, operations, seed = args
+    use_repository(kind, path)
+    return run_threads(item_ids, threads, operations, seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Teste de carga concorrente de /items')
+    parser.add_argument('--repository', choices=('memory', 'sqlite'), default='memory')
+    parser.add_argument('--items', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--processes', type=int, default=1, help='Apenas com --repository sqlite')
+    parser.add_argument('--operations', type=int, default=200, help='Operações por thread')
+    args = parser.parse_args()
+
+    if args.repository == 'memory' and args.processes > 1:
+        parser.error('O repositório em memória não é compartilhado entre processos')
+
+    path = os.path.join(tempfile.mkdtemp(), 'items.db') if args.repository == 'sqlite' else None
+    use_repository(args.repository, path)
+
+    client = app.test_client()
+    item_ids = [
+        client.post('/items', json={'nome': f'item {index}'}, headers=HEADERS).get_json()['id']
+        for index in range(args.items)
+    ]
+
+    start = time.perf_counter()
+    if args.processes > 1:
+        jobs = [(args.repository, path, item_ids, args.threads, args.operations, index * 1000)
+                for index in range(args.processes)]
+        with multiprocessing.get_context('spawn').Pool(args.processes) as pool:
+            results = [result for process_results in pool.map(run_process, jobs) for result in process_results]
+    else:
+        results = run_threads(item_ids, args.threads, args.operations, seed=0)
+    elapsed = time.perf_counter() - start
+
+    deleted = sum((result[0] for result in results), Counter())
+    status = sum((result[1] for result in results), Counter())
+    remaining = []
+    cursor = 0
+    while cursor is not None:
+        page = client.get(f'/items?limit=1000&cursor={cursor}', headers=HEADERS).get_json()
+        remaining.extend(page['items'])
+        cursor = page['next_cursor']
+    total_operations = sum(status.values())
+
+    print(f"{total_operations} operações em {elapsed:.2f}s ({total_operations / elapsed:.1f} op/s)")
+    for (operation, code), count in sorted(status.items()):
+        print(f"  {operation:6} {code}: {count}")
+
+    assert all(count == 1 for count in deleted.values()), "Item removido mais de uma vez"
+    assert len(remaining) == args.items - len(deleted), "Quantidade restante não bate com as remoções"
+    assert len({item['id'] for item in remaining}) == len(remaining), "IDs duplicados"
+    print("Consistência verificada: cada item foi removido no máximo uma vez e nenhum ID se repetiu.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# Benchmark da serialização de listas grandes: GET /recipes com 10 mil receitas em uma resposta,
+# com cada provider JSON disponível (JSON_PROVIDER), e o caminho antigo (objetos do ORM + dicionários
+# intermediários + json da biblioteca padrão) como referência. Mede ms por resposta e o tamanho do corpo.
+#
+#   python -m benchmarks.bench_json_provider --rows 10000 --requests 20
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert, select
+
+from api.app_factory import create_app
+from api.recipes_api import RECIPE_FIELDS, serialize_recipe
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+from infrastructure.database.migrations import upgrade
+from infrastructure.json_provider import available_providers
+
+INGREDIENTS = ['farinha', 'ovos', 'leite', 'açúcar', 'manteiga', 'sal', 'fermento', 'chocolate', 'água']
+
+
+def make_app(path, rows, provider):
+    return create_app(
+        blueprints=['recipes'], SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}', JSON_PROVIDER=provider,
+        RECIPES_MAX_PAGE_SIZE=rows, SWAGGER_ENABLED=False, CACHE_TYPE='null', RATE_LIMIT_ENABLED=False,
+        METRICS_ENABLED=False
+    )
+
+
+def seed(app, rows):
+    rng = random.Random(42)
+    with app.app_context():
+        upgrade()
+        db.session.execute(insert(ConfigSQLAlchemy.Recipe), [
+            {'id': i, 'title': f'Receita {i}', 'time_minutes': rng.randint(5, 180),
+             'ingredients': rng.sample(INGREDIENTS, rng.randint(2, 6))}
+            for i in range(1, rows + 1)
+        ])
+        db.session.commit()
+
+
+def median_ms(func, requests):
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        size = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), size
+
+
+def orm_reference(app, rows, requests):
+    """
+    Caminho anterior: entidades do ORM, um dicionário por receita e json.dumps, sem HTTP.
+    """
+    fields = list(RECIPE_FIELDS)
+
+    def run():
+        with app.app_context():
+            recipes = db.session.scalars(select(ConfigSQLAlchemy.Recipe).limit(rows)).all()
+            body = app.json.dumps({'recipes': [serialize_recipe(r, fields) for r in recipes], 'next_cursor': None})
+            db.session.remove()
+        return len(body.encode())
+
+    return median_ms(run, requests)
+
+
+def endpoint(app, rows, requests):
+    client = app.test_client()
+    with app.app_context():
+        headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+
+    def run():
+        response = client.get(f'/recipes?limit={rows}', headers=headers)
+        assert response.status_code == 200, response.status_code
+        return len(response.get_data())
+
+    return median_ms(run, requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tempo de GET /recipes com listas grandes por provider JSON')
+    parser.add_argument('--rows', type=int, default=10000, help='Receitas na resposta')
+    parser.add_argument('--requests', type=int, default=20, help='Respostas por cenário (mediana)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'recipes.db')
+        seed(make_app(path, args.rows, 'stdlib'), args.rows)
+
+        print(f"{'cenário':>24} {'ms/resposta':>12} {'KB':>8}")
+        ms, size = orm_reference(make_app(path, args.rows, 'stdlib'), args.rows, args.requests)
+        print(f"{'ORM + dicts (anterior)':>24} {ms:>12.1f} {size / 1024:>8.0f}")
+
+        for provider in reversed(available_providers()):
+            ms, size = endpoint(make_app(path, args.rows, provider), args.rows, args.requests)
+            print(f"{'GET /recipes, ' + provider:>24} {ms:>12.1f} {size / 1024:>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
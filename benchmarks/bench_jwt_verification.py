@@ -0,0 +1,56 @@
+# Benchmark da verificação de JWT: custo por requisição (verify_jwt_in_request, em µs) e
+# requisições por segundo em GET /protected, com e sem o cache de tokens já verificados.
+#
+#   python -m benchmarks.bench_jwt_verification --iterations 20000 --requests 2000
+
+import argparse
+import time
+
+from flask_jwt_extended import create_access_token, verify_jwt_in_request
+
+from api.app_factory import create_app
+
+SCENARIOS = {
+    'sem cache': 0,
+    'com cache': 1024,
+}
+
+
+def verification_cost(app, headers, iterations):
+    with app.test_request_context('/protected', headers=headers):
+        verify_jwt_in_request()  # aquece o cache
+        start = time.perf_counter()
+        for _ in range(iterations):
+            verify_jwt_in_request()
+        elapsed = time.perf_counter() - start
+    return elapsed / iterations * 1_000_000
+
+
+def requests_per_second(app, headers, total):
+    client = app.test_client()
+    start = time.perf_counter()
+    for _ in range(total):
+        response = client.get('/protected', headers=headers)
+        assert response.status_code == 200, response.status_code
+    return total / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Custo da verificação de JWT com e sem cache')
+    parser.add_argument('--iterations', type=int, default=20000, help='Verificações diretas por cenário')
+    parser.add_argument('--requests', type=int, default=2000, help='Requisições a GET /protected por cenário')
+    args = parser.parse_args()
+
+    print(f"{'cenário':>10} {'µs/verificação':>15} {'req/s':>10}")
+    for name, cache_size in SCENARIOS.items():
+        app = create_app(blueprints=['auth'], SWAGGER_ENABLED=False, JWT_VERIFIED_CACHE_SIZE=cache_size)
+        with app.app_context():
+            headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+
+        cost = verification_cost(app, headers, args.iterations)
+        rps = requests_per_second(app, headers, args.requests)
+        print(f"{name:>10} {cost:>15.1f} {rps:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+# Benchmark do perfil SQLite de produção: vazão de leitura/escrita com vários processos (como workers
+# do gunicorn) e threads acessando o mesmo arquivo, com e sem os PRAGMAs e o pool do perfil.
+#
+#   python -m benchmarks.bench_sqlite_profile --workers 4 --threads 4 --seconds 5
+
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+import infrastructure.config_app_production as production
+from infrastructure.database.sqlite_tuning import apply_sqlite_pragmas
+
+PROFILES = {
+    'padrão': ({}, {}),
+    'produção': (production.SQLITE_PRAGMAS, production.SQLALCHEMY_ENGINE_OPTIONS),
+}
+
+
+def build_engine(path, profile):
+    pragmas, engine_options = PROFILES[profile]
+    engine = create_engine(f'sqlite:///{path}', **engine_options)
+    apply_sqlite_pragmas(engine, pragmas)
+    return engine
+
+
+def run_worker(args):
+    path, profile, threads, seconds, write_ratio, seed = args
+    engine = build_engine(path, profile)
+    counters = {'reads': 0, 'writes': 0, 'locked': 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def target(index):
+        rng = random.Random(seed + index)
+        local = {'reads': 0, 'writes': 0, 'locked': 0}
+        while time.monotonic() < deadline:
+            try:
+                with engine.begin() as connection:
+                    if rng.random() < write_ratio:
+                        connection.execute(
+                            text("INSERT INTO recipe (title, ingredients, time_minutes) VALUES (:t, :i, :m)"),
+                            {'t': 'Receita', 'i': 'farinha, ovos', 'm': rng.randint(5, 120)}
+                        )
+                        local['writes'] += 1
+                    else:
+                        connection.execute(
+                            text("SELECT id, title FROM recipe WHERE time_minutes <= :m ORDER BY id DESC LIMIT 20"),
+                            {'m': rng.randint(5, 120)}
+                        ).all()
+                        local['reads'] += 1
+            except OperationalError:
+                local['locked'] += 1
+
+        with lock:
+            for key, value in local.items():
+                counters[key] += value
+
+    pool = [threading.Thread(target=target, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+    engine.dispose()
+    return counters
+
+
+def run_profile(profile, workers, threads, seconds, write_ratio):
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    engine = build_engine(path, profile)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE recipe (id INTEGER PRIMARY KEY, title VARCHAR(100) NOT NULL, "
+            "ingredients TEXT NOT NULL, time_minutes INTEGER NOT NULL)"
+        ))
+        connection.execute(text("CREATE INDEX ix_recipe_time ON recipe (time_minutes)"))
+    engine.dispose()
+
+    jobs = [(path, profile, threads, seconds, write_ratio, index * 100) for index in range(workers)]
+    with multiprocessing.get_context('spawn').Pool(workers) as pool:
+        results = pool.map(run_worker, jobs)
+
+    return {key: sum(result[key] for result in results) for key in ('reads', 'writes', 'locked')}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do perfil SQLite de produção')
+    parser.add_argument('--workers', type=int, default=4, help='Processos')
+    parser.add_argument('--threads', type=int, default=4, help='Threads por processo')
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(f"{'perfil':>10} {'leituras/s':>12} {'escritas/s':>12} {'locked':>8}")
+    for profile in PROFILES:
+        result = run_profile(profile, args.workers, args.threads, args.seconds, args.write_ratio)
+        print(f"{profile:>10} {result['reads'] / args.seconds:>12.1f} "
+              f"{result['writes'] / args.seconds:>12.1f} {result['locked']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# Benchmark da extração de título: leitura em partes (streaming) x análise completa com BeautifulSoup,
+# em páginas grandes geradas localmente (sem acesso à rede).
+#
+#   python -m benchmarks.bench_title_extraction --sizes 100000 1000000 5000000
+
+import argparse
+import time
+
+from usecases.title_extractor import extract_title_full, extract_title_streaming
+
+CHUNK_SIZE = 16 * 1024
+
+
+def build_page(size):
+    head = '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Página de teste</title></head><body>'
+    paragraph = '<div class="item"><p>Lorem ipsum dolor sit amet, <a href="#">consectetur</a> adipiscing.</p></div>\n'
+    body = paragraph * (max(size - len(head), 0) // len(paragraph) + 1)
+    return (head + body + '</body></html>').encode()
+
+
+def chunks(content):
+    for start in range(0, len(content), CHUNK_SIZE):
+        yield content[start:start + CHUNK_SIZE]
+
+
+def measure(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da extração de título')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000, 5_000_000],
+                        help='Tamanhos das páginas, em bytes')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'bytes':>10} {'streaming (ms)':>15} {'lidos':>8} {'completa (ms)':>14}")
+    for size in args.sizes:
+        page = build_page(size)
+
+        streaming_ms, (title, read) = measure(
+            lambda: extract_title_streaming(chunks(page), max_bytes=512 * 1024), args.repeat
+        )
+        full_ms, full_title = measure(lambda: extract_title_full(page), args.repeat)
+        assert title == full_title, (title, full_title)
+
+        print(f"{len(page):>10} {streaming_ms:>15.3f} {len(read):>8} {full_ms:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
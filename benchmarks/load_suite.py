@@ -0,0 +1,358 @@
+# Suíte de carga de todas as APIs: popula um SQLite com N receitas (10k, 100k, 1M...), sobe o app
+# (create_app) em um processo separado e mede cada cenário com concorrência fixa: vazão, p50/p95/p99
+# e erros. O scraping busca páginas de um servidor local (stub), sem acessar a internet.
+# O resultado é gravado em JSON; --compare mostra a diferença para uma execução anterior e termina
+# com erro se algum cenário piorou além de --threshold.
+#
+#   python -m benchmarks.load_suite --recipes 10000 100000 --output bench-antes.json
+#   python -m benchmarks.load_suite --recipes 10000 100000 --output bench-depois.json --compare bench-antes.json
+#
+# Os bancos populados ficam em --data-dir e são reaproveitados nas próximas execuções (--reseed recria).
+
+import argparse
+import base64
+import json
+import multiprocessing
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+USER = {'username': 'benchmark', 'password': 'benchmark'}
+BASIC_AUTH = {'Authorization': 'Basic ' + base64.b64encode(b'user1:password1').decode()}
+INGREDIENTS = ('farinha', 'ovos', 'leite', 'açúcar', 'manteiga', 'sal', 'fermento', 'chocolate',
+               'tomate', 'cebola', 'alho', 'azeite', 'arroz', 'feijão', 'frango', 'queijo')
+SEED = 42
+SEED_BATCH_SIZE = 10000
+
+# O app de benchmark mede o caminho completo de cada requisição: sem limite por IP (todas as
+# requisições vêm do mesmo cliente), sem o cache de respostas (que esconderia o custo do banco)
+# e sem o log de consultas lentas (que misturaria avisos à saída)
+APP_OVERRIDES = {
+    'RATE_LIMIT_ENABLED': False,
+    'CACHE_TYPE': 'null',
+    'SLOW_QUERY_SECONDS': None,
+    'SWAGGER_ENABLED': False,
+    'READ_YOUR_WRITES_SECONDS': 0,
+}
+
+
+def database_path(data_dir, recipes):
+    return os.path.abspath(os.path.join(data_dir, f'recipes_{recipes}.db'))
+
+
+def seed_database(config, path, recipes, reseed=False):
+    """
+    Cria o banco com `recipes` receitas (sempre as mesmas, pela semente fixa) e o usuário de teste.
+    """
+    from sqlalchemy import func, insert, select
+
+    from api.app_factory import create_app
+    from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+    from infrastructure.database.ingredient_index import ingredient_index_rows
+    from infrastructure.database.migrations import upgrade
+    from infrastructure.security.passwords import hash_password
+
+    if reseed and os.path.exists(path):
+        os.remove(path)
+
+    app = create_app(config, blueprints=['auth'], SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}', **APP_OVERRIDES)
+    with app.app_context():
+        upgrade()
+        existing = db.session.scalar(select(func.count()).select_from(ConfigSQLAlchemy.Recipe))
+        if existing == recipes:
+            return
+        if existing:
+            raise SystemExit(f"{path} tem {existing} receitas; use --reseed para recriá-lo")
+
+        rng = random.Random(SEED)
+        started_at = time.perf_counter()
+        for first_id in range(1, recipes + 1, SEED_BATCH_SIZE):
+            rows, index_rows = [], []
+            for recipe_id in range(first_id, min(first_id + SEED_BATCH_SIZE, recipes + 1)):
+                ingredients = rng.sample(INGREDIENTS, rng.randint(2, 6))
+                rows.append({'id': recipe_id, 'title': f'Receita {recipe_id}', 'ingredients': ingredients,
+                             'time_minutes': rng.randint(5, 180)})
+                index_rows.extend(ingredient_index_rows(recipe_id, ingredients))
+            db.session.execute(insert(ConfigSQLAlchemy.Recipe), rows)
+            db.session.execute(insert(ConfigSQLAlchemy.RecipeIngredient), index_rows)
+            db.session.commit()
+            print(f"\r  populando {path}: {min(first_id + SEED_BATCH_SIZE - 1, recipes)}/{recipes}", end='')
+
+        db.session.add(ConfigSQLAlchemy.User(
+            username=USER['username'],
+            password=hash_password(USER['password'], method=app.config['PASSWORD_HASH_METHOD'])
+        ))
+        db.session.commit()
+        print(f" ({time.perf_counter() - started_at:.0f} s)")
+
+
+def serve(config, path, port):
+    import logging
+
+    from werkzeug.serving import make_server
+
+    from api.app_factory import create_app
+
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    app = create_app(config, SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}', **APP_OVERRIDES)
+    make_server('127.0.0.1', port, app, threaded=True).serve_forever()
+
+
+class StubPageHandler(BaseHTTPRequestHandler):
+    # Página mínima com título; no-store para que o cache HTTP do scraper não evite as buscas
+    delay = 0.0
+    body = b'<html><head><title>Receita do dia</title></head><body>' + b'x' * 4096 + b'</body></html>'
+
+    def do_GET(self):
+        if self.delay:
+            time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(port, delay_ms):
+    StubPageHandler.delay = delay_ms / 1000
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubPageHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def wait_for_port(port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(('127.0.0.1', port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError(f"Servidor não respondeu na porta {port}")
+
+
+def build_scenarios(base_url, stub_url, recipes, token):
+    """
+    Cada cenário recebe (session, rng) e faz uma requisição, retornando a resposta.
+    """
+    jwt_headers = {'Authorization': f'Bearer {token}'}
+
+    def recipes_page(session, rng):
+        cursor = rng.randint(0, max(recipes - 50, 0))
+        return session.get(f'{base_url}/recipes?limit=50&cursor={cursor}', headers=jwt_headers)
+
+    def recipes_search(session, rng):
+        ingredients = ','.join(rng.sample(INGREDIENTS, 2))
+        return session.get(f'{base_url}/recipes?ingredient={ingredients}&limit=50', headers=jwt_headers)
+
+    def recipe_by_id(session, rng):
+        return session.get(f'{base_url}/recipes/{rng.randint(1, recipes)}', headers=jwt_headers)
+
+    def protected(session, rng):
+        return session.get(f'{base_url}/protected', headers=jwt_headers)
+
+    def login(session, rng):
+        return session.post(f'{base_url}/login', json=USER)
+
+    def items(session, rng):
+        if rng.random() < 0.2:
+            return session.post(f'{base_url}/items', json={'nome': 'item', 'valor': rng.random()}, headers=BASIC_AUTH)
+        return session.get(f'{base_url}/items?limit=50', headers=BASIC_AUTH)
+
+    def scrape_title(session, rng):
+        return session.get(f'{base_url}/scrape/title?url={stub_url}/{rng.randint(1, 10 ** 6)}', headers=BASIC_AUTH)
+
+    def scrape_titles(session, rng):
+        urls = [f'{stub_url}/{rng.randint(1, 10 ** 6)}' for _ in range(5)]
+        return session.post(f'{base_url}/scrape/titles', json={'urls': urls}, headers=BASIC_AUTH)
+
+    return {
+        'recipes_page': recipes_page,
+        'recipes_search': recipes_search,
+        'recipe_by_id': recipe_by_id,
+        'auth_protected': protected,
+        'auth_login': login,
+        'items': items,
+        'scrape_title': scrape_title,
+        'scrape_titles': scrape_titles,
+    }
+
+
+def run_scenario(request, concurrency, seconds, warmup):
+    latencies = []
+    status = {}
+    lock = threading.Lock()
+    measure_from = time.monotonic() + warmup
+    deadline = measure_from + seconds
+
+    def target(index):
+        session = requests.Session()
+        rng = random.Random(SEED + index)
+        local = []
+        local_status = {}
+        while True:
+            start = time.perf_counter()
+            try:
+                code = request(session, rng).status_code
+            except requests.RequestException:
+                code = 'erro de conexão'
+            elapsed = time.perf_counter() - start
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            if now >= measure_from:
+                local.append(elapsed)
+                local_status[code] = local_status.get(code, 0) + 1
+        with lock:
+            latencies.extend(local)
+            for code, count in local_status.items():
+                status[str(code)] = status.get(str(code), 0) + count
+
+    pool = [threading.Thread(target=target, args=(index,)) for index in range(concurrency)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99 or [0.0] * 99
+    return {
+        'requests': len(latencies),
+        'rps': round(len(latencies) / seconds, 2),
+        'p50_ms': round(quantiles[49] * 1000, 2),
+        'p95_ms': round(quantiles[94] * 1000, 2),
+        'p99_ms': round(quantiles[98] * 1000, 2),
+        'errors': sum(count for code, count in status.items() if not code.isdigit() or int(code) >= 400),
+        'status': status,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline, threshold):
+    """
+    Mostra a variação de cada cenário em relação à execução anterior.
+
+    Returns:
+        list: Cenários que pioraram mais que `threshold` (em %) em vazão ou p95.
+    """
+    regressions = []
+    print(f"\nComparação com {baseline['meta'].get('revision') or 'execução anterior'} "
+          f"({baseline['meta'].get('date')}):")
+    print(f"{'receitas':>9} {'cenário':>15} {'req/s':>18} {'p95 ms':>20}")
+    for size, scenarios in current['results'].items():
+        for name, result in scenarios.items():
+            before = baseline['results'].get(size, {}).get(name)
+            if not before or not before['rps'] or not before['p95_ms']:
+                continue
+
+            rps_change = (result['rps'] - before['rps']) / before['rps'] * 100
+            p95_change = (result['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100
+            worse = rps_change < -threshold or p95_change > threshold
+            print(f"{size:>9} {name:>15} {before['rps']:>8.1f} {rps_change:>+8.1f}% "
+                  f"{before['p95_ms']:>10.1f} {p95_change:>+8.1f}%{'  <- piorou' if worse else ''}")
+            if worse:
+                regressions.append(f'{size}/{name}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Suíte de carga de todas as APIs, com resultado em JSON')
+    parser.add_argument('--recipes', type=int, nargs='+', default=[10000],
+                        help='Tamanhos do banco (ex.: 10000 100000 1000000)')
+    parser.add_argument('--scenarios', nargs='+', help='Cenários a executar (padrão: todos)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Clientes simultâneos')
+    parser.add_argument('--seconds', type=float, default=10, help='Duração de cada cenário')
+    parser.add_argument('--warmup', type=float, default=2, help='Aquecimento antes da medição, em segundos')
+    parser.add_argument('--config', help='Módulo de configuração (padrão: o de APP_CONFIG)')
+    parser.add_argument('--data-dir', default='.bench', help='Pasta dos bancos populados')
+    parser.add_argument('--reseed', action='store_true', help='Recria os bancos populados')
+    parser.add_argument('--stub-delay-ms', type=float, default=20, help='Latência simulada do site do scraping')
+    parser.add_argument('--port', type=int, default=8770)
+    parser.add_argument('--stub-port', type=int, default=8771)
+    parser.add_argument('--output', default='bench-results.json', help='Arquivo JSON do resultado')
+    parser.add_argument('--compare', help='JSON de uma execução anterior, para comparação')
+    parser.add_argument('--threshold', type=float, default=10, help='Piora tolerada na comparação, em %%')
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    context = multiprocessing.get_context('spawn')
+    base_url = f'http://127.0.0.1:{args.port}'
+    stub = start_stub(args.stub_port, args.stub_delay_ms)
+    stub_url = f'http://127.0.0.1:{args.stub_port}'
+
+    report = {
+        'meta': {
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'config': args.config or os.environ.get('APP_CONFIG', 'infrastructure.config_app_local'),
+            'concurrency': args.concurrency,
+            'seconds': args.seconds,
+            'stub_delay_ms': args.stub_delay_ms,
+        },
+        'results': {},
+    }
+
+    try:
+        for recipes in args.recipes:
+            path = database_path(args.data_dir, recipes)
+            seed_database(args.config, path, recipes, reseed=args.reseed)
+
+            server = context.Process(target=serve, args=(args.config, path, args.port), daemon=True)
+            server.start()
+            try:
+                wait_for_port(args.port)
+                token = requests.post(f'{base_url}/login', json=USER).json()['access_token']
+                scenarios = build_scenarios(base_url, stub_url, recipes, token)
+
+                print(f"\n{recipes} receitas, concorrência {args.concurrency}")
+                print(f"{'cenário':>15} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'erros':>7}")
+                results = report['results'][str(recipes)] = {}
+                for name in args.scenarios or scenarios:
+                    result = run_scenario(scenarios[name], args.concurrency, args.seconds, args.warmup)
+                    results[name] = result
+                    print(f"{name:>15} {result['rps']:>9.1f} {result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} "
+                          f"{result['p99_ms']:>9.1f} {result['errors']:>7}")
+            finally:
+                server.terminate()
+                server.join()
+    finally:
+        stub.shutdown()
+
+    with open(args.output, 'w', encoding='utf-8') as output:
+        json.dump(report, output, indent=2, sort_keys=True)
+        output.write('\n')
+    print(f"\nResultado gravado em {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            regressions = compare(report, json.load(baseline_file), args.threshold)
+        if regressions:
+            print(f"Pioraram mais de {args.threshold:g}%: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+import hashlib
+from functools import wraps
+
+from flask import make_response, request
+
+# GET condicional (If-None-Match / ETag).
+# O ETag é calculado antes da view; se o cliente já tiver a mesma versão, a resposta 304 é
+# devolvida sem executar a consulta principal nem serializar nada.
+
+
+def weak_etag(*parts):
+    """
+    Monta o valor de um ETag a partir das partes informadas (versão, filtros...).
+
+    Returns:
+        str: Hash curto das partes, usado como ETag fraco.
+    """
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+
+
+def conditional_get(etag_func):
+    """
+    Decorador para views GET que responde 304 quando If-None-Match corresponde ao ETag atual.
+
+    Args:
+        etag_func (callable): Recebe os mesmos argumentos da view e retorna o ETag
+            (ou None quando o recurso não existe, deixando a view tratar o 404).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = etag_func(*args, **kwargs)
+
+            if etag is not None and request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+                response.set_etag(etag, weak=True)
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            if etag is not None and response.status_code == 200:
+                response.set_etag(etag, weak=True)
+            return response
+
+        return wrapper
+
+    return decorator
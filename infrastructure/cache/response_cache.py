@@ -0,0 +1,213 @@
+import threading
+from functools import wraps
+
+from flask import make_response, request
+
+from infrastructure.cache.ttl_cache import TTLCache
+
+# Cache de respostas dos endpoints de leitura.
+# Cada namespace (ex.: 'recipes') tem um contador de geração que faz parte da chave; os endpoints
+# de escrita chamam invalidate(namespace), que incrementa o contador e torna as entradas antigas
+# inacessíveis sem precisar apagá-las (elas saem pelo TTL ou pelo descarte LRU).
+#
+# Configurações lidas do app (mesmos nomes usados pelo Flask-Caching):
+#   CACHE_TYPE: 'simple' (em memória, por processo), 'redis' ou 'null' (desligado)
+#   CACHE_DEFAULT_TIMEOUT: TTL das respostas, em segundos
+#   CACHE_THRESHOLD: quantidade máxima de respostas no backend 'simple'
+#   CACHE_REDIS_URL / CACHE_KEY_PREFIX: conexão e prefixo das chaves no backend 'redis'
+
+
+class SimpleCacheBackend:
+    """
+    Backend em memória do processo, com TTL e descarte LRU.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set(self, key, value):
+        self._entries.set(key, value)
+
+    def generation(self, namespace):
+        return self._generations.get(namespace, 0)
+
+    def bump_generation(self, namespace):
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def clear(self):
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """
+    Backend compartilhado entre processos, usando Redis.
+    O descarte LRU fica a cargo do próprio Redis (maxmemory-policy allkeys-lru).
+
+    Args:
+        client: Cliente com a interface do redis-py (get, set, incr, delete).
+        ttl (int): Tempo de vida das respostas, em segundos.
+        prefix (str): Prefixo de todas as chaves.
+    """
+
+    def __init__(self, client, ttl, prefix='flask_cache_'):
+        self._client = client
+        self._ttl = ttl
+        self._prefix = prefix
+
+    def get(self, key):
+        data = self._client.get(self._prefix + key)
+        if data is None:
+            return None
+
+        header, body = data.split(b'\n', 1)
+        status, mimetype = header.decode().split(' ', 1)
+        return body, int(status), mimetype
+
+    def set(self, key, value):
+        body, status, mimetype = value
+        self._client.set(self._prefix + key, f'{status} {mimetype}\n'.encode() + body, ex=self._ttl)
+
+    def generation(self, namespace):
+        return int(self._client.get(f'{self._prefix}generation:{namespace}') or 0)
+
+    def bump_generation(self, namespace):
+        self._client.incr(f'{self._prefix}generation:{namespace}')
+
+    def clear(self):
+        pass
+
+
+class ResponseCache:
+    """
+    Extensão que guarda as respostas dos endpoints GET decorados com `cached`.
+
+    Methods:
+        init_app(app):
+            Cria o backend conforme a configuração do app.
+        cached(namespace, key_func=None, version_func=None):
+            Decorador que serve a resposta do cache quando possível.
+        cache_key(namespace, path, query_key, version=None) / lookup(key) / store(key, body, status, mimetype):
+            O mesmo cache fora das views Flask (handlers async do modo ASGI).
+        invalidate(namespace):
+            Invalida todas as respostas de um namespace (chamado pelos endpoints de escrita).
+        stats():
+            Retorna os contadores de hits e misses.
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        cache_type = app.config.get('CACHE_TYPE', 'simple')
+        ttl = app.config.get('CACHE_DEFAULT_TIMEOUT', 60)
+
+        if cache_type == 'simple':
+            self.backend = SimpleCacheBackend(maxsize=app.config.get('CACHE_THRESHOLD', 500), ttl=ttl)
+        elif cache_type == 'redis':
+            import redis  # Dependência opcional, necessária apenas com CACHE_TYPE = 'redis'
+
+            self.backend = RedisCacheBackend(
+                redis.Redis.from_url(app.config['CACHE_REDIS_URL']),
+                ttl=ttl,
+                prefix=app.config.get('CACHE_KEY_PREFIX', 'flask_cache_')
+            )
+        elif cache_type == 'null':
+            self.backend = None
+        else:
+            raise ValueError(f"CACHE_TYPE não suportado: {cache_type}")
+
+        app.extensions['response_cache'] = self
+
+    def cached(self, namespace, key_func=None, version_func=None):
+        """
+        Decorador para views GET. Apenas respostas 200 são armazenadas.
+
+        Args:
+            namespace (str): Grupo de respostas invalidado em conjunto.
+            key_func (callable): Recebe request.args e retorna a chave normalizada da consulta.
+                Por padrão usa todos os argumentos, ordenados.
+            version_func (callable): Opcional. Retorna a versão atual dos dados (ex.: versão da tabela
+                no banco), incluída na chave para que escritas feitas por outros processos também
+                invalidem o cache local.
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if self.backend is None:
+                    return view(*args, **kwargs)
+
+                query_key = key_func(request.args) if key_func else sorted(request.args.items(multi=True))
+                version = version_func() if version_func is not None else None
+                key = self.cache_key(namespace, request.path, query_key, version)
+
+                cached_value = self.lookup(key)
+                if cached_value is not None:
+                    body, status, mimetype = cached_value
+                    response = make_response(body, status)
+                    response.mimetype = mimetype
+                    response.headers['X-Cache'] = 'HIT'
+                    return response
+
+                response = make_response(view(*args, **kwargs))
+                if response.status_code == 200 and not response.is_streamed:
+                    self.store(key, response.get_data(), response.status_code, response.mimetype)
+                response.headers['X-Cache'] = 'MISS'
+                return response
+
+            return wrapper
+
+        return decorator
+
+    def cache_key(self, namespace, path, query_key, version=None):
+        """
+        Chave de uma resposta: namespace, geração, versão dos dados (opcional), caminho e consulta normalizada.
+        Usada também pelos handlers async (api/recipes_asgi.py), que compartilham as entradas com as views Flask.
+        """
+        generation = self.backend.generation(namespace)
+        if version is not None:
+            generation = f'{generation}.{version}'
+        return f'{namespace}:{generation}:{path}:{query_key!r}'
+
+    def lookup(self, key):
+        """
+        Retorna a resposta guardada, (body, status, mimetype), ou None; conta o hit ou miss.
+        """
+        value = self.backend.get(key)
+        self._count(hit=value is not None)
+        return value
+
+    def store(self, key, body, status, mimetype):
+        self.backend.set(key, (body, status, mimetype))
+
+    def invalidate(self, namespace):
+        if self.backend is not None:
+            self.backend.bump_generation(namespace)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'backend': self.backend.__class__.__name__ if self.backend else None,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / total, 4) if total else 0.0
+            }
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
@@ -0,0 +1,5 @@
+from infrastructure.cache.response_cache import ResponseCache
+
+# Instância única do cache de respostas, configurada a partir do app (CACHE_TYPE, CACHE_DEFAULT_TIMEOUT...)
+# em create_app (api/app_factory.py)
+response_cache = ResponseCache()
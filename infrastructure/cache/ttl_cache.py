@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Cache em memória com tempo de expiração (TTL) e descarte LRU, seguro para uso entre threads.
+
+    Attributes:
+        maxsize (int): Quantidade máxima de entradas; ao ultrapassar, a menos usada recentemente é descartada.
+        ttl (float): Tempo de vida de cada entrada, em segundos.
+
+    Methods:
+        get(key, default=None):
+            Retorna o valor armazenado, ou `default` se a chave não existir ou tiver expirado.
+        set(key, value, ttl=None):
+            Armazena um valor, opcionalmente com um TTL diferente do padrão.
+        delete(key):
+            Remove uma chave.
+        clear():
+            Remove todas as entradas.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at <= self._timer():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = self._timer() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,304 @@
+import importlib.util
+import time
+import zlib
+from functools import lru_cache
+
+from flask import current_app, request
+from werkzeug.http import parse_accept_header
+
+# Compressão das respostas (gzip ou brotli), negociada pelo cabeçalho Accept-Encoding.
+#   - Apenas tipos de conteúdo em COMPRESSION_MIMETYPES (JSON, NDJSON, CSV, texto...).
+#   - Respostas comuns menores que COMPRESSION_MIN_SIZE vão sem compressão (o ganho não paga o custo).
+#   - Respostas em stream (ex.: /recipes/export) são comprimidas sem esperar o fim. O que foi comprimido
+#     é enviado (flush) a cada COMPRESSION_STREAM_FLUSH_SIZE bytes recebidos ou, se o stream for lento,
+#     no primeiro bloco depois de COMPRESSION_STREAM_FLUSH_SECONDS. Um flush por bloco pequeno (uma linha
+#     de NDJSON) quase dobraria o tamanho da resposta.
+#   - Respostas já comprimidas (Content-Encoding), 204, 206, 304, HEAD e Cache-Control: no-transform
+#     ficam como estão.
+# O ETag de uma resposta comprimida passa a ser fraco: o conteúdo é o mesmo, mas os bytes não.
+#
+# O brotli ('br') é usado apenas se o pacote brotli estiver instalado; sem ele, só gzip.
+
+SKIPPED_STATUS = (204, 206, 304)
+
+
+class GzipCompressor:
+
+    def __init__(self, level):
+        # wbits=31: formato gzip (cabeçalho e CRC), e não zlib puro
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data, flush=False):
+        """
+        Args:
+            flush (bool): Envia já tudo o que foi recebido (usado em cada bloco de um stream).
+        """
+        compressed = self._compressor.compress(data)
+        if flush:
+            compressed += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return compressed
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+
+    def __init__(self, level):
+        import brotli  # Dependência opcional, necessária apenas com 'br' em COMPRESSION_ALGORITHMS
+
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data, flush=False):
+        compressed = self._compressor.process(data)
+        if flush:
+            compressed += self._compressor.flush()
+        return compressed
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+# Content-Encoding -> (compressor, módulo necessário, configuração do nível)
+COMPRESSORS = {
+    'br': (BrotliCompressor, 'brotli', 'COMPRESSION_BROTLI_LEVEL'),
+    'gzip': (GzipCompressor, 'zlib', 'COMPRESSION_GZIP_LEVEL'),
+}
+
+
+@lru_cache(maxsize=None)
+def _installed(module):
+    return importlib.util.find_spec(module) is not None
+
+
+def available_algorithms(config):
+    """
+    Algoritmos de COMPRESSION_ALGORITHMS (em ordem de preferência) que podem ser usados neste ambiente.
+    """
+    algorithms = []
+    for name in config.get('COMPRESSION_ALGORITHMS', ('br', 'gzip')):
+        if name not in COMPRESSORS:
+            raise ValueError(f"Algoritmo de compressão não suportado: {name}")
+        if _installed(COMPRESSORS[name][1]):
+            algorithms.append(name)
+    return algorithms
+
+
+def choose_encoding(accept_encoding, algorithms):
+    """
+    Escolhe o algoritmo pelo Accept-Encoding do cliente (maior q); no empate, vale a ordem de `algorithms`.
+
+    Returns:
+        str or None: 'br', 'gzip' ou None se o cliente não aceitar nenhum deles.
+    """
+    if not accept_encoding:
+        return None
+    return parse_accept_header(accept_encoding).best_match(algorithms)
+
+
+def compressible(mimetype, config):
+    return mimetype in config.get('COMPRESSION_MIMETYPES', ())
+
+
+def create_compressor(encoding, config):
+    compressor_class, _, level_setting = COMPRESSORS[encoding]
+    return compressor_class(config[level_setting])
+
+
+class StreamCompressor:
+    """
+    Comprime os blocos de um stream, com flush a cada `flush_size` bytes recebidos ou no primeiro bloco
+    depois de `flush_seconds` sem flush. Entre um flush e outro, o compressor acumula os blocos.
+
+    Args:
+        compressor (GzipCompressor or BrotliCompressor): Compressor da resposta.
+        flush_size (int): Bytes (sem compressão) recebidos entre dois flushes.
+        flush_seconds (float): Intervalo máximo entre dois flushes, verificado a cada bloco.
+    """
+
+    def __init__(self, compressor, flush_size, flush_seconds):
+        self.compressor = compressor
+        self.flush_size = flush_size
+        self.flush_seconds = flush_seconds
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def compress(self, data):
+        self._pending += len(data)
+        now = time.monotonic()
+        flush = self._pending >= self.flush_size or now - self._last_flush >= self.flush_seconds
+        if flush:
+            self._pending = 0
+            self._last_flush = now
+        return self.compressor.compress(data, flush=flush)
+
+    def finish(self):
+        return self.compressor.finish()
+
+
+def create_stream_compressor(encoding, config):
+    return StreamCompressor(
+        create_compressor(encoding, config), config.get('COMPRESSION_STREAM_FLUSH_SIZE', 32 * 1024),
+        config.get('COMPRESSION_STREAM_FLUSH_SECONDS', 1.0)
+    )
+
+
+def compress_stream(chunks, compressor):
+    """
+    Comprime um stream com um StreamCompressor, repassando o close() ao iterável original.
+    """
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+
+class Compression:
+    """
+    Extensão que comprime as respostas do app Flask.
+
+    Methods:
+        init_app(app):
+            Registra a compressão (COMPRESSION_ENABLED) como último passo de cada resposta.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['compression'] = self
+        if not app.config.get('COMPRESSION_ENABLED', True):
+            return
+
+        available_algorithms(app.config)  # valida COMPRESSION_ALGORITHMS já na criação do app
+        # Os after_request rodam na ordem inversa do registro: registrada antes das demais extensões,
+        # a compressão recebe a resposta já pronta (cabeçalhos de métricas, cache etc.)
+        app.after_request(self._compress_response)
+
+    def _compress_response(self, response):
+        config = current_app.config
+        if not compressible(response.mimetype, config):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        if (response.status_code < 200 or response.status_code in SKIPPED_STATUS or request.method == 'HEAD'
+                or 'Content-Encoding' in response.headers or response.direct_passthrough
+                or response.cache_control.no_transform):
+            return response
+
+        encoding = choose_encoding(request.headers.get('Accept-Encoding'), available_algorithms(config))
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = compress_stream(response.response, create_stream_compressor(encoding, config))
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < config.get('COMPRESSION_MIN_SIZE', 500):
+                return response
+            compressor = create_compressor(encoding, config)
+            response.set_data(compressor.compress(data) + compressor.finish())
+
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+
+class ASGICompressionMiddleware:
+    """
+    Mesma compressão para os handlers async do modo ASGI (api/recipes_asgi.py), aplicada rota a rota:
+    as rotas repassadas ao app Flask já passam pela extensão Compression.
+
+    Args:
+        app: Aplicação ASGI.
+        config (Config): Configuração do app Flask (COMPRESSION_*).
+    """
+
+    def __init__(self, app, config):
+        self.app = app
+        self.config = config
+        self.algorithms = available_algorithms(config)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] == 'HEAD':
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = dict(scope['headers']).get(b'accept-encoding', b'').decode('latin-1')
+        encoding = choose_encoding(accept_encoding, self.algorithms)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, compressor, passthrough
+            if message['type'] == 'http.response.start':
+                # Os cabeçalhos só são enviados junto com o primeiro bloco, quando já se sabe se haverá compressão
+                start = message
+                return
+            if message['type'] != 'http.response.body' or passthrough:
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if compressor is None:
+                if not self._should_compress(start, body, more_body):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                headers = compressed_headers(start['headers'], encoding)
+                if not more_body:
+                    compressor = create_compressor(encoding, self.config)
+                    body = compressor.compress(body) + compressor.finish()
+                    headers.append((b'content-length', str(len(body)).encode('latin-1')))
+                    await send({**start, 'headers': headers})
+                    await send({**message, 'body': body})
+                    return
+                compressor = create_stream_compressor(encoding, self.config)
+                await send({**start, 'headers': headers})
+
+            data = compressor.compress(body)
+            if not more_body:
+                data += compressor.finish()
+            await send({**message, 'body': data})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _should_compress(self, start, body, more_body):
+        headers = {name.lower(): value for name, value in start['headers']}
+        mimetype = headers.get(b'content-type', b'').decode('latin-1').partition(';')[0].strip().lower()
+        if (start['status'] < 200 or start['status'] in SKIPPED_STATUS or b'content-encoding' in headers
+                or not compressible(mimetype, self.config)
+                or b'no-transform' in headers.get(b'cache-control', b'')):
+            return False
+        return more_body or len(body) >= self.config.get('COMPRESSION_MIN_SIZE', 500)
+
+
+def compressed_headers(headers, encoding):
+    """
+    Cabeçalhos ASGI de uma resposta comprimida: sem Content-Length, com Content-Encoding e Vary.
+    """
+    vary = [value.decode('latin-1') for name, value in headers if name.lower() == b'vary']
+    headers = [(name, value) for name, value in headers if name.lower() not in (b'content-length', b'vary')]
+    headers.append((b'vary', ', '.join(vary + ['Accept-Encoding']).encode('latin-1')))
+    headers.append((b'content-encoding', encoding.encode('latin-1')))
+    return headers
@@ -0,0 +1,5 @@
+from infrastructure.compression.compression import Compression
+
+# Instância única da compressão de respostas, configurada a partir do app (COMPRESSION_*)
+# em create_app (api/app_factory.py)
+compression = Compression()
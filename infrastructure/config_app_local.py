@@ -1,5 +1,36 @@
+from datetime import timedelta
+
 SECRET_KEY = 'chave secreta'
-CACHE_TYPE = 'simple'
+CACHE_TYPE = 'simple'  # 'simple' (em memória), 'redis' ou 'null'
+CACHE_DEFAULT_TIMEOUT = 60
+CACHE_THRESHOLD = 500
+CACHE_REDIS_URL = 'redis://localhost:6379/0'
+
+# Serialização JSON (infrastructure/json_provider.py): 'auto' usa orjson ou msgspec se instalados, senão 'stdlib'
+JSON_PROVIDER = 'auto'
+JSON_SORT_KEYS = False  # ordenar as chaves de todas as respostas tem custo e nenhum cliente depende da ordem
+
+# Compressão das respostas (infrastructure/compression/compression.py), negociada pelo Accept-Encoding
+COMPRESSION_ENABLED = True
+COMPRESSION_ALGORITHMS = ['br', 'gzip']  # ordem de preferência; 'br' só é usado com o pacote brotli instalado
+COMPRESSION_MIN_SIZE = 500  # bytes; respostas menores vão sem compressão (streams são sempre comprimidos)
+COMPRESSION_GZIP_LEVEL = 6  # 1 (rápido) a 9 (menor)
+COMPRESSION_BROTLI_LEVEL = 4  # 0 (rápido) a 11 (menor)
+COMPRESSION_STREAM_FLUSH_SIZE = 32 * 1024  # bytes recebidos entre dois envios de um stream comprimido
+COMPRESSION_STREAM_FLUSH_SECONDS = 1.0  # intervalo máximo entre dois envios, verificado a cada bloco
+COMPRESSION_MIMETYPES = [
+    'application/json', 'application/x-ndjson', 'text/csv', 'text/html', 'text/plain',
+    'text/css', 'application/javascript',
+]
+
+# APIs registradas por create_app (api/app_factory.py); as que ficarem de fora não são nem importadas
+APP_BLUEPRINTS = ['auth', 'recipes', 'items', 'scraping']
+
+# Documentação (flasgger) em /apidocs
+SWAGGER_ENABLED = True
+# Especificação pré-gerada (python -m api.openapi_spec build), relativa à pasta api/; None gera a partir das docstrings
+OPENAPI_SPEC_FILE = None
+OPENAPI_SPEC_MAX_AGE = 86400  # segundos
 SWAGGER = {
     'title': 'Catálogo de Receitas Gourmet',
     'uiversion': 3,
@@ -20,4 +51,104 @@ SWAGGER = {
 
 SQLALCHEMY_DATABASE_URI = 'sqlite:///recipes.db'
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+# Réplica de leitura usada pelos GET (ver infrastructure/database/read_replica.py), ex.:
+# SQLALCHEMY_BINDS = {'read': 'sqlite:///recipes_replica.db'}
+SQLALCHEMY_BINDS = {}
+READ_YOUR_WRITES_SECONDS = 5  # após uma escrita, o cliente lê do banco principal por este tempo; 0 desliga
 JWT_SECRET_KEY = 'chave_secreta_token'
+JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=15)
+JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)  # POST /refresh gera novos tokens de acesso até esta validade
+
+# Cache dos JWT já verificados (infrastructure/security/auth/jwt_manager.py)
+JWT_VERIFIED_CACHE_SIZE = 1024  # 0 desliga o cache
+JWT_VERIFIED_CACHE_TTL = 300  # segundos (nunca além da expiração do token)
+
+# Lista de tokens revogados (POST /logout): 'memory' (por processo), 'sqlite' ou 'redis' (compartilhada entre workers)
+JWT_BLOCKLIST = 'memory'
+JWT_BLOCKLIST_SYNC_SECONDS = 5  # intervalo de sincronização com o backend compartilhado
+JWT_BLOCKLIST_PRUNE_SECONDS = 60  # intervalo do descarte das revogações de tokens já expirados
+JWT_BLOCKLIST_REDIS_URL = CACHE_REDIS_URL
+
+# Métricas (infrastructure/metrics/metrics.py): formato Prometheus em METRICS_ENDPOINT e cabeçalho Server-Timing
+METRICS_ENABLED = True
+METRICS_ENDPOINT = '/metrics'  # None deixa a rota de fora
+METRICS_TOKEN = None  # se definido, /metrics exige 'Authorization: Bearer <token>'
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # segundos
+SERVER_TIMING_ENABLED = True
+SLOW_QUERY_SECONDS = 0.1  # consultas mais lentas que isto vão para o log; None desliga
+
+# Hash de senhas (formato do Werkzeug): algoritmo e custo
+PASSWORD_HASH_METHOD = 'scrypt:32768:8:1'
+
+# Cache das credenciais já verificadas no Basic Auth (evita recalcular o hash a cada requisição)
+BASIC_AUTH_CACHE_SIZE = 1024
+BASIC_AUTH_CACHE_TTL = 60  # segundos; 0 desliga o cache
+
+# Limite de requisições por cliente (infrastructure/security/rate_limit.py): nome -> (requisições, segundos)
+# login/register são limitados por IP; scrape_title (/scrape/title e /scrape/titles, uma ficha por URL) e
+# scrape_jobs, pelo usuário autenticado
+RATE_LIMIT_ENABLED = True
+RATE_LIMITS = {
+    'login': (10, 60),
+    'register': (20, 3600),
+    'scrape_title': (30, 60),
+    'scrape_jobs': (60, 60),
+}
+# Armazenamento dos baldes: 'memory' (por processo), 'sqlite' ou 'redis' (compartilhados entre workers)
+RATE_LIMIT_STORAGE = 'memory'
+RATE_LIMIT_MAX_KEYS = 10000  # clientes acompanhados no armazenamento 'memory'
+RATE_LIMIT_DATABASE_PATH = 'instance/rate_limit.db'
+RATE_LIMIT_REDIS_URL = CACHE_REDIS_URL
+
+# Paginação de GET /recipes
+RECIPES_PAGE_SIZE = 50
+RECIPES_MAX_PAGE_SIZE = 500
+
+# Quantidade de linhas buscadas por vez no cursor de GET /recipes/export
+RECIPES_EXPORT_BATCH_SIZE = 1000
+
+# Importação em lote (POST /recipes/bulk)
+RECIPES_BULK_BATCH_SIZE = 500
+RECIPES_BULK_MAX_BATCH_SIZE = 5000
+RECIPES_BULK_MAX_ERRORS = 1000
+
+# Web scraping (usecases/title_scraper.py)
+SCRAPE_CONNECT_TIMEOUT = 3.05  # segundos
+SCRAPE_READ_TIMEOUT = 10
+SCRAPE_TOTAL_DEADLINE = 30  # prazo total de POST /scrape/titles
+SCRAPE_MAX_WORKERS = 16
+SCRAPE_PER_HOST_LIMIT = 4
+SCRAPE_MAX_URLS = 50
+# Limite global de buscas simultâneas (individuais e dos lotes); acima dele, /scrape/title responde 503
+SCRAPE_MAX_CONCURRENT_FETCHES = 32
+SCRAPE_QUEUE_TIMEOUT = 0.5  # espera máxima por uma vaga, em segundos
+SCRAPE_RETRY_AFTER = 1  # Retry-After sugerido no 503, em segundos
+
+# Fila de buscas em segundo plano (POST /scrape/jobs, ver usecases/scrape_jobs.py), na tabela scrape_job
+SCRAPE_JOB_WORKERS = 2  # threads por processo; 0 deixa o processamento para python -m usecases.scrape_jobs
+SCRAPE_JOB_POLL_SECONDS = 1  # intervalo de consulta à fila quando não há jobs
+SCRAPE_JOB_LEASE_SECONDS = 60  # prazo de um worker para concluir o job antes que outro o retome
+SCRAPE_JOB_MAX_ATTEMPTS = 3
+SCRAPE_JOB_RETENTION_SECONDS = 86400  # por quanto tempo os jobs concluídos podem ser consultados
+
+# Sessão HTTP do scraper (pool de conexões e novas tentativas)
+SCRAPE_POOL_CONNECTIONS = 10
+SCRAPE_POOL_MAXSIZE = SCRAPE_MAX_WORKERS
+SCRAPE_RETRIES = 2
+SCRAPE_RETRY_BACKOFF = 0.3
+
+# Cache HTTP das páginas buscadas: 'memory', 'disk' ou None (desligado)
+SCRAPE_HTTP_CACHE = 'memory'
+SCRAPE_HTTP_CACHE_DIR = '.cache/scraper'
+SCRAPE_HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Extração do título: lê a página em partes e para em </title> (False usa a análise completa com BeautifulSoup)
+SCRAPE_TITLE_STREAMING = True
+SCRAPE_TITLE_MAX_BYTES = 512 * 1024
+
+# Armazenamento dos itens (api/items_api.py): 'memory' (por processo) ou 'sqlite' (compartilhado entre workers)
+ITEMS_REPOSITORY = 'memory'
+ITEMS_DATABASE_PATH = 'instance/items.db'
+ITEMS_PAGE_SIZE = 100
+ITEMS_MAX_PAGE_SIZE = 1000
+ITEMS_MAX_BATCH_SIZE = 500
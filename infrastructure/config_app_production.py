@@ -0,0 +1,41 @@
+import os
+
+from infrastructure.config_app_local import *  # noqa: F401,F403 - o perfil de produção parte do local
+
+# Perfil de produção: APP_CONFIG=infrastructure.config_app_production
+
+# PRAGMAs aplicados em cada nova conexão SQLite (ver infrastructure/database/sqlite_tuning.py)
+#   journal_mode=WAL       leitores não bloqueiam o escritor (e vice-versa)
+#   synchronous=NORMAL     com WAL, fsync apenas nos checkpoints; seguro contra corrupção
+#   busy_timeout           espera pelo lock de escrita em vez de falhar com "database is locked"
+#   cache_size (negativo)  tamanho do cache de páginas em KiB, por conexão
+#   mmap_size              leitura do arquivo via memória mapeada
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'cache_size': -64000,
+    'mmap_size': 268435456,
+    'temp_store': 'MEMORY',
+}
+
+# Pool de conexões do SQLAlchemy: cada thread do worker reaproveita uma conexão aberta
+SQLALCHEMY_ENGINE_OPTIONS = {
+    'pool_size': 10,
+    'max_overflow': 10,
+    'pool_timeout': 10,
+    'connect_args': {'timeout': 5},
+}
+
+ITEMS_REPOSITORY = 'sqlite'
+SCRAPE_HTTP_CACHE = 'disk'
+# Server-Timing expõe o tempo gasto no banco a qualquer cliente; em produção, use o /metrics
+SERVER_TIMING_ENABLED = False
+# /metrics só com o token do coletor (variável de ambiente METRICS_TOKEN); sem ele, a rota não existe
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+METRICS_ENDPOINT = '/metrics' if METRICS_TOKEN else None
+RATE_LIMIT_STORAGE = 'sqlite'  # um único limite por cliente, somando todos os workers
+JWT_BLOCKLIST = 'sqlite'  # revogações valem para todos os workers e sobrevivem a reinícios
+
+# Serve a especificação OpenAPI pré-gerada (api/openapi.json) em vez de ler as docstrings em cada worker
+OPENAPI_SPEC_FILE = 'openapi.json'
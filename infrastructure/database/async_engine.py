@@ -0,0 +1,44 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from infrastructure.database.sqlite_tuning import apply_sqlite_pragmas
+
+# Engine assíncrono usado pelo modo ASGI (api/recipes_asgi.py).
+# Aponta para o mesmo banco do app Flask (SQLALCHEMY_DATABASE_URI, já resolvido para a pasta
+# instance) e reaproveita as opções de pool e os PRAGMAs do perfil ativo, então os dois modos
+# compartilham os modelos de ConfigSQLAlchemy e a configuração.
+
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+
+def create_async_engine_for(app, db, bind_key=None):
+    """
+    Cria o engine assíncrono equivalente a um engine do Flask-SQLAlchemy.
+
+    Args:
+        app (Flask): Aplicação com a configuração do banco.
+        db (SQLAlchemy): Extensão do Flask-SQLAlchemy.
+        bind_key (str or None): Bind a ser usado (None é o banco principal).
+
+    Returns:
+        AsyncEngine: Engine com o driver assíncrono do banco (ex.: aiosqlite).
+    """
+    with app.app_context():
+        url = db.engines[bind_key].url
+
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        raise ValueError(f"Banco sem driver assíncrono configurado: {url.drivername}")
+
+    engine = create_async_engine(url.set(drivername=driver), **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    apply_sqlite_pragmas(engine.sync_engine, app.config.get('SQLITE_PRAGMAS'))
+    return engine
+
+
+def create_async_session_factory(engine):
+    """
+    Fábrica de AsyncSession. Os objetos continuam utilizáveis após o commit, já que no modo
+    assíncrono não é possível recarregar atributos de forma implícita.
+    """
+    return async_sessionmaker(engine, expire_on_commit=False)
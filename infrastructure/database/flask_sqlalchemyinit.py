@@ -1,29 +1,121 @@
-from flask import Flask
+from datetime import datetime, timezone
+
 from flask_sqlalchemy import SQLAlchemy
 
+from infrastructure.database.read_replica import RoutingSession, init_read_your_writes
+from infrastructure.database.sqlite_tuning import apply_sqlite_pragmas
+
 # Após a execução do script, será criada uma pasta chamada instance, contendo um arquivo chamado recipes.db
 # Este arquivo contém a descrição do banco em sqlite, banco de dados em memória para python
 # É como se fosse o h2 do java, mas em python
+#
+# A extensão é criada sem app e ligada a ele em create_app (api/app_factory.py)
+
+# Leituras em GET podem ir para a réplica do bind 'read' (ver infrastructure/database/read_replica.py)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def init_database(app):
+    """
+    Liga o db ao app e aplica os ajustes do perfil ativo.
 
-app = Flask(__name__)
-app.config.from_object('infrastructure.config_app_local')
+    Args:
+        app (Flask): Aplicação Flask já configurada.
+    """
+    # Colunas JSON (ex.: recipe.ingredients) lidas e gravadas pelo mesmo provider das respostas (orjson, se instalado)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'json_serializer': app.json.dumps,
+        'json_deserializer': app.json.loads,
+        **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}),
+    }
+    db.init_app(app)
+    init_read_your_writes(app)
+
+    with app.app_context():
+        # PRAGMAs do perfil ativo (SQLITE_PRAGMAS), executados em cada conexão nova
+        for engine in db.engines.values():
+            apply_sqlite_pragmas(engine, app.config.get('SQLITE_PRAGMAS'))
+
+
+def utcnow():
+    return datetime.now(timezone.utc)
 
-db = SQLAlchemy(app)
 
 class ConfigSQLAlchemy:
 
     class User(db.Model):
         id = db.Column(db.Integer, primary_key=True)
         username = db.Column(db.String(80), unique=True, nullable=False)
-        password = db.Column(db.String(120), nullable=False)
+        # Hash da senha (ver infrastructure/security/passwords.py)
+        password = db.Column(db.String(255), nullable=False)
 
     class Recipe(db.Model):
         id = db.Column(db.Integer, primary_key=True)
         title = db.Column(db.String(100), nullable=False)
-        ingredients = db.Column(db.Text, nullable=False)
+        # Lista JSON com os ingredientes já normalizados (minúsculas, sem espaços extras e sem repetição),
+        # gravada por sync_recipe_ingredients; a leitura não precisa de nenhum tratamento
+        ingredients = db.Column(db.JSON, nullable=False)
         time_minutes = db.Column(db.Integer, nullable=False)
+        # Usado para gerar o ETag de cada receita em GET /recipes/<id>
+        updated_at = db.Column(db.DateTime, nullable=False, default=utcnow, onupdate=utcnow, index=True)
+
+        # Índice normalizado de ingredientes, mantido em sincronia pelo módulo ingredient_index
+        ingredient_index = db.relationship('RecipeIngredient', cascade='all, delete-orphan')
+
+    class RecipeIngredient(db.Model):
+        # Uma linha por ingrediente (em minúsculas e sem espaços extras) de cada receita.
+        # O índice (name, recipe_id) permite buscar receitas por ingrediente sem varrer a tabela recipe
+        __tablename__ = 'recipe_ingredient'
+        recipe_id = db.Column(db.Integer, db.ForeignKey('recipe.id', ondelete='CASCADE'), primary_key=True)
+        name = db.Column(db.String(100), primary_key=True)
+
+        __table_args__ = (
+            db.Index('ix_recipe_ingredient_name_recipe_id', 'name', 'recipe_id'),
+        )
+
+    class TableVersion(db.Model):
+        # Contador de versão por tabela, incrementado na mesma transação de cada escrita.
+        # Permite gerar ETags de listagens sem consultar (nem contar) as linhas da tabela
+        __tablename__ = 'table_version'
+        name = db.Column(db.String(80), primary_key=True)
+        version = db.Column(db.Integer, nullable=False, default=0)
+
+    class RevokedToken(db.Model):
+        # Tokens JWT revogados em POST /logout (JWT_BLOCKLIST = 'sqlite').
+        # revoked_at indexado para a sincronização incremental entre workers (ver token_blocklist.py)
+        __tablename__ = 'revoked_token'
+        jti = db.Column(db.String(36), primary_key=True)
+        expires_at = db.Column(db.DateTime, nullable=False)
+        revoked_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    class ScrapeJob(db.Model):
+        # Fila das buscas de título em segundo plano (POST /scrape/jobs, ver usecases/scrape_jobs.py).
+        # O índice único parcial impede dois jobs em andamento (queued/running) para a mesma URL;
+        # locked_until é o prazo do worker que pegou o job, depois do qual outro worker pode retomá-lo
+        __tablename__ = 'scrape_job'
+        id = db.Column(db.String(32), primary_key=True)
+        url = db.Column(db.String(2048), nullable=False)
+        status = db.Column(db.String(16), nullable=False)
+        title = db.Column(db.Text)
+        error = db.Column(db.Text)
+        attempts = db.Column(db.Integer, nullable=False, default=0)
+        created_at = db.Column(db.DateTime, nullable=False)
+        locked_until = db.Column(db.DateTime)
+        finished_at = db.Column(db.DateTime, index=True)
+
+        __table_args__ = (
+            db.Index('ix_scrape_job_status_created_at', 'status', 'created_at'),
+            db.Index('ux_scrape_job_active_url', 'url', unique=True,
+                     sqlite_where=db.text("status IN ('queued', 'running')")),
+        )
+
+
+if __name__ == '__main__':
+    # Executado como script, este arquivo é carregado de novo (com o nome do módulo) pelo create_app;
+    # as tabelas são criadas a partir daquela instância do db
+    from api.app_factory import create_app
+    from infrastructure.database import flask_sqlalchemyinit
 
-    if __name__ == '__main__':
-        with app.app_context():
-            db.create_all()
-            print("Banco de dados criado!")
\ No newline at end of file
+    with create_app().app_context():
+        flask_sqlalchemyinit.db.create_all()
+        print("Banco de dados criado!")
@@ -0,0 +1,159 @@
+from sqlalchemy import func, select
+
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+
+# Índice de ingredientes das receitas.
+# A busca com ILIKE '%x%' não consegue usar índice no SQLite e varre a tabela recipe inteira,
+# por isso cada ingrediente é gravado normalizado na tabela recipe_ingredient e a busca passa a
+# ser feita por igualdade no índice (name, recipe_id).
+#
+# Para criar a tabela e popular o índice das receitas já existentes:
+#   python -m infrastructure.database.ingredient_index
+
+MATCH_ALL = 'all'
+MATCH_ANY = 'any'
+
+
+def normalize_ingredients(ingredients):
+    """
+    Normaliza ingredientes para a forma usada no índice.
+
+    Args:
+        ingredients (str or list): Ingredientes separados por vírgula ou lista de ingredientes.
+
+    Returns:
+        list: Ingredientes em minúsculas, sem espaços extras, sem vazios e sem repetição (na ordem original).
+    """
+    if isinstance(ingredients, str):
+        ingredients = ingredients.split(',')
+
+    normalized = []
+    for ingredient in ingredients or []:
+        name = ' '.join(str(ingredient).split()).lower()
+        if name and name not in normalized:
+            normalized.append(name)
+    return normalized
+
+
+def parse_ingredient_args(args):
+    """
+    Lê os ingredientes da query string, aceitando `?ingredient=a,b` e `?ingredient=a&ingredient=b`.
+
+    Args:
+        args (MultiDict): Argumentos da requisição (request.args).
+
+    Returns:
+        list: Ingredientes normalizados.
+    """
+    return normalize_ingredients(','.join(args.getlist('ingredient')))
+
+
+def sync_recipe_ingredients(recipe):
+    """
+    Normaliza o campo `ingredients` de uma receita (texto separado por vírgulas ou lista) e
+    atualiza o índice de ingredientes a partir dele.
+    Deve ser chamado sempre que a receita for criada ou tiver os ingredientes alterados;
+    na remoção da receita o índice é apagado pelo cascade do relacionamento.
+
+    Args:
+        recipe (ConfigSQLAlchemy.Recipe): Receita a ser sincronizada.
+    """
+    recipe.ingredients = normalize_ingredients(recipe.ingredients)
+    recipe.ingredient_index = [ConfigSQLAlchemy.RecipeIngredient(name=name) for name in recipe.ingredients]
+
+
+def ingredient_index_rows(recipe_id, ingredients):
+    """
+    Gera as linhas do índice de uma receita para inserção em lote (Core executemany).
+
+    Args:
+        recipe_id (int): ID da receita.
+        ingredients (str or list): Ingredientes da receita.
+
+    Returns:
+        list: Dicionários com recipe_id e name.
+    """
+    return [{'recipe_id': recipe_id, 'name': name} for name in normalize_ingredients(ingredients)]
+
+
+def filter_by_ingredients(query, ingredients, match=MATCH_ALL):
+    """
+    Filtra uma query de receitas pelos ingredientes usando o índice.
+
+    Args:
+        query (Query): Query sobre ConfigSQLAlchemy.Recipe.
+        ingredients (list): Ingredientes já normalizados.
+        match (str): 'all' exige todos os ingredientes (AND), 'any' aceita qualquer um deles (OR).
+
+    Returns:
+        Query: Query filtrada.
+    """
+    if not ingredients:
+        return query
+
+    recipe_ids = (
+        select(ConfigSQLAlchemy.RecipeIngredient.recipe_id)
+        .where(ConfigSQLAlchemy.RecipeIngredient.name.in_(ingredients))
+    )
+
+    if match == MATCH_ALL and len(ingredients) > 1:
+        # A chave primária (recipe_id, name) garante que cada ingrediente é contado uma única vez
+        recipe_ids = (
+            recipe_ids
+            .group_by(ConfigSQLAlchemy.RecipeIngredient.recipe_id)
+            .having(func.count() == len(ingredients))
+        )
+
+    return query.filter(ConfigSQLAlchemy.Recipe.id.in_(recipe_ids))
+
+
+def rebuild_ingredient_index(batch_size=1000):
+    """
+    Recria o índice de ingredientes de todas as receitas existentes, em lotes.
+
+    Args:
+        batch_size (int): Quantidade de receitas processadas por transação.
+
+    Returns:
+        int: Quantidade de receitas indexadas.
+    """
+    Recipe = ConfigSQLAlchemy.Recipe
+    RecipeIngredient = ConfigSQLAlchemy.RecipeIngredient
+
+    db.session.execute(RecipeIngredient.__table__.delete())
+
+    total = 0
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            select(Recipe.id, Recipe.ingredients)
+            .where(Recipe.id > last_id)
+            .order_by(Recipe.id)
+            .limit(batch_size)
+        ).all()
+
+        if not rows:
+            break
+
+        entries = [
+            entry
+            for recipe_id, ingredients in rows
+            for entry in ingredient_index_rows(recipe_id, ingredients)
+        ]
+        if entries:
+            db.session.execute(RecipeIngredient.__table__.insert(), entries)
+        db.session.commit()
+
+        total += len(rows)
+        last_id = rows[-1].id
+
+    db.session.commit()
+    return total
+
+
+if __name__ == '__main__':
+    from api.app_factory import create_app
+
+    with create_app().app_context():
+        db.create_all()
+        print(f"Índice de ingredientes recriado para {rebuild_ingredient_index()} receitas!")
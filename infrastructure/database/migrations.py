@@ -0,0 +1,105 @@
+from sqlalchemy import bindparam, inspect, text, update
+
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db, utcnow
+from infrastructure.database.ingredient_index import ingredient_index_rows, normalize_ingredients
+from infrastructure.database.table_version import bump_table_version_on
+
+# Migrações do banco existente (o projeto não usa Alembic).
+# db.create_all() cria apenas as tabelas que ainda não existem, então as colunas novas
+# das tabelas antigas são adicionadas aqui. Cada passo pode ser executado mais de uma vez.
+#
+#   python -m infrastructure.database.migrations
+
+
+def add_recipe_updated_at():
+    """
+    Adiciona a coluna recipe.updated_at (e seu índice), preenchendo as receitas existentes com a data atual.
+    """
+    columns = {column['name'] for column in inspect(db.engine).get_columns('recipe')}
+    if 'updated_at' in columns:
+        return
+
+    with db.engine.begin() as connection:
+        connection.execute(text(
+            "ALTER TABLE recipe ADD COLUMN updated_at DATETIME NOT NULL DEFAULT '1970-01-01 00:00:00.000000'"
+        ))
+        connection.execute(text("UPDATE recipe SET updated_at = :now"), {'now': utcnow().replace(tzinfo=None)})
+        connection.execute(text("CREATE INDEX IF NOT EXISTS ix_recipe_updated_at ON recipe (updated_at)"))
+
+
+def convert_recipe_ingredients(batch_size=1000):
+    """
+    Converte recipe.ingredients do texto separado por vírgulas para a lista JSON normalizada e
+    recria o índice de ingredientes das receitas convertidas. Cada lote incrementa a versão da tabela
+    recipe (e o UPDATE, o updated_at de cada receita), então os ETags e o cache de GET /recipes de
+    antes da conversão deixam de valer.
+    As receitas já convertidas (valor que é uma lista JSON válida) são ignoradas; um texto antigo que
+    apenas começa com '[' (ex.: '[sic] tomate, Sal') também é convertido.
+    """
+    recipe = ConfigSQLAlchemy.Recipe.__table__
+    recipe_ingredient = ConfigSQLAlchemy.RecipeIngredient.__table__
+    statement = (
+        update(recipe)
+        .where(recipe.c.id == bindparam('recipe_id'))
+        .values(ingredients=bindparam('normalized'))
+    )
+
+    last_id = 0
+    while True:
+        with db.engine.begin() as connection:
+            rows = connection.execute(
+                text("SELECT id, ingredients FROM recipe WHERE id > :last_id "
+                     "AND NOT (json_valid(ingredients) AND json_type(ingredients) = 'array') "
+                     "ORDER BY id LIMIT :limit"),
+                {'last_id': last_id, 'limit': batch_size}
+            ).all()
+            if not rows:
+                return
+
+            converted = [
+                {'recipe_id': recipe_id, 'normalized': normalize_ingredients(ingredients)}
+                for recipe_id, ingredients in rows
+            ]
+            connection.execute(statement, converted)
+            bump_table_version_on(connection, 'recipe')
+
+            recipe_ids = [row['recipe_id'] for row in converted]
+            index_rows = [
+                entry
+                for row in converted
+                for entry in ingredient_index_rows(row['recipe_id'], row['normalized'])
+            ]
+            connection.execute(recipe_ingredient.delete().where(recipe_ingredient.c.recipe_id.in_(recipe_ids)))
+            if index_rows:
+                connection.execute(recipe_ingredient.insert(), index_rows)
+        last_id = rows[-1].id
+
+
+def seed_table_versions():
+    """
+    Cria o registro de versão da tabela recipe, usado nos ETags de GET /recipes.
+    """
+    if db.session.get(ConfigSQLAlchemy.TableVersion, 'recipe') is None:
+        db.session.add(ConfigSQLAlchemy.TableVersion(name='recipe', version=1))
+        db.session.commit()
+
+
+MIGRATIONS = [
+    add_recipe_updated_at,
+    convert_recipe_ingredients,
+    seed_table_versions,
+]
+
+
+def upgrade():
+    db.create_all()
+    for migration in MIGRATIONS:
+        migration()
+
+
+if __name__ == '__main__':
+    from api.app_factory import create_app
+
+    with create_app().app_context():
+        upgrade()
+        print("Banco de dados atualizado!")
@@ -0,0 +1,106 @@
+import time
+
+import sqlalchemy as sa
+from flask import g, has_request_context, request, session
+from flask_sqlalchemy.session import Session
+
+# Roteamento de leituras para uma réplica.
+# Quando SQLALCHEMY_BINDS tem a chave 'read', as consultas feitas em requisições GET/HEAD/OPTIONS
+# usam o engine da réplica; as demais requisições, os flushes e os INSERT/UPDATE/DELETE usam o
+# banco principal. Sem a chave 'read' tudo continua indo para o banco principal.
+#
+# Read-your-writes: depois de uma escrita, o cliente (identificado pelo cookie de sessão do Flask)
+# continua lendo do banco principal por READ_YOUR_WRITES_SECONDS, tempo para a réplica alcançá-lo.
+#
+# Para testar localmente com SQLite, a réplica pode ser uma cópia do arquivo principal:
+#   SQLALCHEMY_BINDS = {'read': 'sqlite:///recipes_replica.db'}
+#   python -m infrastructure.database.read_replica
+
+READ_BIND = 'read'
+READ_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+LAST_WRITE_KEY = '_last_write_at'
+
+
+class RoutingSession(Session):
+    """
+    Sessão do Flask-SQLAlchemy que escolhe entre o banco principal e a réplica de leitura
+    de acordo com o método da requisição e com o tipo de operação.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context():
+            if self._flushing or isinstance(clause, sa.UpdateBase):
+                g.db_write = True
+            elif request.method in READ_METHODS and not recently_wrote():
+                replica = self._db.engines.get(READ_BIND)
+                if replica is not None:
+                    return replica
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def recently_wrote():
+    """
+    Indica se o cliente da requisição atual fez uma escrita há menos de READ_YOUR_WRITES_SECONDS.
+    """
+    if 'recently_wrote' not in g:
+        seconds = g.get('read_your_writes_seconds', 0)
+        last_write = session.get(LAST_WRITE_KEY) if seconds > 0 else None
+        g.recently_wrote = last_write is not None and time.time() - last_write < seconds
+    return g.recently_wrote
+
+
+def init_read_your_writes(app):
+    """
+    Registra os hooks que marcam, no cookie de sessão, o momento da última escrita bem-sucedida.
+
+    Args:
+        app (Flask): Aplicação Flask.
+    """
+    seconds = app.config.get('READ_YOUR_WRITES_SECONDS', 0)
+    if seconds <= 0 or READ_BIND not in app.config.get('SQLALCHEMY_BINDS', {}):
+        return
+
+    @app.before_request
+    def load_read_your_writes():
+        g.read_your_writes_seconds = seconds
+
+    @app.after_request
+    def mark_last_write(response):
+        if g.get('db_write') and response.status_code < 400:
+            session[LAST_WRITE_KEY] = time.time()
+        return response
+
+
+def snapshot_replica(db):
+    """
+    Copia o banco principal para a réplica com a API de backup do SQLite (cópia consistente,
+    mesmo com o banco em uso). Serve para montar uma réplica local de teste.
+
+    Args:
+        db (SQLAlchemy): Extensão com o bind 'read' configurado.
+    """
+    primary = db.engines[None]
+    replica = db.engines[READ_BIND]
+    if primary.dialect.name != 'sqlite' or replica.dialect.name != 'sqlite':
+        raise ValueError("A cópia da réplica só é suportada entre bancos SQLite")
+
+    source = primary.raw_connection()
+    target = replica.raw_connection()
+    try:
+        source.driver_connection.backup(target.driver_connection)
+    finally:
+        target.close()
+        source.close()
+
+
+if __name__ == '__main__':
+    from api.app_factory import create_app
+    from infrastructure.database.flask_sqlalchemyinit import db
+
+    with create_app().app_context():
+        if READ_BIND not in db.engines:
+            raise SystemExit("Configure SQLALCHEMY_BINDS = {'read': ...} para criar a réplica")
+        db.create_all()
+        snapshot_replica(db)
+        print(f"Réplica atualizada: {db.engines[READ_BIND].url}")
@@ -0,0 +1,25 @@
+from sqlalchemy import event
+
+# Ajustes de desempenho do SQLite aplicados por PRAGMA em cada conexão nova do pool.
+# Os valores ficam em SQLITE_PRAGMAS na configuração (ver config_app_production.py).
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """
+    Registra um evento 'connect' que executa os PRAGMAs em cada nova conexão do engine.
+    Engines de outros bancos são ignorados. Funciona também com o engine assíncrono (aiosqlite),
+    passando engine.sync_engine.
+
+    Args:
+        engine (Engine): Engine do SQLAlchemy.
+        pragmas (dict): Nome e valor de cada PRAGMA (ex.: {'journal_mode': 'WAL'}).
+    """
+    if not pragmas or engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
@@ -0,0 +1,83 @@
+from sqlalchemy import insert, select, update
+
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+
+
+def bump_table_version(name):
+    """
+    Incrementa a versão de uma tabela. Deve ser chamado antes do commit da escrita,
+    para que a nova versão seja gravada na mesma transação.
+
+    Args:
+        name (str): Nome da tabela.
+    """
+    result = db.session.execute(_increment_version(name))
+
+    if result.rowcount == 0:
+        db.session.add(ConfigSQLAlchemy.TableVersion(name=name, version=1))
+
+
+def bump_table_version_on(connection, name):
+    """
+    Versão de bump_table_version para uma conexão do Core (ex.: as migrações em
+    infrastructure/database/migrations.py), na transação aberta nela.
+
+    Args:
+        connection (Connection): Conexão com a transação da escrita.
+        name (str): Nome da tabela.
+    """
+    result = connection.execute(_increment_version(name))
+
+    if result.rowcount == 0:
+        connection.execute(insert(ConfigSQLAlchemy.TableVersion).values(name=name, version=1))
+
+
+async def bump_table_version_async(session, name):
+    """
+    Versão de bump_table_version para uma AsyncSession (modo ASGI).
+
+    Args:
+        session (AsyncSession): Sessão da escrita.
+        name (str): Nome da tabela.
+    """
+    result = await session.execute(_increment_version(name))
+
+    if result.rowcount == 0:
+        session.add(ConfigSQLAlchemy.TableVersion(name=name, version=1))
+
+
+def _increment_version(name):
+    TableVersion = ConfigSQLAlchemy.TableVersion
+    return (
+        update(TableVersion)
+        .where(TableVersion.name == name)
+        .values(version=TableVersion.version + 1)
+    )
+
+
+def get_table_version(name):
+    """
+    Retorna a versão atual de uma tabela (0 se ela nunca foi alterada).
+
+    Args:
+        name (str): Nome da tabela.
+
+    Returns:
+        int: Versão da tabela.
+    """
+    version = db.session.scalar(
+        select(ConfigSQLAlchemy.TableVersion.version)
+        .where(ConfigSQLAlchemy.TableVersion.name == name)
+    )
+    return version or 0
+
+
+async def get_table_version_async(session, name):
+    """
+    Versão de get_table_version para uma AsyncSession (modo ASGI).
+    """
+    version = await session.scalar(
+        select(ConfigSQLAlchemy.TableVersion.version)
+        .where(ConfigSQLAlchemy.TableVersion.name == name)
+    )
+    return version or 0
@@ -0,0 +1,368 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+# Cache HTTP (privado) das páginas buscadas pelo scraper.
+# Segue as regras básicas de Cache-Control / Expires / ETag / Last-Modified:
+#   - respostas com no-store não são guardadas;
+#   - enquanto a resposta estiver fresca (max-age, Expires ou heurística pelo Last-Modified),
+#     ela é devolvida sem acessar a rede;
+#   - depois disso a página é revalidada com If-None-Match / If-Modified-Since e,
+#     se o servidor responder 304, o conteúdo guardado é reaproveitado.
+
+# Parte do tempo desde a última modificação usada como validade quando o servidor não informa nenhuma
+HEURISTIC_FRESHNESS_FRACTION = 0.1
+HEURISTIC_FRESHNESS_MAX = 24 * 60 * 60
+
+STORED_HEADERS = ('content-type', 'etag', 'last-modified', 'cache-control', 'expires', 'date')
+
+
+class CachedResponse:
+    """
+    Resposta HTTP guardada no cache (ou recém-buscada), com a interface mínima usada pelo scraper.
+
+    Attributes:
+        url (str): URL da página.
+        status_code (int): Status HTTP.
+        headers (dict): Cabeçalhos relevantes para o cache, com nomes em minúsculas.
+        content (bytes): Corpo da resposta.
+        expires_at (float): Momento (time.time()) até o qual a resposta é considerada fresca.
+        from_cache (bool): Indica se a resposta veio do cache.
+        complete (bool): False quando apenas o início do corpo foi lido (leitura em partes interrompida).
+    """
+
+    def __init__(self, url, status_code, headers, content, expires_at=0.0, from_cache=False, complete=True):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+        self.from_cache = from_cache
+        self.complete = complete
+
+    def copy(self, **changes):
+        values = dict(url=self.url, status_code=self.status_code, headers=dict(self.headers),
+                      content=self.content, expires_at=self.expires_at, from_cache=self.from_cache,
+                      complete=self.complete)
+        values.update(changes)
+        return CachedResponse(**values)
+
+    @property
+    def size(self):
+        return len(self.content)
+
+    def is_fresh(self, now=None):
+        return (now or time.time()) < self.expires_at
+
+    def to_bytes(self):
+        meta = {'url': self.url, 'status_code': self.status_code, 'headers': self.headers,
+                'expires_at': self.expires_at, 'complete': self.complete}
+        return json.dumps(meta).encode() + b'\n' + self.content
+
+    @classmethod
+    def from_bytes(cls, data):
+        meta, content = data.split(b'\n', 1)
+        meta = json.loads(meta)
+        return cls(meta['url'], meta['status_code'], meta['headers'], content, meta['expires_at'],
+                   from_cache=True, complete=meta.get('complete', True))
+
+
+def parse_cache_control(value):
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def freshness_lifetime(headers, now=None):
+    """
+    Calcula por quantos segundos a resposta pode ser usada sem revalidar.
+
+    Args:
+        headers (dict): Cabeçalhos da resposta, com nomes em minúsculas.
+
+    Returns:
+        float: Tempo de validade em segundos (0 quando precisa ser revalidada a cada uso).
+    """
+    now = now or time.time()
+    directives = parse_cache_control(headers.get('cache-control'))
+
+    if 'no-cache' in directives:
+        return 0.0
+
+    if (directives.get('max-age') or '').isdigit():
+        return float(directives['max-age'])
+
+    try:
+        if headers.get('expires'):
+            return max(parsedate_to_datetime(headers['expires']).timestamp() - now, 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+    try:
+        if headers.get('last-modified'):
+            age = now - parsedate_to_datetime(headers['last-modified']).timestamp()
+            return min(max(age, 0.0) * HEURISTIC_FRESHNESS_FRACTION, HEURISTIC_FRESHNESS_MAX)
+    except (TypeError, ValueError):
+        pass
+
+    return 0.0
+
+
+def is_storable(status_code, headers):
+    directives = parse_cache_control(headers.get('cache-control'))
+    if status_code != 200 or 'no-store' in directives:
+        return False
+    # Sem validade nem validadores não há como reaproveitar a resposta depois
+    return bool(freshness_lifetime(headers) or headers.get('etag') or headers.get('last-modified'))
+
+
+class MemoryCacheBackend:
+    """
+    Backend em memória limitado pelo total de bytes, com descarte LRU.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url, entry):
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old is not None:
+                self._size -= old.size
+
+            self._entries[url] = entry
+            self._size += entry.size
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+
+class DiskCacheBackend:
+    """
+    Backend em disco (um arquivo por URL), limitado pelo total de bytes do diretório.
+    Ao ultrapassar o limite, os arquivos acessados há mais tempo são removidos.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest())
+
+    def get(self, url):
+        path = self._path(url)
+        try:
+            with open(path, 'rb') as f:
+                entry = CachedResponse.from_bytes(f.read())
+            os.utime(path)  # Marca o acesso para o descarte LRU
+        except (OSError, ValueError):
+            return None
+        return entry if entry.url == url else None
+
+    def set(self, url, entry):
+        data = entry.to_bytes()
+        if len(data) > self.max_bytes:
+            return
+
+        path = self._path(url)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)  # Escrita atômica: leitores nunca veem um arquivo pela metade
+
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.tmp'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+
+class StreamedResponse:
+    """
+    Resposta lida em partes. O que for lido é acumulado para, no fechamento, ser guardado no cache.
+
+    Attributes:
+        url (str): URL da página.
+        status_code (int): Status HTTP.
+        headers (dict): Cabeçalhos relevantes para o cache, com nomes em minúsculas.
+        from_cache (bool): Indica se o corpo vem do cache.
+    """
+
+    def __init__(self, url, status_code, headers, chunks, from_cache=False, raw=None, on_close=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.from_cache = from_cache
+        self._chunks = chunks
+        self._raw = raw
+        self._on_close = on_close
+        self._buffer = bytearray()
+        self._complete = False
+
+    @classmethod
+    def from_entry(cls, entry):
+        return cls(entry.url, entry.status_code, entry.headers, [entry.content], from_cache=True)
+
+    def iter_content(self):
+        for chunk in self._chunks:
+            if self._on_close is not None:
+                self._buffer.extend(chunk)
+            yield chunk
+        self._complete = True
+
+    def close(self):
+        if self._raw is not None:
+            self._raw.close()  # Interromper a leitura descarta a conexão em vez de baixar o restante
+        if self._on_close is not None:
+            self._on_close(bytes(self._buffer), self._complete)
+            self._on_close = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CachingHTTPClient:
+    """
+    Cliente HTTP que consulta o cache antes da rede e revalida respostas expiradas.
+
+    Args:
+        session (requests.Session): Sessão (com pool de conexões) usada nas requisições.
+        backend (MemoryCacheBackend or DiskCacheBackend or None): Onde as respostas são guardadas;
+            None desliga o cache.
+    """
+
+    def __init__(self, session, backend=None):
+        self.session = session
+        self.backend = backend
+
+    def get(self, url, timeout=None):
+        """
+        Busca uma URL, usando o cache quando possível.
+
+        Returns:
+            CachedResponse: Resposta (do cache ou da rede).
+
+        Raises:
+            requests.RequestException: Falha de rede ou timeout.
+        """
+        entry = self._cached_entry(url, allow_partial=False)
+        if entry is not None and entry.is_fresh():
+            return entry
+
+        response = self.session.get(url, headers=self._validators(entry), timeout=timeout)
+        response_headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+
+        if response.status_code == 304 and entry is not None:
+            return self._revalidated(url, entry, response_headers)
+
+        fetched = CachedResponse(url, response.status_code, response_headers, response.content,
+                                 expires_at=time.time() + freshness_lifetime(response_headers))
+
+        if self.backend is not None and is_storable(fetched.status_code, fetched.headers):
+            self.backend.set(url, fetched.copy(from_cache=True))
+
+        return fetched
+
+    def open(self, url, timeout=None, chunk_size=16 * 1024):
+        """
+        Abre uma URL para leitura em partes (streaming). Deve ser usado com `with`.
+        Se a leitura for interrompida antes do fim, apenas o trecho lido é guardado no cache,
+        marcado como parcial: ele atende novas leituras em partes (que também param cedo), mas nunca get().
+
+        Returns:
+            StreamedResponse: Resposta com iter_content().
+
+        Raises:
+            requests.RequestException: Falha de rede ou timeout.
+        """
+        entry = self._cached_entry(url, allow_partial=True)
+        if entry is not None and entry.is_fresh():
+            return StreamedResponse.from_entry(entry)
+
+        response = self.session.get(url, headers=self._validators(entry), timeout=timeout, stream=True)
+        response_headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            return StreamedResponse.from_entry(self._revalidated(url, entry, response_headers))
+
+        on_close = None
+        if self.backend is not None and is_storable(response.status_code, response_headers):
+            def on_close(content, complete):
+                if content:
+                    self.backend.set(url, CachedResponse(
+                        url, response.status_code, response_headers, content,
+                        expires_at=time.time() + freshness_lifetime(response_headers),
+                        from_cache=True, complete=complete
+                    ))
+
+        return StreamedResponse(url, response.status_code, response_headers,
+                                response.iter_content(chunk_size=chunk_size), raw=response, on_close=on_close)
+
+    def _cached_entry(self, url, allow_partial):
+        entry = self.backend.get(url) if self.backend is not None else None
+        if entry is not None and not entry.complete and not allow_partial:
+            return None
+        return entry
+
+    @staticmethod
+    def _validators(entry):
+        headers = {}
+        if entry is not None:
+            if entry.headers.get('etag'):
+                headers['If-None-Match'] = entry.headers['etag']
+            if entry.headers.get('last-modified'):
+                headers['If-Modified-Since'] = entry.headers['last-modified']
+        return headers
+
+    def _revalidated(self, url, entry, response_headers):
+        # Conteúdo não mudou: renova a validade com os cabeçalhos novos e reaproveita o corpo
+        headers = {**entry.headers, **response_headers}
+        revalidated = entry.copy(headers=headers, expires_at=time.time() + freshness_lifetime(headers))
+        self.backend.set(url, revalidated)
+        return revalidated
@@ -0,0 +1,36 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_session(pool_connections=10, pool_maxsize=10, retries=2, backoff_factor=0.3):
+    """
+    Cria uma sessão HTTP com pool de conexões (keep-alive) e novas tentativas com backoff.
+    Reaproveitar a sessão evita um novo handshake TCP/TLS a cada requisição para o mesmo host.
+
+    Args:
+        pool_connections (int): Quantidade de hosts mantidos no pool.
+        pool_maxsize (int): Conexões simultâneas mantidas por host (deve acompanhar o número de threads).
+        retries (int): Novas tentativas em falhas de conexão e respostas 500/502/504.
+        backoff_factor (float): Base do intervalo exponencial entre as tentativas, em segundos.
+
+    Returns:
+        requests.Session: Sessão configurada para http e https.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,  # Timeout de leitura não é repetido, para respeitar o prazo de quem chamou
+        backoff_factor=backoff_factor,
+        # 429 e 503 não são repetidos: pedem uma espera (Retry-After) que pode passar dos timeouts de quem chamou
+        status_forcelist=(500, 502, 504),
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
@@ -0,0 +1,182 @@
+import importlib.util
+import json
+from operator import itemgetter
+
+from flask.json.provider import DefaultJSONProvider
+
+# Serialização JSON do app (jsonify, request.get_json, current_app.json).
+# Com JSON_PROVIDER = 'auto' usa o orjson ou o msgspec, se instalados, e o json da biblioteca padrão
+# caso contrário. Os tipos que o Flask converte de forma própria (datas no formato HTTP, dataclasses,
+# Markup, UUID...) continuam passando pela mesma função `default` do DefaultJSONProvider, então o
+# conteúdo das respostas é o mesmo; muda apenas o custo de gerar o texto (e caracteres não ASCII,
+# que saem em UTF-8 em vez de escapados com \u).
+
+PROVIDERS = ('orjson', 'msgspec', 'stdlib')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Provider baseado no orjson, que gera bytes diretamente (sem passar por str na resposta).
+    Chamadas com argumentos próprios do json.dumps (ex.: cls, separators) usam a biblioteca padrão.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        import orjson
+
+        self._orjson = orjson
+
+    def _options(self, indent=False):
+        # Datas e dataclasses vão para `default`, como no Flask; chaves não str são convertidas, como no json
+        options = (self._orjson.OPT_PASSTHROUGH_DATETIME | self._orjson.OPT_PASSTHROUGH_DATACLASS
+                   | self._orjson.OPT_NON_STR_KEYS)
+        if self.sort_keys:
+            options |= self._orjson.OPT_SORT_KEYS
+        if indent:
+            options |= self._orjson.OPT_INDENT_2
+        return options
+
+    def dumps_bytes(self, obj, indent=False):
+        return self._orjson.dumps(obj, default=self.default, option=self._options(indent))
+
+    def bytes_encoder(self):
+        dumps, default, option = self._orjson.dumps, self.default, self._options()
+        return lambda obj: dumps(obj, default, option)
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return self._orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.dumps_bytes(obj, indent) + b'\n', mimetype=self.mimetype)
+
+
+class MsgspecProvider(DefaultJSONProvider):
+    """
+    Provider baseado no msgspec. Os encoders são criados uma vez (com e sem ordenação das chaves).
+    Diferente dos demais, o msgspec converte datas por conta própria (ISO 8601, e não o formato HTTP).
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoders = {}
+
+    def _encoder(self):
+        order = 'sorted' if self.sort_keys else None
+        encoder = self._encoders.get(order)
+        if encoder is None:
+            encoder = self._encoders[order] = self._msgspec.json.Encoder(enc_hook=self.default, order=order)
+        return encoder
+
+    def dumps_bytes(self, obj, indent=False):
+        data = self._encoder().encode(obj)
+        return self._msgspec.json.format(data, indent=2) if indent else data
+
+    def bytes_encoder(self):
+        return self._encoder().encode
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return self._msgspec.json.decode(s)
+        except self._msgspec.DecodeError as e:
+            # O Flask (request.get_json) trata JSON inválido como ValueError, que é o erro do json e do orjson
+            raise ValueError(str(e)) from e
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.dumps_bytes(obj, indent) + b'\n', mimetype=self.mimetype)
+
+
+def bytes_encoder(provider):
+    """
+    Função que serializa um valor em bytes (compacto) com o provider: a do orjson/msgspec, já com as
+    opções resolvidas, ou um JSONEncoder da biblioteca padrão com as opções do DefaultJSONProvider.
+    """
+    encoder = getattr(provider, 'bytes_encoder', None)
+    if encoder is not None:
+        return encoder()
+    encode = json.JSONEncoder(
+        default=provider.default, ensure_ascii=provider.ensure_ascii, sort_keys=provider.sort_keys,
+        separators=(',', ':')
+    ).encode
+    return lambda obj: encode(obj).encode('utf-8')
+
+
+def dumps_rows(provider, rows, fields, raw_fields=()):
+    """
+    Serializa tuplas (linhas de um select) como uma lista JSON de objetos, sem montar um dicionário
+    por linha: as chaves entram uma única vez em um modelo e cada valor é serializado direto da tupla.
+
+    Args:
+        provider (DefaultJSONProvider): Provider do app (app.json); define a serialização dos valores.
+        rows (list): Tuplas com os valores de `fields`, na mesma ordem. Valores além deles são ignorados.
+        fields (list): Nomes das chaves.
+        raw_fields (iterable): Campos que já vêm como texto JSON (ex.: uma coluna JSON lida sem conversão)
+            e entram na resposta como estão.
+
+    Returns:
+        bytes: Lista JSON, compacta (as chaves seguem a ordem de `fields`, ou a alfabética com sort_keys).
+    """
+    positions = range(len(fields))
+    if provider.sort_keys:
+        positions = sorted(positions, key=lambda i: fields[i])
+
+    encode = bytes_encoder(provider)
+    template = b'{' + b','.join(encode(fields[i]).replace(b'%', b'%%') + b':%b' for i in positions) + b'}'
+    # Coluna a coluna (map/itemgetter), para que o laço por valor fique todo em C
+    columns = [map(_raw_json if fields[i] in raw_fields else encode, map(itemgetter(i), rows)) for i in positions]
+
+    return b'[' + b','.join([template % values for values in zip(*columns)]) + b']'
+
+
+def _raw_json(value):
+    return value.encode('utf-8') if isinstance(value, str) else value
+
+
+def available_providers():
+    """
+    Providers que podem ser usados neste ambiente, do mais rápido para o mais lento.
+    """
+    return [name for name in PROVIDERS if name == 'stdlib' or importlib.util.find_spec(name) is not None]
+
+
+def init_json_provider(app):
+    """
+    Configura app.json conforme JSON_PROVIDER ('auto', 'orjson', 'msgspec' ou 'stdlib') e JSON_SORT_KEYS.
+
+    Args:
+        app (Flask): Aplicação Flask.
+    """
+    name = app.config.get('JSON_PROVIDER', 'auto')
+    if name == 'auto':
+        name = available_providers()[0]
+
+    if name == 'orjson':
+        app.json = OrjsonProvider(app)
+    elif name == 'msgspec':
+        app.json = MsgspecProvider(app)
+    elif name == 'stdlib':
+        app.json = DefaultJSONProvider(app)
+    else:
+        raise ValueError(f"JSON_PROVIDER não suportado: {name}")
+
+    app.json.sort_keys = app.config.get('JSON_SORT_KEYS', True)
@@ -0,0 +1,280 @@
+import bisect
+import contextvars
+import hmac
+import logging
+import math
+import threading
+import time
+
+from flask import Response, current_app, g, jsonify, request
+from sqlalchemy import event
+
+from infrastructure.database.flask_sqlalchemyinit import db
+
+# Métricas de desempenho da aplicação, sem dependências externas.
+#   - Latência de cada endpoint (histograma por método, endpoint e status).
+#   - Consultas SQL: quantidade e tempo, medidos pelos eventos before/after_cursor_execute de cada engine.
+#   - Buscas HTTP externas do scraper: quantidade e tempo.
+# Os valores são expostos no formato texto do Prometheus em METRICS_ENDPOINT (com METRICS_TOKEN, apenas
+# para quem enviar 'Authorization: Bearer <token>') e, por requisição, no cabeçalho Server-Timing
+# (app, db e http). Consultas acima de SLOW_QUERY_SECONDS são registradas no log.
+#
+# Respostas em stream (ex.: /recipes/export) geram o corpo depois que os cabeçalhos já foram enviados:
+# elas não recebem Server-Timing, e a latência registrada vai até o início da resposta.
+#
+# As métricas são por processo: com vários workers, o Prometheus coleta cada um separadamente.
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Totais da requisição em andamento (consultas e buscas externas feitas pela thread ou tarefa atual)
+_current_timings = contextvars.ContextVar('request_timings', default=None)
+
+
+class Histogram:
+    """
+    Histograma com buckets cumulativos, no formato do Prometheus.
+
+    Args:
+        name (str): Nome da métrica.
+        documentation (str): Descrição (linha # HELP).
+        labelnames (tuple): Nomes dos rótulos.
+        buckets (tuple): Limites superiores dos buckets, em ordem crescente.
+    """
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, labels=()):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # Contagem por bucket (o último é o +Inf), soma e quantidade
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = [(labels, list(counts), total, count) for labels, (counts, total, count) in self._series.items()]
+
+        for labels, counts, total, count in sorted(series):
+            label_text = _format_labels(self.labelnames, labels)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == math.inf else repr(float(bound))
+                lines.append(f'{self.name}_bucket{_format_labels(self.labelnames + ("le",), labels + (le,))} {cumulative}')
+            lines.append(f'{self.name}_sum{label_text} {total}')
+            lines.append(f'{self.name}_count{label_text} {count}')
+        return lines
+
+
+class RequestTimings:
+    """
+    Tempo gasto pela requisição atual no banco e em buscas externas.
+    """
+
+    __slots__ = ('db_count', 'db_seconds', 'http_count', 'http_seconds')
+
+    def __init__(self):
+        self.db_count = 0
+        self.db_seconds = 0.0
+        self.http_count = 0
+        self.http_seconds = 0.0
+
+
+class Metrics:
+    """
+    Extensão que registra as métricas do app.
+
+    Methods:
+        init_app(app):
+            Registra os hooks de requisição, os eventos SQL dos engines e a rota METRICS_ENDPOINT
+            (None deixa a rota de fora).
+        instrument_engine(engine):
+            Mede as consultas de um engine (ex.: o engine assíncrono de api/recipes_asgi.py, via sync_engine).
+        observe_request(method, endpoint, status, seconds):
+            Registra a latência de uma requisição.
+        record_http(seconds):
+            Registra uma busca HTTP externa.
+        render():
+            Retorna todas as métricas no formato texto do Prometheus.
+    """
+
+    def __init__(self, app=None):
+        self.slow_query_seconds = None
+        self._timings_lock = threading.Lock()
+        self.request_latency = Histogram(
+            'http_request_duration_seconds', 'Latência das requisições, por endpoint.',
+            labelnames=('method', 'endpoint', 'status')
+        )
+        self.db_query = Histogram('db_query_duration_seconds', 'Duração de cada consulta SQL.')
+        self.db_queries_per_request = Histogram(
+            'db_queries_per_request', 'Consultas SQL por requisição.', labelnames=('endpoint',),
+            buckets=(0, 1, 2, 5, 10, 25, 50, 100)
+        )
+        self.outbound_http = Histogram('outbound_http_duration_seconds', 'Duração das buscas HTTP do scraper.')
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['metrics'] = self
+        if not app.config.get('METRICS_ENABLED', True):
+            return
+
+        self.slow_query_seconds = app.config.get('SLOW_QUERY_SECONDS')
+        buckets = app.config.get('METRICS_LATENCY_BUCKETS')
+        if buckets:
+            self.request_latency.buckets = tuple(buckets)
+
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        app.teardown_request(self._reset_request)
+
+        with app.app_context():
+            for engine in db.engines.values():
+                self.instrument_engine(engine)
+
+        endpoint = app.config.get('METRICS_ENDPOINT', '/metrics')
+        if endpoint:
+            app.add_url_rule(endpoint, 'metrics', self._metrics_view)
+
+    def instrument_engine(self, engine):
+        if event.contains(engine, 'before_cursor_execute', self._before_cursor_execute):
+            return
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        event.listen(engine, 'handle_error', self._handle_error)
+
+    def observe_request(self, method, endpoint, status, seconds, timings=None):
+        self.request_latency.observe(seconds, (method, endpoint, str(status)))
+        if timings is not None:
+            self.db_queries_per_request.observe(timings.db_count, (endpoint,))
+
+    def record_http(self, seconds):
+        self.outbound_http.observe(seconds)
+        timings = _current_timings.get()
+        if timings is not None:
+            # As buscas de um lote rodam em paralelo e somam no mesmo objeto
+            with self._timings_lock:
+                timings.http_count += 1
+                timings.http_seconds += seconds
+
+    def render(self):
+        lines = []
+        for histogram in (self.request_latency, self.db_query, self.db_queries_per_request, self.outbound_http):
+            lines.extend(histogram.render())
+        return '\n'.join(lines) + '\n'
+
+    def _metrics_view(self):
+        token = current_app.config.get('METRICS_TOKEN')
+        if token:
+            scheme, _, credentials = request.headers.get('Authorization', '').partition(' ')
+            if scheme.lower() != 'bearer' or not hmac.compare_digest(credentials.encode(), token.encode()):
+                response = jsonify({"error": "Unauthorized"})
+                response.status_code = 401
+                response.headers['WWW-Authenticate'] = 'Bearer'
+                return response
+        return Response(self.render(), mimetype='text/plain; version=0.0.4')
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # No contexto da execução, e não na conexão do pool: uma consulta que falha não deixa
+        # um início pendente para ser pareado com a próxima consulta da mesma conexão
+        if context is not None:
+            context.metrics_query_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._observe_query(context, statement)
+
+    def _handle_error(self, exception_context):
+        # Consultas que falham não passam por after_cursor_execute; o tempo delas (ex.: espera por lock) também conta
+        self._observe_query(exception_context.execution_context, exception_context.statement)
+
+    def _observe_query(self, context, statement):
+        started_at = getattr(context, 'metrics_query_start', None)
+        if started_at is None:
+            return
+        del context.metrics_query_start
+        seconds = time.perf_counter() - started_at
+        self.db_query.observe(seconds)
+
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.db_count += 1
+            timings.db_seconds += seconds
+
+        if self.slow_query_seconds is not None and seconds >= self.slow_query_seconds:
+            logger.warning("Consulta lenta (%.1f ms): %s", seconds * 1000, ' '.join(statement.split())[:500])
+
+    def _start_request(self):
+        g.metrics_started_at = time.perf_counter()
+        g.metrics_token = _current_timings.set(RequestTimings())
+
+    def _finish_request(self, response):
+        started_at = g.get('metrics_started_at')
+        endpoint = request.endpoint or 'unmatched'
+        if started_at is None or endpoint == 'metrics':
+            return response
+
+        seconds = time.perf_counter() - started_at
+        timings = _current_timings.get()
+        self.observe_request(request.method, endpoint, response.status_code, seconds, timings)
+
+        # Em um stream, o corpo (e as suas consultas) ainda nem começou: o cabeçalho informaria quase zero
+        if (timings is not None and not response.is_streamed
+                and current_app.config.get('SERVER_TIMING_ENABLED', True)):
+            response.headers['Server-Timing'] = server_timing(seconds, timings)
+        return response
+
+    def _reset_request(self, exc):
+        token = g.pop('metrics_token', None)
+        if token is not None:
+            _current_timings.reset(token)
+
+
+def track_request():
+    """
+    Inicia a contagem de consultas e buscas externas da requisição atual, fora do Flask (ex.: handlers ASGI).
+
+    Returns:
+        tuple: (RequestTimings, token para contextvars.ContextVar.reset)
+    """
+    timings = RequestTimings()
+    return timings, _current_timings.set(timings)
+
+
+def finish_tracking(token):
+    _current_timings.reset(token)
+
+
+def server_timing(seconds, timings):
+    """
+    Monta o cabeçalho Server-Timing (durações em milissegundos).
+    """
+    return (
+        f'app;dur={seconds * 1000:.1f}, '
+        f'db;dur={timings.db_seconds * 1000:.1f};desc="{timings.db_count} queries", '
+        f'http;dur={timings.http_seconds * 1000:.1f};desc="{timings.http_count} fetches"'
+    )
+
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
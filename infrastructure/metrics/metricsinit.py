@@ -0,0 +1,5 @@
+from infrastructure.metrics.metrics import Metrics
+
+# Instância única das métricas, configurada a partir do app (METRICS_*, SERVER_TIMING_ENABLED,
+# SLOW_QUERY_SECONDS) em create_app (api/app_factory.py)
+metrics = Metrics()
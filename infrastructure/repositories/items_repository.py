@@ -0,0 +1,350 @@
+import itertools
+import json
+import os
+import re
+import sqlite3
+import threading
+
+# Repositórios de itens usados por api/items_api.py.
+# Os itens têm IDs estáveis (nunca reaproveitados nem deslocados ao remover outro item) e a busca
+# por ID é O(1). O repositório em memória serve para um único processo; o SQLite é compartilhado
+# entre todos os workers (ex.: gunicorn -w 4) que apontarem para o mesmo arquivo.
+#
+# Os dois repositórios oferecem:
+#   list(limit, after_id, filters) -> página de itens (paginação por ID e filtro por igualdade de campos,
+#                                     ver filter_values)
+#   get / add / update (mescla os campos) / patch (JSON Merge Patch, RFC 7396) / delete
+#   apply_batch(operations) -> aplica várias operações de forma atômica (todas ou nenhuma)
+
+FIELD_NAME = re.compile(r'^\w+$')
+
+
+class BatchOperationError(Exception):
+    """
+    Erro em uma operação do lote; nenhuma operação do lote é aplicada.
+
+    Attributes:
+        results (list): Resultado de cada operação, com o erro na que falhou.
+    """
+
+    def __init__(self, results):
+        super().__init__("batch operation failed")
+        self.results = results
+
+
+def filter_values(value):
+    """
+    Valores que satisfazem um filtro. Os filtros da query string chegam como texto: '10', 'true' e 'null'
+    também encontram os campos com o número, o booleano ou o null correspondentes (e continuam
+    encontrando os campos de texto '10', 'true' e 'null').
+
+    Returns:
+        list: O próprio valor e, se for um texto com um número, booleano ou null em JSON, o valor decodificado.
+    """
+    if not isinstance(value, str):
+        return [value]
+    try:
+        decoded = json.loads(value)
+    except ValueError:
+        return [value]
+    if isinstance(decoded, (str, list, dict)):
+        return [value]
+    return [value, decoded]
+
+
+def _json_equal(a, b):
+    # Como no SQLite com json_type: true/false não são iguais a 1/0, nem o texto '10' ao número 10
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    return type(a) is type(b) and a == b
+
+
+def _matches(item, filters):
+    return all(
+        field in item and any(_json_equal(item[field], candidate) for candidate in filter_values(value))
+        for field, value in filters.items()
+    )
+
+
+class InMemoryItemRepository:
+    """
+    Repositório em memória, protegido por lock para uso com servidores multi-thread.
+    Os itens são devolvidos como cópias, então alterações fora do repositório não afetam o armazenamento.
+    """
+
+    def __init__(self):
+        self._items = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def list(self, limit=None, after_id=None, filters=None):
+        page = []
+        with self._lock:
+            # Os IDs são crescentes e o dict preserva a ordem de inserção
+            for item_id, item in self._items.items():
+                if after_id is not None and item_id <= after_id:
+                    continue
+                if filters and not _matches(item, filters):
+                    continue
+                page.append(dict(item, id=item_id))
+                if limit is not None and len(page) >= limit:
+                    break
+        return page
+
+    def get(self, item_id):
+        with self._lock:
+            item = self._items.get(item_id)
+            return dict(item, id=item_id) if item is not None else None
+
+    def add(self, data):
+        with self._lock:
+            item_id = next(self._ids)
+            self._items[item_id] = _without_id(data)
+            return dict(self._items[item_id], id=item_id)
+
+    def update(self, item_id, data):
+        with self._lock:
+            item = self._items.get(item_id)
+            if item is None:
+                return None
+            # Cada alteração gera um novo dicionário (copy-on-write), o que permite desfazer um lote
+            self._items[item_id] = {**item, **_without_id(data)}
+            return dict(self._items[item_id], id=item_id)
+
+    def patch(self, item_id, patch):
+        with self._lock:
+            item = self._items.get(item_id)
+            if item is None:
+                return None
+            self._items[item_id] = merge_patch(item, _without_id(patch))
+            return dict(self._items[item_id], id=item_id)
+
+    def delete(self, item_id):
+        with self._lock:
+            item = self._items.pop(item_id, None)
+            return dict(item, id=item_id) if item is not None else None
+
+    def apply_batch(self, operations):
+        with self._lock:
+            snapshot = dict(self._items)
+            try:
+                return _apply_operations(self, operations)
+            except BatchOperationError:
+                self._items = snapshot
+                raise
+
+
+class SQLiteItemRepository:
+    """
+    Repositório em arquivo SQLite, compartilhado entre processos.
+    Cada thread usa a sua própria conexão; o modo WAL permite leituras durante as escritas e as
+    alterações que leem e gravam o item rodam em transações BEGIN IMMEDIATE.
+
+    Args:
+        path (str): Caminho do arquivo do banco.
+        busy_timeout (int): Tempo máximo de espera por um lock de escrita, em milissegundos.
+    """
+
+    def __init__(self, path, busy_timeout=5000):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._transaction() as connection:
+            # AUTOINCREMENT garante que IDs de itens removidos nunca sejam reutilizados
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT NOT NULL)"
+            )
+
+    def _transaction(self, write=True):
+        batch = getattr(self._local, 'batch', None)
+        if batch is not None:
+            return _NestedTransaction(batch)
+
+        connection = getattr(self._local, 'connection', None)
+        # Conexões não podem ser herdadas por fork (ex.: gunicorn --preload): cada processo abre as suas
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout / 1000, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(f'PRAGMA busy_timeout={int(self.busy_timeout)}')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return _Transaction(connection, 'BEGIN IMMEDIATE' if write else 'BEGIN')
+
+    def list(self, limit=None, after_id=None, filters=None):
+        sql = "SELECT id, data FROM items WHERE id > ?"
+        params = [after_id or 0]
+
+        for field, value in (filters or {}).items():
+            # json_type distingue os tipos que o json_extract mistura (true e 1, '10' e 10)
+            path = f'$."{field}"'
+            conditions = []
+            for candidate in filter_values(value):
+                if isinstance(candidate, bool) or candidate is None:
+                    conditions.append("json_type(data, ?) = ?")
+                    params.extend([path, json.dumps(candidate)])
+                elif isinstance(candidate, str):
+                    conditions.append("(json_type(data, ?) = 'text' AND json_extract(data, ?) = ?)")
+                    params.extend([path, path, candidate])
+                else:
+                    conditions.append("(json_type(data, ?) IN ('integer', 'real') AND json_extract(data, ?) = ?)")
+                    params.extend([path, path, candidate])
+            sql += f" AND ({' OR '.join(conditions)})"
+
+        sql += " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._transaction(write=False) as connection:
+            rows = connection.execute(sql, params).fetchall()
+        return [dict(json.loads(data), id=item_id) for item_id, data in rows]
+
+    def get(self, item_id):
+        with self._transaction(write=False) as connection:
+            row = connection.execute("SELECT data FROM items WHERE id = ?", (item_id,)).fetchone()
+        return dict(json.loads(row[0]), id=item_id) if row else None
+
+    def add(self, data):
+        data = _without_id(data)
+        with self._transaction() as connection:
+            cursor = connection.execute("INSERT INTO items (data) VALUES (?)", (json.dumps(data),))
+        return dict(data, id=cursor.lastrowid)
+
+    def update(self, item_id, data):
+        with self._transaction() as connection:
+            row = connection.execute("SELECT data FROM items WHERE id = ?", (item_id,)).fetchone()
+            if row is None:
+                return None
+
+            item = json.loads(row[0])
+            item.update(_without_id(data))
+            connection.execute("UPDATE items SET data = ? WHERE id = ?", (json.dumps(item), item_id))
+        return dict(item, id=item_id)
+
+    def patch(self, item_id, patch):
+        # json_patch aplica o Merge Patch no próprio SQLite: só o patch é serializado, não o item inteiro
+        with self._transaction() as connection:
+            row = connection.execute(
+                "UPDATE items SET data = json_patch(data, ?) WHERE id = ? RETURNING data",
+                (json.dumps(_without_id(patch)), item_id)
+            ).fetchone()
+        return dict(json.loads(row[0]), id=item_id) if row else None
+
+    def delete(self, item_id):
+        with self._transaction() as connection:
+            row = connection.execute("DELETE FROM items WHERE id = ? RETURNING data", (item_id,)).fetchone()
+        return dict(json.loads(row[0]), id=item_id) if row else None
+
+    def apply_batch(self, operations):
+        # Todas as operações rodam na mesma transação (a conexão da thread); um erro desfaz o lote inteiro
+        with self._transaction() as connection:
+            self._local.batch = connection
+            try:
+                return _apply_operations(self, operations)
+            finally:
+                self._local.batch = None
+
+
+class _Transaction:
+    # Abre uma transação (BEGIN IMMEDIATE nas escritas, para pegar o lock de escrita desde o início)
+    # e faz commit ou rollback no fim
+
+    def __init__(self, connection, begin):
+        self.connection = connection
+        self.begin = begin
+
+    def __enter__(self):
+        self.connection.execute(self.begin)
+        return self.connection
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.connection.execute('ROLLBACK' if exc_type else 'COMMIT')
+
+
+class _NestedTransaction:
+    # Operação executada dentro de um lote: usa a transação já aberta por apply_batch
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self.connection
+
+    def __exit__(self, exc_type, exc, traceback):
+        pass
+
+
+def merge_patch(target, patch):
+    """
+    Aplica um JSON Merge Patch (RFC 7396): campos com null são removidos e objetos são mesclados recursivamente.
+    """
+    result = dict(target)
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, dict):
+            # Sem um objeto no destino, o patch é mesclado em um objeto vazio (os seus nulls também somem)
+            result[key] = merge_patch(result.get(key) if isinstance(result.get(key), dict) else {}, value)
+        else:
+            result[key] = value
+    return result
+
+
+def _apply_operations(repository, operations):
+    results = []
+    for operation in operations:
+        op = operation['op']
+
+        if op == 'create':
+            results.append({'op': op, 'status': 201, 'item': repository.add(operation['item'])})
+            continue
+
+        if op == 'update':
+            item = repository.update(operation['id'], operation['item'])
+        elif op == 'patch':
+            item = repository.patch(operation['id'], operation['item'])
+        else:
+            item = repository.delete(operation['id'])
+
+        if item is None:
+            results.append({'op': op, 'status': 404, 'error': 'item not found'})
+            raise BatchOperationError(_not_applied(operations, results))
+        results.append({'op': op, 'status': 200, 'item': item})
+    return results
+
+
+def _not_applied(operations, results):
+    # O lote foi desfeito: as operações anteriores à que falhou (a última de results) não valem mais,
+    # e as seguintes nem foram executadas
+    failed = len(results) - 1
+    error = f'not applied: operations[{failed}] failed'
+    return [
+        results[failed] if index == failed else {'op': operation['op'], 'status': 424, 'error': error}
+        for index, operation in enumerate(operations)
+    ]
+
+
+def _without_id(data):
+    return {key: value for key, value in data.items() if key != 'id'}
+
+
+def create_item_repository(kind, path=None):
+    """
+    Cria o repositório de itens configurado.
+
+    Args:
+        kind (str): 'memory' ou 'sqlite'.
+        path (str): Arquivo do banco, quando kind for 'sqlite'.
+    """
+    if kind == 'memory':
+        return InMemoryItemRepository()
+    if kind == 'sqlite':
+        return SQLiteItemRepository(path)
+    raise ValueError(f"ITEMS_REPOSITORY não suportado: {kind}")
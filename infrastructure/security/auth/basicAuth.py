@@ -1,31 +1,72 @@
+import functools
+import hashlib
+import hmac
+import secrets
+
 from flask_httpauth import HTTPBasicAuth
 
+from infrastructure.cache.ttl_cache import TTLCache
+from infrastructure.security.passwords import DEFAULT_METHOD, hash_password, verify_password
+
 class BasicAuthentication:
     """
     Classe que gerencia a autenticação HTTP Basic usando Flask-HTTPAuth.
 
     Attributes:
         auth (HTTPBasicAuth): Instância de autenticação HTTP.
-        users (dict): Dicionário contendo nomes de usuários e suas senhas em texto plano (não recomendado para produção).
+        users (callable): Retorna o dicionário com os nomes de usuários e o hash das suas senhas.
+        credential_cache (TTLCache or None): Cache das credenciais já verificadas. Como o hash da senha
+            é propositalmente lento, o resultado fica guardado por alguns segundos; None desliga o cache.
+        password_hash_method (str): Algoritmo e custo do hash das senhas (PASSWORD_HASH_METHOD).
 
     Methods:
+        init_app(app):
+            Aplica a configuração do app (PASSWORD_HASH_METHOD, BASIC_AUTH_CACHE_*); chamado pelos
+            blueprints que usam o Basic Auth quando são registrados.
         verify_password(username, password):
             Método estático responsável por validar a autenticação de um usuário.
             Verifica se o nome de usuário está registrado e se a senha corresponde.
     """
-    
+
     auth = HTTPBasicAuth()
-    
-    users = {
-        "user1": "password1",
-        "user2": "password2"
-    }
+    password_hash_method = DEFAULT_METHOD
+    credential_cache = None
+
+    # Os hashes são calculados na primeira autenticação, e não na importação: cada um custa
+    # dezenas de MB e de milissegundos com o scrypt, o que pesaria na inicialização do app
+    @staticmethod
+    @functools.cache
+    def users():
+        method = BasicAuthentication.password_hash_method
+        return {
+            "user1": hash_password("password1", method=method),
+            "user2": hash_password("password2", method=method)
+        }
+
+    @staticmethod
+    def init_app(app):
+        BasicAuthentication.password_hash_method = app.config['PASSWORD_HASH_METHOD']
+        BasicAuthentication.users.cache_clear()
+        BasicAuthentication.credential_cache = (
+            TTLCache(maxsize=app.config['BASIC_AUTH_CACHE_SIZE'], ttl=app.config['BASIC_AUTH_CACHE_TTL'])
+            if app.config['BASIC_AUTH_CACHE_TTL'] > 0 else None
+        )
+
+    # Chave aleatória por processo: o cache guarda apenas um HMAC das credenciais, nunca a senha
+    _cache_key = secrets.token_bytes(32)
+
+    @staticmethod
+    def _credential_digest(username, password, stored):
+        message = '\0'.join((username, password, stored)).encode()
+        return hmac.new(BasicAuthentication._cache_key, message, hashlib.sha256).digest()
 
     @staticmethod
     @auth.verify_password
     def verify_password(username, password):
         """
         Verifica se o nome de usuário e a senha fornecidos são válidos.
+        Credenciais verificadas recentemente são conferidas pelo cache, sem recalcular o hash.
+        O hash armazenado faz parte do digest, então trocar a senha invalida a entrada do cache.
 
         Args:
             username (str): Nome de usuário enviado na requisição HTTP Basic.
@@ -34,5 +75,19 @@ class BasicAuthentication:
         Returns:
             str or None: Retorna o nome de usuário se a autenticação for bem-sucedida, caso contrário, retorna None.
         """
-        if username in BasicAuthentication.users and BasicAuthentication.users[username] == password:
+        stored = BasicAuthentication.users().get(username)
+        if stored is None:
+            return None
+
+        cache = BasicAuthentication.credential_cache
+        digest = BasicAuthentication._credential_digest(username, password, stored)
+
+        if cache is not None:
+            cached_digest = cache.get(username)
+            if cached_digest is not None and hmac.compare_digest(cached_digest, digest):
+                return username
+
+        if verify_password(stored, password):
+            if cache is not None:
+                cache.set(username, digest)
             return username
@@ -1,12 +1,24 @@
-from infrastructure.database.flask_sqlalchemyinit import db, app
+from infrastructure.database.flask_sqlalchemyinit import db
+from infrastructure.security.auth.jwt_manager import CachingJWTManager
+from infrastructure.security.auth.token_blocklist import TokenBlocklist
 from flask_jwt_extended import (
-    JWTManager, create_access_token,
-    jwt_required, get_jwt_identity
+    create_access_token, create_refresh_token,
+    jwt_required, get_jwt, get_jwt_identity
 )
 
-jwt = JWTManager(app)
+# Ligados ao app em create_app (api/app_factory.py)
+jwt = CachingJWTManager()
+token_blocklist = TokenBlocklist()
+
+
+@jwt.token_in_blocklist_loader
+def is_token_revoked(jwt_header, jwt_payload):
+    return token_blocklist.is_revoked(jwt_payload['jti'])
+
 
 if __name__ == '__main__':
-    with app.app_context():
+    from api.app_factory import create_app
+
+    with create_app().app_context():
         db.create_all()
-        print("Banco de dados criado!")
\ No newline at end of file
+        print("Banco de dados criado!")
@@ -0,0 +1,50 @@
+import time
+
+from flask import current_app
+from flask_jwt_extended import JWTManager
+
+from infrastructure.cache.ttl_cache import TTLCache
+
+# Caminho rápido da verificação de JWT.
+# O Flask-JWT-Extended decodifica o token e confere a assinatura em toda requisição protegida.
+# Aqui os tokens já verificados ficam em um cache LRU até expirarem (claim exp), e a mesma
+# string de token volta a ser aceita sem nova verificação. A chave do cache é o token inteiro,
+# e não apenas o jti: antes da verificação o jti é um valor controlado pelo cliente.
+# A checagem da lista de revogação (token_in_blocklist_loader) continua rodando em toda requisição.
+
+
+class CachingJWTManager(JWTManager):
+    """
+    JWTManager com cache dos tokens já verificados.
+
+    Configuração:
+        JWT_VERIFIED_CACHE_SIZE (int): Quantidade máxima de tokens no cache; 0 desliga o cache.
+        JWT_VERIFIED_CACHE_TTL (int): Tempo máximo de cada entrada, em segundos (nunca além do exp do token).
+    """
+
+    def init_app(self, app, add_context_processor=False):
+        super().init_app(app, add_context_processor)
+
+        size = app.config.get('JWT_VERIFIED_CACHE_SIZE', 1024)
+        app.extensions['jwt_verified_tokens'] = (
+            TTLCache(maxsize=size, ttl=app.config.get('JWT_VERIFIED_CACHE_TTL', 300)) if size > 0 else None
+        )
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        cache = current_app.extensions.get('jwt_verified_tokens')
+        if cache is None or csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        claims = cache.get(encoded_token)
+        if claims is None:
+            # Token desconhecido, inválido ou expirado: verificação completa (que gera os erros de costume)
+            claims = super()._decode_jwt_from_config(encoded_token)
+
+            ttl = cache.ttl
+            if 'exp' in claims:
+                ttl = min(ttl, claims['exp'] - time.time())
+            if ttl > 0:
+                cache.set(encoded_token, claims, ttl=ttl)
+
+        # Cópia, para que alterações feitas pela view não afetem o cache
+        return dict(claims)
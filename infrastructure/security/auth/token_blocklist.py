@@ -0,0 +1,185 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert
+
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+
+# Lista de tokens JWT revogados (POST /logout), consultada pelo token_in_blocklist_loader.
+# A consulta é sempre feita em um dicionário em memória (jti -> exp). Com JWT_BLOCKLIST = 'sqlite'
+# ou 'redis' as revogações também são gravadas no backend, carregadas na inicialização e
+# sincronizadas entre os workers a cada JWT_BLOCKLIST_SYNC_SECONDS.
+# Revogações de tokens já expirados são descartadas (da memória e do backend) a cada
+# JWT_BLOCKLIST_PRUNE_SECONDS: um token expirado é recusado de qualquer forma.
+
+# Folga na leitura incremental, para não perder revogações gravadas durante a sincronização anterior
+SYNC_MARGIN_SECONDS = 5
+
+
+class SQLiteBlocklistBackend:
+    """
+    Revogações na tabela revoked_token do banco da aplicação.
+    Usa conexões próprias do engine principal, fora da sessão da requisição (e da réplica de leitura).
+    """
+
+    def add(self, jti, expires_at, revoked_at):
+        RevokedToken = ConfigSQLAlchemy.RevokedToken
+        with db.engine.begin() as connection:
+            connection.execute(
+                insert(RevokedToken.__table__)
+                .values(jti=jti, expires_at=_to_datetime(expires_at), revoked_at=_to_datetime(revoked_at))
+                .on_conflict_do_nothing()
+            )
+
+    def load(self, since):
+        RevokedToken = ConfigSQLAlchemy.RevokedToken
+        query = select(RevokedToken.jti, RevokedToken.expires_at)
+        if since is not None:
+            query = query.where(RevokedToken.revoked_at >= _to_datetime(since))
+
+        with db.engine.connect() as connection:
+            rows = connection.execute(query).all()
+        return [(jti, _to_timestamp(expires_at)) for jti, expires_at in rows]
+
+    def prune(self, now):
+        RevokedToken = ConfigSQLAlchemy.RevokedToken
+        with db.engine.begin() as connection:
+            connection.execute(delete(RevokedToken.__table__).where(RevokedToken.expires_at <= _to_datetime(now)))
+
+
+class RedisBlocklistBackend:
+    """
+    Revogações em um sorted set do Redis (membro 'jti:exp', score = momento da revogação).
+
+    Args:
+        client (redis.Redis): Cliente Redis.
+        retention (float): Tempo, em segundos, que uma revogação é mantida (a validade do refresh token).
+        key (str): Chave do sorted set.
+    """
+
+    def __init__(self, client, retention, key='jwt_blocklist'):
+        self.client = client
+        self.retention = retention
+        self.key = key
+
+    def add(self, jti, expires_at, revoked_at):
+        pipeline = self.client.pipeline()
+        pipeline.zadd(self.key, {f'{jti}:{expires_at}': revoked_at})
+        pipeline.zremrangebyscore(self.key, '-inf', revoked_at - self.retention)
+        pipeline.execute()
+
+    def load(self, since):
+        members = self.client.zrangebyscore(self.key, since if since is not None else '-inf', '+inf')
+        revoked = []
+        for member in members:
+            jti, _, expires_at = member.decode().rpartition(':')
+            revoked.append((jti, float(expires_at)))
+        return revoked
+
+    def prune(self, now):
+        # O score é o momento da revogação: depois da retenção, o token certamente já expirou
+        self.client.zremrangebyscore(self.key, '-inf', now - self.retention)
+
+
+class TokenBlocklist:
+    """
+    Lista de revogação dos tokens JWT.
+
+    Methods:
+        revoke(jti, expires_at):
+            Revoga o token (até a sua expiração).
+        is_revoked(jti):
+            Indica se o token foi revogado.
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.sync_interval = 5
+        self.prune_interval = 60
+        self._revoked = {}
+        self._last_sync = None
+        self._synced_at = None
+        self._next_prune = 0.0
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        kind = app.config.get('JWT_BLOCKLIST', 'memory')
+
+        if kind == 'memory':
+            self.backend = None
+        elif kind == 'sqlite':
+            self.backend = SQLiteBlocklistBackend()
+        elif kind == 'redis':
+            import redis  # Dependência opcional, necessária apenas com JWT_BLOCKLIST = 'redis'
+
+            refresh_expires = app.config.get('JWT_REFRESH_TOKEN_EXPIRES')
+            self.backend = RedisBlocklistBackend(
+                redis.Redis.from_url(app.config['JWT_BLOCKLIST_REDIS_URL']),
+                retention=refresh_expires.total_seconds() if refresh_expires else 30 * 86400
+            )
+        else:
+            raise ValueError(f"JWT_BLOCKLIST não suportado: {kind}")
+
+        self.sync_interval = app.config.get('JWT_BLOCKLIST_SYNC_SECONDS', 5)
+        self.prune_interval = app.config.get('JWT_BLOCKLIST_PRUNE_SECONDS', 60)
+        app.extensions['token_blocklist'] = self
+
+    def revoke(self, jti, expires_at):
+        """
+        Args:
+            jti (str): Identificador do token (claim jti).
+            expires_at (float): Expiração do token (claim exp); depois dela a revogação pode ser descartada.
+        """
+        now = time.time()
+        with self._lock:
+            self._revoked[jti] = expires_at
+        if self.backend is not None:
+            self.backend.add(jti, expires_at, now)
+        self._prune_expired()
+
+    def is_revoked(self, jti):
+        if self.backend is not None and (
+            self._last_sync is None or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self._sync()
+        self._prune_expired()
+        return jti in self._revoked
+
+    def _prune_expired(self):
+        if time.monotonic() < self._next_prune:
+            return
+
+        now = time.time()
+        with self._lock:
+            if time.monotonic() < self._next_prune:
+                return  # Outra thread acabou de descartar
+            self._next_prune = time.monotonic() + self.prune_interval
+            self._revoked = {jti: expires_at for jti, expires_at in self._revoked.items() if expires_at > now}
+
+        if self.backend is not None:
+            self.backend.prune(now)
+
+    def _sync(self):
+        now = time.time()
+        since = self._synced_at - SYNC_MARGIN_SECONDS if self._synced_at is not None else None
+        revoked = self.backend.load(since)
+
+        with self._lock:
+            self._revoked.update(revoked)
+            # Tokens já expirados são recusados de qualquer forma: não precisam continuar na lista
+            self._revoked = {jti: expires_at for jti, expires_at in self._revoked.items() if expires_at > now}
+            self._synced_at = now
+            self._last_sync = time.monotonic()
+
+
+def _to_datetime(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def _to_timestamp(value):
+    return value.replace(tzinfo=timezone.utc).timestamp()
@@ -0,0 +1,57 @@
+import hmac
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# Hash de senhas usando as funções do Werkzeug (já instalado com o Flask).
+# O método define o algoritmo e o custo, no formato do Werkzeug:
+#   'scrypt:32768:8:1'       -> scrypt com N=32768, r=8, p=1
+#   'pbkdf2:sha256:600000'   -> PBKDF2-SHA256 com 600000 iterações
+# Aumentar o custo deixa a verificação mais lenta (e o ataque de força bruta também).
+
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+HASH_PREFIXES = ('scrypt:', 'pbkdf2:')
+
+
+def hash_password(password, method=DEFAULT_METHOD, salt_length=16):
+    """
+    Gera o hash de uma senha.
+
+    Args:
+        password (str): Senha em texto plano.
+        method (str): Algoritmo e custo (ex.: 'scrypt:32768:8:1').
+        salt_length (int): Tamanho do salt.
+
+    Returns:
+        str: Hash no formato 'metodo$salt$hash'.
+    """
+    return generate_password_hash(password, method=method, salt_length=salt_length)
+
+
+def is_password_hash(stored):
+    return stored.startswith(HASH_PREFIXES) and stored.count('$') == 2
+
+
+def verify_password(stored, password):
+    """
+    Verifica uma senha contra o valor armazenado.
+    Senhas antigas, gravadas em texto plano, ainda são aceitas para que possam ser migradas no login.
+
+    Args:
+        stored (str): Hash armazenado (ou senha em texto plano de cadastros antigos).
+        password (str): Senha informada.
+
+    Returns:
+        bool: True se a senha estiver correta.
+    """
+    if is_password_hash(stored):
+        return check_password_hash(stored, password)
+
+    return hmac.compare_digest(stored.encode(), password.encode())
+
+
+def needs_rehash(stored, method=DEFAULT_METHOD):
+    """
+    Indica se o valor armazenado deve ser substituído por um hash com o método atual
+    (senha em texto plano ou hash gerado com outro algoritmo/custo).
+    """
+    return not is_password_hash(stored) or stored.split('$', 1)[0] != method
@@ -0,0 +1,236 @@
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, jsonify, request
+
+# Limite de requisições por cliente (token bucket) para os endpoints caros: /login e /register
+# (consulta ao banco e hash da senha) e o scraping (busca externa).
+# Cada limite de RATE_LIMITS é (requisições, segundos): o balde comporta `requisições` de uma vez
+# (rajada) e é reabastecido continuamente na taxa requisições/segundos. Sem ficha disponível, a
+# requisição é recusada na hora com 429 e Retry-After, sem chegar à view.
+# Uma requisição pode custar mais de uma ficha (ex.: POST /scrape/titles custa uma por URL), limitado
+# à capacidade do balde para que ela ainda possa ser atendida com o balde cheio.
+#
+# Armazenamento dos baldes (RATE_LIMIT_STORAGE):
+#   'memory': por processo, com descarte LRU (cada worker aplica o limite separadamente)
+#   'sqlite': arquivo compartilhado por todos os workers (RATE_LIMIT_DATABASE_PATH)
+#   'redis':  compartilhado entre servidores (RATE_LIMIT_REDIS_URL)
+
+
+def take_token(tokens, updated_at, now, rate, capacity, cost=1):
+    """
+    Reabastece o balde pelo tempo decorrido e tenta consumir `cost` fichas.
+
+    Returns:
+        tuple: (fichas restantes, segundos até haver fichas suficientes; 0 se a requisição foi aceita)
+    """
+    tokens = min(capacity, tokens + max(now - updated_at, 0) * rate)
+    if tokens >= cost:
+        return tokens - cost, 0.0
+    return tokens, (cost - tokens) / rate
+
+
+class MemoryBucketStore:
+    """
+    Baldes em memória do processo. Baldes esquecidos pelo LRU voltam cheios, o que só afrouxa o limite.
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, capacity, cost=1):
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (capacity, now))
+            tokens, retry_after = take_token(tokens, updated_at, now, rate, capacity, cost)
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+
+class SQLiteBucketStore:
+    """
+    Baldes em um arquivo SQLite compartilhado entre processos (mesmo esquema de conexões de
+    SQLiteItemRepository: uma conexão por thread, modo WAL e BEGIN IMMEDIATE em cada atualização).
+    Os baldes que já estariam cheios são apagados de tempos em tempos.
+
+    Args:
+        path (str): Caminho do arquivo do banco.
+        busy_timeout (int): Tempo máximo de espera por um lock de escrita, em milissegundos.
+        cleanup_every (int): A cada quantas atualizações os baldes cheios são apagados.
+    """
+
+    def __init__(self, path, busy_timeout=5000, cleanup_every=1000):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.cleanup_every = cleanup_every
+        self._local = threading.local()
+        self._updates = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_bucket ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL, full_at REAL NOT NULL)"
+        )
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        # Conexões não podem ser herdadas por fork (ex.: gunicorn --preload): cada processo abre as suas
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout / 1000, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(f'PRAGMA busy_timeout={int(self.busy_timeout)}')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def take(self, key, rate, capacity, cost=1):
+        # Relógio de parede: os processos precisam da mesma referência de tempo
+        now = time.time()
+        connection = self._connection()
+
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = connection.execute(
+                "SELECT tokens, updated_at FROM rate_limit_bucket WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated_at = row or (capacity, now)
+            tokens, retry_after = take_token(tokens, updated_at, now, rate, capacity, cost)
+            connection.execute(
+                "INSERT OR REPLACE INTO rate_limit_bucket (key, tokens, updated_at, full_at) VALUES (?, ?, ?, ?)",
+                (key, tokens, now, now + (capacity - tokens) / rate)
+            )
+
+            self._updates += 1
+            if self._updates % self.cleanup_every == 0:
+                connection.execute("DELETE FROM rate_limit_bucket WHERE full_at < ?", (now,))
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+        return retry_after
+
+
+class RedisBucketStore:
+    """
+    Baldes em hashes do Redis, atualizados por um script Lua (leitura e gravação atômicas).
+    Cada chave expira quando o balde estaria cheio de novo.
+
+    Args:
+        client (redis.Redis): Cliente Redis.
+        prefix (str): Prefixo das chaves.
+    """
+
+    SCRIPT = """
+    local rate, capacity, now, cost = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated_at = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(now - updated_at, 0) * rate)
+    local retry_after = 0
+    if tokens >= cost then
+        tokens = tokens - cost
+    else
+        retry_after = (cost - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+    return tostring(retry_after)
+    """
+
+    def __init__(self, client, prefix='rate_limit:'):
+        self.prefix = prefix
+        self._script = client.register_script(self.SCRIPT)
+
+    def take(self, key, rate, capacity, cost=1):
+        return float(self._script(keys=[self.prefix + key], args=[rate, capacity, time.time(), cost]))
+
+
+def client_ip():
+    # Atrás de um proxy reverso, use o ProxyFix do Werkzeug para que remote_addr seja o IP do cliente
+    return request.remote_addr or 'unknown'
+
+
+class RateLimiter:
+    """
+    Extensão que aplica os limites de RATE_LIMITS.
+
+    Methods:
+        init_app(app):
+            Cria o armazenamento dos baldes conforme RATE_LIMIT_STORAGE.
+        limit(name, key_func=client_ip, cost_func=None):
+            Decorador que recusa com 429 as requisições acima do limite `name`.
+        hit(name, key, config=None, cost=1):
+            Consome `cost` fichas do limite `name` para o cliente `key` e retorna o Retry-After (0 se aceita).
+            `config` permite o uso fora de um contexto do Flask (ex.: handlers ASGI).
+    """
+
+    def __init__(self, app=None):
+        self.store = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        storage = app.config.get('RATE_LIMIT_STORAGE', 'memory')
+
+        if storage == 'memory':
+            self.store = MemoryBucketStore(app.config.get('RATE_LIMIT_MAX_KEYS', 10000))
+        elif storage == 'sqlite':
+            self.store = SQLiteBucketStore(app.config['RATE_LIMIT_DATABASE_PATH'])
+        elif storage == 'redis':
+            import redis  # Dependência opcional, necessária apenas com RATE_LIMIT_STORAGE = 'redis'
+
+            self.store = RedisBucketStore(redis.Redis.from_url(app.config['RATE_LIMIT_REDIS_URL']))
+        else:
+            raise ValueError(f"RATE_LIMIT_STORAGE não suportado: {storage}")
+
+        app.extensions['rate_limiter'] = self
+
+    def hit(self, name, key, config=None, cost=1):
+        config = config or current_app.config
+        limit = config.get('RATE_LIMITS', {}).get(name)
+        if not config.get('RATE_LIMIT_ENABLED', True) or not limit:
+            return 0.0
+
+        requests_allowed, period = limit
+        cost = min(max(cost, 1), requests_allowed)
+        return self.store.take(f'{name}:{key}', requests_allowed / period, requests_allowed, cost)
+
+    def limit(self, name, key_func=client_ip, cost_func=None):
+        """
+        Args:
+            name (str): Nome do limite em RATE_LIMITS (ex.: 'login').
+            key_func (callable): Identifica o cliente; por padrão, o IP.
+            cost_func (callable): Opcional. Retorna quantas fichas a requisição consome (padrão: 1).
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                cost = cost_func() if cost_func is not None else 1
+                retry_after = self.hit(name, key_func(), cost=cost)
+                if retry_after > 0:
+                    return too_many_requests(retry_after)
+                return view(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+def too_many_requests(retry_after):
+    response = jsonify({"error": "Too many requests"})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(max(math.ceil(retry_after), 1))
+    return response
@@ -0,0 +1,5 @@
+from infrastructure.security.rate_limit import RateLimiter
+
+# Instância única do limitador de requisições, configurada a partir do app (RATE_LIMIT_*)
+# em create_app (api/app_factory.py)
+rate_limiter = RateLimiter()
@@ -0,0 +1,6 @@
+import os
+
+# Perfil de configuração ativo. Por padrão é o config_app_local; para usar outro perfil:
+#   APP_CONFIG=infrastructure.config_app_production python -m api.recipes_api
+# Os módulos leem a configuração do app (create_app), e não deste perfil diretamente
+CONFIG_MODULE = os.environ.get('APP_CONFIG', 'infrastructure.config_app_local')
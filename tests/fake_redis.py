@@ -0,0 +1,50 @@
+import threading
+import time
+
+
+class FakeRedis:
+    """
+    Substituto do Redis em memória para os testes, com a parte da interface do redis-py usada
+    pelo RedisCacheBackend: get, set (com ex), incr e delete. Os valores são devolvidos em bytes.
+
+    Args:
+        clock (callable): Relógio usado na expiração das chaves (permite avançar o tempo nos testes).
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._get(key)
+
+    def set(self, key, value, ex=None):
+        if isinstance(value, str):
+            value = value.encode()
+        with self._lock:
+            self._data[key] = (value, self.clock() + ex if ex else None)
+        return True
+
+    def incr(self, key, amount=1):
+        with self._lock:
+            value = int(self._get(key) or 0) + amount
+            _, expires_at = self._data.get(key, (None, None))
+            self._data[key] = (str(value).encode(), expires_at)
+            return value
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def keys(self):
+        with self._lock:
+            return [key for key in list(self._data) if self._get(key) is not None]
+
+    def _get(self, key):
+        value, expires_at = self._data.get(key, (None, None))
+        if expires_at is not None and self.clock() >= expires_at:
+            del self._data[key]
+            return None
+        return value
@@ -0,0 +1,71 @@
+import asyncio
+import gzip
+import zlib
+
+from flask import Flask, Response
+
+from infrastructure.compression.compression import (ASGICompressionMiddleware, Compression, GzipCompressor,
+                                                    StreamCompressor)
+
+LINES = [b'{"id": %d, "title": "Receita %d", "ingredients": ["farinha", "ovos"]}\n' % (i, i) for i in range(10000)]
+CONFIG = {
+    'COMPRESSION_ALGORITHMS': ['gzip'], 'COMPRESSION_GZIP_LEVEL': 6, 'COMPRESSION_MIN_SIZE': 500,
+    'COMPRESSION_MIMETYPES': ['application/x-ndjson'], 'COMPRESSION_STREAM_FLUSH_SIZE': 32 * 1024,
+    'COMPRESSION_STREAM_FLUSH_SECONDS': 60,
+}
+
+
+def one_shot_size():
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return len(compressor.compress(b''.join(LINES)) + compressor.flush())
+
+
+def test_streamed_response_is_flushed_in_blocks():
+    app = Flask(__name__)
+    app.config.update(CONFIG)
+    Compression(app)
+
+    @app.route('/export')
+    def export():
+        return Response(iter(LINES), mimetype='application/x-ndjson')
+
+    response = app.test_client().get('/export', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.data) == b''.join(LINES)
+    # Um flush por linha quase dobraria o tamanho; com os blocos de 32 KB, fica perto do one-shot
+    assert len(response.data) < one_shot_size() * 1.05
+
+
+def test_stream_compressor_flushes_by_size_and_interval():
+    compressor = StreamCompressor(GzipCompressor(6), flush_size=len(LINES[0]) * 3, flush_seconds=60)
+    outputs = [compressor.compress(line) for line in LINES[:6]]
+
+    # O gzip só devolve o cabeçalho antes do primeiro flush; o flush sai na 3ª e na 6ª linha
+    assert [len(data) > 10 for data in outputs] == [False, False, True, False, False, True]
+
+    compressor = StreamCompressor(GzipCompressor(6), flush_size=10 ** 9, flush_seconds=0)
+    decompressor = zlib.decompressobj(31)
+    assert decompressor.decompress(compressor.compress(LINES[0])) == LINES[0]
+
+
+def test_asgi_stream_is_flushed_in_blocks():
+    async def stream_app(scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'application/x-ndjson')]})
+        for line in LINES:
+            await send({'type': 'http.response.body', 'body': line, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {'type': 'http', 'method': 'GET', 'headers': [(b'accept-encoding', b'gzip')]}
+    asyncio.run(ASGICompressionMiddleware(stream_app, CONFIG)(scope, None, send))
+
+    assert (b'content-encoding', b'gzip') in messages[0]['headers']
+    body = b''.join(message['body'] for message in messages[1:])
+    assert gzip.decompress(body) == b''.join(LINES)
+    assert len(body) < one_shot_size() * 1.05
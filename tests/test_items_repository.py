@@ -0,0 +1,90 @@
+import base64
+
+import pytest
+
+from api.app_factory import create_app
+
+from infrastructure.repositories.items_repository import (BatchOperationError, InMemoryItemRepository,
+                                                            SQLiteItemRepository)
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def repository(request, tmp_path):
+    repository = InMemoryItemRepository() if request.param == 'memory' else SQLiteItemRepository(str(tmp_path / 'items.db'))
+    for item in (
+        {'nome': 'a', 'qty': 10, 'ativo': True},
+        {'nome': 'b', 'qty': 1, 'ativo': False, 'obs': None},
+        {'nome': 'c', 'qty': '10', 'ativo': 'true', 'preco': 10.0},
+    ):
+        repository.add(item)
+    return repository
+
+
+def names(repository, **filters):
+    return [item['nome'] for item in repository.list(filters=filters)]
+
+
+@pytest.mark.parametrize('filters, expected', [
+    ({'nome': 'a'}, ['a']),
+    ({'qty': '10'}, ['a', 'c']),
+    ({'qty': '1'}, ['b']),
+    ({'ativo': 'true'}, ['a', 'c']),
+    ({'ativo': 'false'}, ['b']),
+    ({'ativo': '1'}, []),
+    ({'obs': 'null'}, ['b']),
+    ({'preco': '10'}, ['c']),
+    ({'qty': 10}, ['a']),
+    ({'qty': '10', 'ativo': 'true'}, ['a', 'c']),
+])
+def test_query_string_filters_match_typed_fields(repository, filters, expected):
+    assert names(repository, **filters) == expected
+
+
+def test_failed_batch_marks_other_operations_as_not_applied(repository):
+    operations = [
+        {'op': 'create', 'item': {'nome': 'd'}},
+        {'op': 'delete', 'id': 999},
+        {'op': 'delete', 'id': 1},
+    ]
+
+    with pytest.raises(BatchOperationError) as error:
+        repository.apply_batch(operations)
+
+    assert [result['status'] for result in error.value.results] == [424, 404, 424]
+    assert 'item' not in error.value.results[0]
+    assert names(repository) == ['a', 'b', 'c']
+
+
+@pytest.mark.parametrize('patch', [
+    {'n': {'y': {'z': None}}, 'm': {'q': None}},
+    {'nome': {'x': 1, 'y': None}},
+    {'qty': None, 'tags': {'a': {'b': None, 'c': [None]}}},
+])
+def test_merge_patch_is_the_same_in_both_backends(tmp_path, patch):
+    repositories = [InMemoryItemRepository(), SQLiteItemRepository(str(tmp_path / 'items.db'))]
+    for repository in repositories:
+        repository.add({'nome': 'a', 'qty': 10, 'n': {'x': 1}})
+
+    memory, sqlite = [repository.patch(1, patch) for repository in repositories]
+
+    assert memory == sqlite
+
+
+@pytest.fixture
+def items_client(tmp_path):
+    app = create_app(
+        blueprints=['items'], SWAGGER_ENABLED=False, RATE_LIMIT_ENABLED=False, METRICS_ENABLED=False,
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}"
+    )
+    credentials = base64.b64encode(b'user1:password1').decode()
+    return app.test_client(), {'Authorization': f'Basic {credentials}'}
+
+
+@pytest.mark.parametrize('body', [[1], 'x'])
+def test_batch_rejects_non_object_body(items_client, body):
+    http, headers = items_client
+
+    response = http.post('/items:batch', json=body, headers=headers)
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "operations must be a non-empty list"}
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+from flask import Flask
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+
+from api.app_factory import create_app
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+from infrastructure.database.migrations import upgrade
+from infrastructure.json_provider import dumps_rows, init_json_provider
+
+FIELDS = ['id', 'title', 'ingredients']
+ROWS = [(1, 'Pão de queijo', '["polvilho", "queijo"]', 99), (2, 'Bolo "fofo" 100%', '[]', 99)]
+
+
+@pytest.fixture(params=['stdlib', 'orjson', 'msgspec'])
+def provider(request):
+    if request.param != 'stdlib':
+        pytest.importorskip(request.param)
+    app = Flask(__name__)
+    app.config['JSON_PROVIDER'] = request.param
+    init_json_provider(app)
+    return app.json
+
+
+@pytest.mark.parametrize('sort_keys', [False, True])
+def test_dumps_rows_matches_dicts(provider, sort_keys):
+    provider.sort_keys = sort_keys
+
+    body = dumps_rows(provider, ROWS, FIELDS, raw_fields={'ingredients'})
+
+    assert json.loads(body) == [
+        {'id': 1, 'title': 'Pão de queijo', 'ingredients': ['polvilho', 'queijo']},
+        {'id': 2, 'title': 'Bolo "fofo" 100%', 'ingredients': []},
+    ]
+    keys = list(json.loads(body)[0])
+    assert keys == (sorted(FIELDS) if sort_keys else FIELDS)
+    assert dumps_rows(provider, [], FIELDS) == b'[]'
+
+
+def test_msgspec_provider():
+    pytest.importorskip('msgspec')
+    app = Flask(__name__)
+    app.config['JSON_PROVIDER'] = 'msgspec'
+    init_json_provider(app)
+
+    assert app.json.loads(app.json.dumps({'a': [1, 'ç']})) == {'a': [1, 'ç']}
+    with pytest.raises(ValueError):
+        app.json.loads('{')
+    with app.app_context():
+        response = app.json.response({'ok': True})
+    assert response.mimetype == 'application/json'
+    assert json.loads(response.get_data()) == {'ok': True}
+
+
+@pytest.mark.parametrize('json_provider', ['stdlib', 'orjson', 'msgspec'])
+def test_get_recipes_serializes_rows(tmp_path, json_provider):
+    if json_provider != 'stdlib':
+        pytest.importorskip(json_provider)
+    app = create_app(
+        blueprints=['auth', 'recipes'], SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}",
+        JSON_PROVIDER=json_provider, SWAGGER_ENABLED=False, CACHE_TYPE='null', RATE_LIMIT_ENABLED=False,
+        METRICS_ENABLED=False
+    )
+    with app.app_context():
+        upgrade()
+        db.session.execute(insert(ConfigSQLAlchemy.Recipe), [
+            {'id': 1, 'title': 'Pão de queijo', 'time_minutes': 40, 'ingredients': ['polvilho', 'queijo']},
+            {'id': 2, 'title': 'Café', 'time_minutes': 5, 'ingredients': ['café', 'água']},
+        ])
+        db.session.commit()
+        headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+    http = app.test_client()
+
+    response = http.get('/recipes?limit=1&fields=title,ingredients', headers=headers)
+
+    assert response.mimetype == 'application/json'
+    assert response.get_json() == {
+        'recipes': [{'id': 1, 'title': 'Pão de queijo', 'ingredients': ['polvilho', 'queijo']}],
+        'next_cursor': 1,
+    }
+    assert http.get('/recipes?cursor=1', headers=headers).get_json() == {
+        'recipes': [{'id': 2, 'title': 'Café', 'time_minutes': 5, 'ingredients': ['café', 'água']}],
+        'next_cursor': None,
+    }
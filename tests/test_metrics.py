@@ -0,0 +1,69 @@
+from flask import Response, stream_with_context
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from api.app_factory import create_app
+from infrastructure.database.flask_sqlalchemyinit import db
+
+
+def make_app(tmp_path, **config):
+    app = create_app(
+        blueprints=['auth'], SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}", SWAGGER_ENABLED=False,
+        **config
+    )
+
+    @app.route('/plain')
+    def plain():
+        return {'ok': True}
+
+    @app.route('/failing-query')
+    def failing_query():
+        try:
+            db.session.execute(text('SELECT * FROM missing_table'))
+        except OperationalError:
+            db.session.rollback()
+        db.session.execute(text('SELECT 1'))
+        return {'ok': True}
+
+    @app.route('/stream')
+    def stream():
+        return Response(stream_with_context(iter([b'a\n', b'b\n'])), mimetype='application/x-ndjson')
+
+    return app
+
+
+def test_metrics_requires_token(tmp_path):
+    http = make_app(tmp_path, METRICS_TOKEN='secret').test_client()
+
+    assert http.get('/metrics').status_code == 401
+    assert http.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    response = http.get('/metrics', headers={'Authorization': 'Bearer secret'})
+    assert response.status_code == 200
+    assert b'http_request_duration_seconds' in response.data
+
+
+def test_metrics_endpoint_can_be_disabled(tmp_path):
+    http = make_app(tmp_path, METRICS_ENDPOINT=None).test_client()
+
+    assert http.get('/metrics').status_code == 404
+
+
+def test_server_timing_is_skipped_on_streamed_responses(tmp_path):
+    http = make_app(tmp_path, SERVER_TIMING_ENABLED=True).test_client()
+
+    assert 'app;dur=' in http.get('/plain').headers['Server-Timing']
+    response = http.get('/stream')
+    assert response.data == b'a\nb\n'
+    assert 'Server-Timing' not in response.headers
+
+
+def test_failed_query_is_timed_and_leaves_nothing_on_the_connection(tmp_path):
+    app = make_app(tmp_path, SERVER_TIMING_ENABLED=True)
+    http = app.test_client()
+
+    for _ in range(2):
+        response = http.get('/failing-query')
+        assert 'desc="2 queries"' in response.headers['Server-Timing']
+
+    with app.app_context(), db.engine.connect() as connection:
+        assert 'query_start' not in connection.info
@@ -0,0 +1,70 @@
+from flask_jwt_extended import create_access_token
+from sqlalchemy import select, text
+
+from api.app_factory import create_app
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+from infrastructure.database.migrations import convert_recipe_ingredients, upgrade
+
+
+def test_convert_recipe_ingredients_skips_only_json_lists(tmp_path):
+    app = create_app(
+        blueprints=['auth', 'recipes'], SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}",
+        SWAGGER_ENABLED=False, CACHE_TYPE='null', RATE_LIMIT_ENABLED=False, METRICS_ENABLED=False
+    )
+    with app.app_context():
+        upgrade()
+        # Valores gravados antes da coluna JSON, direto em SQL
+        db.session.execute(text(
+            "INSERT INTO recipe (id, title, ingredients, time_minutes, updated_at) VALUES "
+            "(1, 'Molho', '[sic] tomate, Sal', 10, '2024-01-01 00:00:00'), "
+            "(2, 'Pão', 'Farinha,  Água ', 60, '2024-01-01 00:00:00'), "
+            "(3, 'Bolo', '[\"ovos\", \"Leite\"]', 40, '2024-01-01 00:00:00')"
+        ))
+        db.session.commit()
+
+        convert_recipe_ingredients(batch_size=1)
+
+        ingredients = db.session.execute(
+            select(ConfigSQLAlchemy.Recipe.id, ConfigSQLAlchemy.Recipe.ingredients).order_by(ConfigSQLAlchemy.Recipe.id)
+        ).all()
+        index = db.session.execute(
+            select(ConfigSQLAlchemy.RecipeIngredient.recipe_id, ConfigSQLAlchemy.RecipeIngredient.name)
+            .order_by(ConfigSQLAlchemy.RecipeIngredient.recipe_id, ConfigSQLAlchemy.RecipeIngredient.name)
+        ).all()
+        headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+
+    assert ingredients == [(1, ['[sic] tomate', 'sal']), (2, ['farinha', 'água']), (3, ['ovos', 'Leite'])]
+    # A receita 3 já era uma lista JSON: fica como estava, sem entradas novas no índice
+    assert index == [(1, '[sic] tomate'), (1, 'sal'), (2, 'farinha'), (2, 'água')]
+
+    response = app.test_client().get('/recipes', headers=headers)
+    assert response.status_code == 200
+    assert [recipe['ingredients'] for recipe in response.get_json()['recipes']] == [
+        ['[sic] tomate', 'sal'], ['farinha', 'água'], ['ovos', 'Leite']
+    ]
+
+
+def test_convert_recipe_ingredients_changes_the_etag(tmp_path):
+    app = create_app(
+        blueprints=['auth', 'recipes'], SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}",
+        SWAGGER_ENABLED=False, RATE_LIMIT_ENABLED=False, METRICS_ENABLED=False
+    )
+    with app.app_context():
+        upgrade()
+        db.session.execute(text(
+            "INSERT INTO recipe (id, title, ingredients, time_minutes, updated_at) "
+            "VALUES (1, 'Molho', 'Tomate, Sal', 10, '2024-01-01 00:00:00')"
+        ))
+        db.session.commit()
+        headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+    http = app.test_client()
+    before = http.get('/recipes', headers=headers).headers['ETag']
+
+    with app.app_context():
+        upgrade()
+
+    response = http.get('/recipes', headers={**headers, 'If-None-Match': before})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != before
+    assert response.headers['X-Cache'] == 'MISS'
+    assert response.get_json()['recipes'][0]['ingredients'] == ['tomate', 'sal']
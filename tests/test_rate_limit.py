@@ -0,0 +1,42 @@
+import pytest
+from flask import Flask
+
+from infrastructure.security.rate_limit import MemoryBucketStore, RateLimiter, SQLiteBucketStore, take_token
+
+
+def test_take_token_with_cost():
+    assert take_token(10, 0, 0, rate=1, capacity=10, cost=4) == (6, 0.0)
+    assert take_token(3, 0, 0, rate=0.5, capacity=10, cost=4) == (3, 2.0)
+    # Reabastecido pelo tempo decorrido, sem passar da capacidade
+    assert take_token(3, 0, 100, rate=1, capacity=10, cost=4) == (6, 0.0)
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def limiter(request, tmp_path):
+    app = Flask(__name__)
+    app.config.update(
+        RATE_LIMITS={'scrape_title': (10, 3600)}, RATE_LIMIT_STORAGE=request.param,
+        RATE_LIMIT_DATABASE_PATH=str(tmp_path / 'rate_limit.db')
+    )
+    limiter = RateLimiter(app)
+    assert isinstance(limiter.store, MemoryBucketStore if request.param == 'memory' else SQLiteBucketStore)
+    return limiter, app.config
+
+
+def test_cost_consumes_several_tokens(limiter):
+    limiter, config = limiter
+
+    assert limiter.hit('scrape_title', 'user1', config, cost=6) == 0
+    retry_after = limiter.hit('scrape_title', 'user1', config, cost=6)
+
+    assert retry_after == pytest.approx(2 * 360, rel=0.01)
+    assert limiter.hit('scrape_title', 'user1', config, cost=4) == 0
+    assert limiter.hit('scrape_title', 'user2', config, cost=6) == 0
+
+
+def test_cost_is_capped_at_capacity(limiter):
+    limiter, config = limiter
+
+    # Um lote maior que o balde ainda é atendido com o balde cheio, e o esvazia
+    assert limiter.hit('scrape_title', 'user1', config, cost=50) == 0
+    assert limiter.hit('scrape_title', 'user1', config) > 0
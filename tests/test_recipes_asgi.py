@@ -0,0 +1,73 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from flask_jwt_extended import create_access_token
+from starlette.requests import Request
+
+import api.recipes_asgi as recipes_asgi
+from infrastructure.security.auth import flask_jwtextendedinit
+
+# Handlers async do modo ASGI chamados diretamente, com uma requisição do Starlette montada à mão
+
+
+def call(handler, method, path, body=b'', headers=None):
+    scope = {
+        'type': 'http', 'method': method, 'path': path, 'query_string': b'', 'client': ('127.0.0.1', 1000),
+        'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in (headers or {}).items()],
+    }
+
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    return asyncio.run(handler(Request(scope, receive)))
+
+
+@pytest.fixture
+def token():
+    with recipes_asgi.app.app_context():
+        return create_access_token(identity='1')
+
+
+def test_jwt_is_verified_outside_the_event_loop(token, monkeypatch):
+    threads = []
+
+    def is_revoked(jti):
+        threads.append(threading.get_ident())
+        return False
+
+    monkeypatch.setattr(flask_jwtextendedinit.token_blocklist, 'is_revoked', is_revoked)
+    event_loop_threads = []
+
+    async def handler(request):
+        event_loop_threads.append(threading.get_ident())
+        return recipes_asgi.AppJSONResponse({'identity': request.state.jwt_identity})
+
+    response = call(recipes_asgi.jwt_required_async(handler), 'GET', '/', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == 200
+    assert len(threads) == 1 and threads != event_loop_threads
+
+
+def test_invalid_token_keeps_flask_error_response():
+    response = call(recipes_asgi.create_recipe, 'POST', '/recipes', headers={'Authorization': 'Bearer x'})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize('handler, authenticated', [
+    (recipes_asgi.create_recipe, True),
+    (recipes_asgi.register_user, False),
+    (recipes_asgi.login, False),
+])
+@pytest.mark.parametrize('body', [b'{"title": ', b'\xff'])
+def test_malformed_json_body_returns_400(token, handler, authenticated, body):
+    headers = {'Content-Type': 'application/json'}
+    if authenticated:
+        headers['Authorization'] = f'Bearer {token}'
+
+    response = call(handler, 'POST', '/', body=body, headers=headers)
+
+    assert response.status_code == 400
+    assert json.loads(response.body) == {"message": "Invalid JSON body"}
@@ -0,0 +1,133 @@
+import sys
+import types
+
+import pytest
+from flask import Flask, jsonify
+
+from infrastructure.cache.response_cache import RedisCacheBackend, ResponseCache
+from tests.fake_redis import FakeRedis
+
+# Testes do backend Redis do cache de respostas, com o FakeRedis no lugar do servidor
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def client(clock):
+    return FakeRedis(clock=clock)
+
+
+def make_app(client, monkeypatch, **config):
+    # CACHE_TYPE = 'redis' cria o cliente com redis.Redis.from_url; aqui ele devolve o FakeRedis
+    fake_module = types.SimpleNamespace(Redis=types.SimpleNamespace(from_url=lambda url: client))
+    monkeypatch.setitem(sys.modules, 'redis', fake_module)
+
+    app = Flask(__name__)
+    app.config.update(CACHE_TYPE='redis', CACHE_REDIS_URL='redis://localhost:6379/0', CACHE_DEFAULT_TIMEOUT=60)
+    app.config.update(config)
+    cache = ResponseCache(app)
+    calls = []
+
+    @app.route('/recipes')
+    @cache.cached('recipes')
+    def recipes():
+        calls.append(1)
+        return jsonify({'calls': len(calls)})
+
+    return app, cache, calls
+
+
+def test_set_and_get(client):
+    backend = RedisCacheBackend(client, ttl=60, prefix='test_')
+
+    backend.set('recipes:0:/recipes:[]', (b'{"a": 1}\n{"b": 2}', 200, 'application/x-ndjson'))
+
+    assert backend.get('recipes:0:/recipes:[]') == (b'{"a": 1}\n{"b": 2}', 200, 'application/x-ndjson')
+    assert client.keys() == ['test_recipes:0:/recipes:[]']
+    assert backend.get('recipes:0:/recipes:[("limit", "10")]') is None
+
+
+def test_entries_expire_after_ttl(client, clock):
+    backend = RedisCacheBackend(client, ttl=60)
+    backend.set('key', (b'{}', 200, 'application/json'))
+
+    clock.now += 59
+    assert backend.get('key') is not None
+
+    clock.now += 1
+    assert backend.get('key') is None
+
+
+def test_bump_generation(client):
+    backend = RedisCacheBackend(client, ttl=60)
+    assert backend.generation('recipes') == 0
+
+    backend.bump_generation('recipes')
+    backend.bump_generation('recipes')
+
+    assert backend.generation('recipes') == 2
+    assert backend.generation('items') == 0
+
+
+def test_cached_view_uses_redis_backend(client, monkeypatch):
+    app, cache, calls = make_app(client, monkeypatch)
+    http = app.test_client()
+
+    first = http.get('/recipes?b=2&a=1')
+    second = http.get('/recipes?a=1&b=2')
+
+    assert isinstance(cache.backend, RedisCacheBackend)
+    assert (first.headers['X-Cache'], second.headers['X-Cache']) == ('MISS', 'HIT')
+    assert second.get_json() == first.get_json() == {'calls': 1}
+    assert second.mimetype == 'application/json'
+    assert cache.stats()['hits'] == 1
+
+
+def test_invalidate_bumps_generation(client, monkeypatch):
+    app, cache, calls = make_app(client, monkeypatch)
+    http = app.test_client()
+    http.get('/recipes')
+
+    cache.invalidate('recipes')
+    response = http.get('/recipes')
+
+    assert response.headers['X-Cache'] == 'MISS'
+    assert response.get_json() == {'calls': 2}
+    assert http.get('/recipes').headers['X-Cache'] == 'HIT'
+
+
+def test_invalidation_is_shared_between_processes(client, monkeypatch):
+    # Dois apps com o mesmo Redis fazem o papel de dois workers
+    app_a, cache_a, calls_a = make_app(client, monkeypatch)
+    app_b, cache_b, calls_b = make_app(client, monkeypatch)
+    app_a.test_client().get('/recipes')
+
+    assert app_b.test_client().get('/recipes').headers['X-Cache'] == 'HIT'
+
+    cache_a.invalidate('recipes')
+
+    assert app_b.test_client().get('/recipes').headers['X-Cache'] == 'MISS'
+    assert (len(calls_a), len(calls_b)) == (1, 1)
+
+
+def test_cached_response_expires(client, clock, monkeypatch):
+    app, cache, calls = make_app(client, monkeypatch, CACHE_DEFAULT_TIMEOUT=30)
+    http = app.test_client()
+    http.get('/recipes')
+
+    clock.now += 30
+
+    assert http.get('/recipes').headers['X-Cache'] == 'MISS'
+    assert len(calls) == 2
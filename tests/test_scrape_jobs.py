@@ -0,0 +1,85 @@
+import base64
+import threading
+import time
+from datetime import timedelta
+
+from sqlalchemy import insert, select
+
+from api.app_factory import create_app
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+from infrastructure.database.migrations import upgrade
+from usecases.scrape_jobs import DONE, FAILED, QUEUED, RUNNING, ScrapeJobQueue, _now
+
+
+def make_app(tmp_path, **config):
+    app = create_app(
+        blueprints=['scraping'], SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}", SWAGGER_ENABLED=False,
+        RATE_LIMIT_ENABLED=False, METRICS_ENABLED=False, SCRAPE_JOB_POLL_SECONDS=3600, **config
+    )
+    with app.app_context():
+        upgrade()
+    return app
+
+
+def test_claim_fails_exhausted_jobs_in_a_loop(tmp_path):
+    app = make_app(tmp_path, SCRAPE_JOB_MAX_ATTEMPTS=1)
+    table = ConfigSQLAlchemy.ScrapeJob.__table__
+    start = _now() - timedelta(hours=1)
+    jobs = [
+        {'id': f'old{index}', 'url': f'http://example.com/{index}', 'status': RUNNING, 'attempts': 1,
+         'created_at': start + timedelta(milliseconds=index), 'locked_until': start}
+        for index in range(5)
+    ]
+    jobs.append({'id': 'next', 'url': 'http://example.com/next', 'status': QUEUED, 'attempts': 0,
+                 'created_at': _now(), 'locked_until': None})
+
+    with app.app_context():
+        with db.engine.begin() as connection:
+            connection.execute(insert(table), jobs)
+
+        job = ScrapeJobQueue()._claim(app.config)
+
+        with db.engine.connect() as connection:
+            failed = connection.scalar(select(db.func.count()).select_from(table).where(table.c.status == FAILED))
+
+    assert (job.id, job.attempts) == ('next', 1)
+    assert failed == 5
+
+
+def test_run_starts_a_thread_when_workers_are_disabled(tmp_path):
+    app = make_app(tmp_path, SCRAPE_JOB_WORKERS=0)
+    queue = ScrapeJobQueue(app)
+    with app.app_context():
+        # Porta fechada: a busca falha na hora e o job termina como failed
+        job_id = queue.enqueue('http://127.0.0.1:1/')
+    runner = threading.Thread(target=queue.run, args=(app,), daemon=True)
+    runner.start()
+    try:
+        deadline = time.monotonic() + 10
+        with app.app_context():
+            while queue.get(job_id)['status'] not in (DONE, FAILED) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            status = queue.get(job_id)['status']
+
+        assert status == FAILED
+        assert len(queue._threads) == 1
+        # run() continua em primeiro plano, esperando novos jobs
+        assert runner.is_alive()
+    finally:
+        queue.stop(timeout=5)
+        runner.join(timeout=5)
+
+    assert not runner.is_alive()
+    assert queue._threads == []
+
+
+def test_create_job_rejects_non_object_body(tmp_path):
+    app = make_app(tmp_path)
+    credentials = base64.b64encode(b'user1:password1').decode()
+
+    response = app.test_client().post(
+        '/scrape/jobs', json=['http://example.com'], headers={'Authorization': f'Basic {credentials}'}
+    )
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "URL is required"}
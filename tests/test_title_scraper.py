@@ -0,0 +1,188 @@
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from flask import Flask
+
+from usecases.title_scraper import ScrapeCapacityExceeded, TitleScraper
+
+# Testes de fetch_title / fetch_titles contra um servidor HTTP local:
+#   /title?name=X&delay=S  -> página com <title>X</title>, respondida após S segundos
+#   /status?code=N         -> resposta com o status N
+# O parâmetro group separa a contagem de requisições simultâneas (max_active) de cada teste
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        group = query.get('group')
+        with server.lock:
+            server.active[group] += 1
+            server.max_active[group] = max(server.max_active[group], server.active[group])
+        try:
+            time.sleep(float(query.get('delay', 0)))
+
+            if url.path == '/status':
+                self._send(int(query['code']), b'')
+            else:
+                self._send(200, f"<html><head><title>{query.get('name', '')}</title></head></html>".encode())
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # O cliente desistiu (timeout) antes da resposta
+        finally:
+            with server.lock:
+                server.active[group] -= 1
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.active = Counter()
+    server.max_active = Counter()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def base_url(stub):
+    return f'http://127.0.0.1:{stub.server_port}'
+
+
+def make_scraper(**overrides):
+    app = Flask(__name__)
+    app.config.from_object('infrastructure.config_app_local')
+    app.config.update(SCRAPE_HTTP_CACHE=None, SCRAPE_RETRIES=0, SCRAPE_CONNECT_TIMEOUT=1, SCRAPE_READ_TIMEOUT=2)
+    app.config.update(overrides)
+    return TitleScraper(app)
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def free_slots(semaphore):
+    acquired = 0
+    while semaphore.acquire(blocking=False):
+        acquired += 1
+    for _ in range(acquired):
+        semaphore.release()
+    return acquired
+
+
+def test_results_keep_request_order(base_url):
+    scraper = make_scraper()
+    urls = [f'{base_url}/title?name=t{i}&delay={0.2 - i * 0.05:.2f}' for i in range(4)]
+
+    results = scraper.fetch_titles(urls)
+
+    assert [result['url'] for result in results] == urls
+    assert [result['title'] for result in results] == ['t0', 't1', 't2', 't3']
+
+
+def test_http_error_is_reported_per_url(base_url):
+    scraper = make_scraper()
+
+    results = scraper.fetch_titles([f'{base_url}/status?code=404', f'{base_url}/title?name=ok'])
+
+    assert '404' in results[0]['error']
+    assert 'title' not in results[0]
+    assert results[1] == {'url': f'{base_url}/title?name=ok', 'title': 'ok'}
+
+
+def test_read_timeout_is_reported_per_url(base_url):
+    scraper = make_scraper(SCRAPE_READ_TIMEOUT=0.2)
+
+    started_at = time.monotonic()
+    results = scraper.fetch_titles([f'{base_url}/title?name=slow&delay=1', f'{base_url}/title?name=fast'])
+
+    assert time.monotonic() - started_at < 0.9
+    assert 'timed out' in results[0]['error']
+    assert results[1]['title'] == 'fast'
+
+
+def test_batch_deadline(base_url):
+    scraper = make_scraper(SCRAPE_READ_TIMEOUT=5)
+
+    started_at = time.monotonic()
+    results = scraper.fetch_titles(
+        [f'{base_url}/title?name=slow&delay=2', f'{base_url}/title?name=fast'], deadline_seconds=0.5
+    )
+
+    assert time.monotonic() - started_at < 1.5
+    assert results[0]['error'] == 'Prazo total do lote excedido' or 'timed out' in results[0]['error']
+    assert results[1]['title'] == 'fast'
+
+
+def test_per_host_limit(base_url, stub):
+    scraper = make_scraper(SCRAPE_PER_HOST_LIMIT=2)
+
+    results = scraper.fetch_titles([f'{base_url}/title?name=t{i}&delay=0.2&group=host' for i in range(6)])
+
+    assert all('title' in result for result in results)
+    assert stub.max_active['host'] == 2
+
+
+def test_per_host_limit_is_not_shared_between_hosts(stub):
+    scraper = make_scraper(SCRAPE_PER_HOST_LIMIT=1)
+    urls = [
+        f'http://{host}:{stub.server_port}/title?name=t&delay=0.3&group=hosts' for host in ('127.0.0.1', 'localhost')
+    ]
+
+    results = scraper.fetch_titles(urls)
+
+    assert all('title' in result for result in results)
+    assert stub.max_active['hosts'] == 2
+
+
+def test_semaphores_are_released(base_url):
+    scraper = make_scraper(SCRAPE_MAX_CONCURRENT_FETCHES=4, SCRAPE_PER_HOST_LIMIT=2, SCRAPE_READ_TIMEOUT=0.3)
+    urls = [
+        f'{base_url}/title?name=ok',
+        f'{base_url}/status?code=500',
+        f'{base_url}/title?name=timeout&delay=1',
+        f'{base_url}/title?name=late&delay=0.2',
+    ]
+
+    scraper.fetch_titles(urls, deadline_seconds=0.1)
+
+    # Buscas que passaram do prazo do lote continuam até o próprio timeout e então liberam as vagas
+    assert wait_until(lambda: free_slots(scraper._fetch_slots) == 4)
+    assert free_slots(scraper._host_semaphore(base_url)) == 2
+
+
+def test_capacity_exceeded(base_url):
+    scraper = make_scraper(SCRAPE_MAX_CONCURRENT_FETCHES=1, SCRAPE_RETRY_AFTER=7)
+    holder = threading.Thread(target=scraper.fetch_title, args=(f'{base_url}/title?name=slow&delay=0.5',))
+    holder.start()
+    assert wait_until(lambda: free_slots(scraper._fetch_slots) == 0)
+
+    with pytest.raises(ScrapeCapacityExceeded) as error:
+        scraper.fetch_title(f'{base_url}/title?name=other', queue_timeout=0.05)
+
+    holder.join()
+    assert error.value.retry_after == 7
+    assert scraper.fetch_title(f'{base_url}/title?name=other') == 'other'
@@ -0,0 +1,56 @@
+import time
+
+from sqlalchemy import select
+
+from api.app_factory import create_app
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db
+from infrastructure.database.migrations import upgrade
+from infrastructure.security.auth.token_blocklist import TokenBlocklist
+
+
+def make_app(tmp_path, **config):
+    app = create_app(
+        blueprints=['auth'], SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}", SWAGGER_ENABLED=False,
+        METRICS_ENABLED=False, **config
+    )
+    with app.app_context():
+        upgrade()
+    return app
+
+
+def test_memory_blocklist_drops_expired_tokens(tmp_path):
+    blocklist = TokenBlocklist(make_app(tmp_path, JWT_BLOCKLIST='memory', JWT_BLOCKLIST_PRUNE_SECONDS=0))
+    now = time.time()
+
+    blocklist.revoke('expired', now - 1)
+    blocklist.revoke('valid', now + 60)
+
+    assert blocklist.is_revoked('valid')
+    assert not blocklist.is_revoked('expired')
+    assert list(blocklist._revoked) == ['valid']
+
+
+def test_prune_is_throttled(tmp_path):
+    blocklist = TokenBlocklist(make_app(tmp_path, JWT_BLOCKLIST='memory', JWT_BLOCKLIST_PRUNE_SECONDS=3600))
+    blocklist.revoke('first', time.time() + 60)
+
+    blocklist.revoke('expired', time.time() - 1)
+
+    # O descarte já rodou na primeira revogação e só volta a rodar depois do intervalo
+    assert 'expired' in blocklist._revoked
+
+
+def test_sqlite_blocklist_deletes_expired_rows(tmp_path):
+    app = make_app(tmp_path, JWT_BLOCKLIST='sqlite', JWT_BLOCKLIST_PRUNE_SECONDS=0)
+    blocklist = TokenBlocklist(app)
+    now = time.time()
+
+    with app.app_context():
+        blocklist.revoke('expired', now - 1)
+        blocklist.revoke('valid', now + 60)
+
+        assert blocklist.is_revoked('valid')
+        assert not blocklist.is_revoked('expired')
+        rows = db.session.scalars(select(ConfigSQLAlchemy.RevokedToken.jti)).all()
+
+    assert rows == ['valid']
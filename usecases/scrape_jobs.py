@@ -0,0 +1,277 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from sqlalchemy import and_, delete, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from infrastructure.database.flask_sqlalchemyinit import ConfigSQLAlchemy, db, utcnow
+from usecases.title_scraper import ScrapeCapacityExceeded
+from usecases.title_scraperinit import title_scraper
+
+# Busca de títulos em segundo plano (POST /scrape/jobs e GET /scrape/jobs/<id>).
+# A fila é a tabela scrape_job do banco da aplicação, então sobrevive a reinícios e é compartilhada
+# por todos os processos que usam o mesmo arquivo, sem broker externo:
+#   - Um pedido para uma URL que já tem job em andamento (queued ou running) recebe o mesmo job.
+#   - Cada worker pega o job mais antigo com um único UPDATE ... RETURNING (atômico no SQLite) e
+#     o mantém por SCRAPE_JOB_LEASE_SECONDS; se o processo morrer no meio da busca, o job volta
+#     a ser pego por outro worker depois desse prazo (no máximo SCRAPE_JOB_MAX_ATTEMPTS vezes).
+#   - Jobs concluídos ficam disponíveis para consulta por SCRAPE_JOB_RETENTION_SECONDS.
+#
+# As threads de cada processo (SCRAPE_JOB_WORKERS) são iniciadas na primeira requisição a /scrape/jobs,
+# o que também funciona com workers criados por fork. Para processar a fila em um processo separado
+# (com SCRAPE_JOB_WORKERS = 0 os processos da API apenas enfileiram):
+#   python -m usecases.scrape_jobs --workers 4
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+
+def _now():
+    # Datas gravadas sem fuso (UTC), como nas demais colunas DateTime do SQLite
+    return utcnow().replace(tzinfo=None)
+
+
+def _isoformat(value):
+    return value.isoformat() + 'Z' if value is not None else None
+
+
+class ScrapeJobQueue:
+    """
+    Extensão com a fila de buscas em segundo plano.
+
+    Methods:
+        init_app(app):
+            Registra a extensão (SCRAPE_JOB_*).
+        enqueue(url):
+            Cria um job para a URL (ou reaproveita o que já está em andamento) e retorna o seu id.
+        get(job_id):
+            Retorna o estado do job (dicionário) ou None se ele não existir.
+        start_workers(app, workers=None):
+            Inicia as threads de processamento neste processo (SCRAPE_JOB_WORKERS, se `workers` não for
+            informado), se ainda não estiverem rodando.
+        run(app, workers=None):
+            Processa a fila em primeiro plano, até o processo ser interrompido ou stop() ser chamado.
+            Sem `workers`, usa SCRAPE_JOB_WORKERS, e ao menos uma thread mesmo quando ele é 0.
+        stop(timeout=None):
+            Encerra as threads deste processo (depois do job em andamento) e espera por elas.
+    """
+
+    def __init__(self, app=None):
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._stopping = threading.Event()
+        self._pid = None
+        self._next_cleanup = 0.0
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['scrape_jobs'] = self
+
+    def enqueue(self, url):
+        job_id = self._active_job_id(url)
+        if job_id is not None:
+            return job_id
+
+        job_id = uuid.uuid4().hex
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(insert(ConfigSQLAlchemy.ScrapeJob.__table__).values(
+                    id=job_id, url=url, status=QUEUED, attempts=0, created_at=_now()
+                ))
+        except IntegrityError:
+            # Outro pedido para a mesma URL criou o job entre a consulta e a inserção
+            job_id = self._active_job_id(url)
+            if job_id is None:
+                raise
+            return job_id
+
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id):
+        table = ConfigSQLAlchemy.ScrapeJob.__table__
+        with db.engine.connect() as connection:
+            job = connection.execute(select(table).where(table.c.id == job_id)).first()
+        if job is None:
+            return None
+
+        result = {'id': job.id, 'url': job.url, 'status': job.status, 'created_at': _isoformat(job.created_at)}
+        if job.status == DONE:
+            result['title'] = job.title
+        elif job.status == FAILED:
+            result['error'] = job.error
+        if job.finished_at is not None:
+            result['finished_at'] = _isoformat(job.finished_at)
+        return result
+
+    def start_workers(self, app, workers=None):
+        if workers is None:
+            workers = app.config.get('SCRAPE_JOB_WORKERS', 2)
+        if not workers:
+            return
+
+        with self._lock:
+            # Threads não são herdadas por fork: cada processo inicia as suas
+            if self._pid == os.getpid() and self._threads:
+                return
+            self._pid = os.getpid()
+            # Um evento por grupo de threads: stop() encerra só as que já estavam rodando
+            self._stopping = threading.Event()
+            self._threads = [
+                threading.Thread(target=self._work, args=(app, self._stopping), name=f'scrape-job-{index}',
+                                 daemon=True)
+                for index in range(workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def run(self, app, workers=None):
+        if workers is None:
+            # SCRAPE_JOB_WORKERS = 0 desliga as threads dos processos da API, não as deste processo
+            workers = max(app.config.get('SCRAPE_JOB_WORKERS', 2), 1)
+        if workers < 1:
+            raise ValueError("workers deve ser maior que zero")
+
+        self.start_workers(app, workers)
+        for thread in list(self._threads):
+            thread.join()
+
+    def stop(self, timeout=None):
+        with self._lock:
+            threads, self._threads = self._threads, []
+            self._stopping.set()
+        self._wakeup.set()
+        for thread in threads:
+            thread.join(timeout)
+
+    def _active_job_id(self, url):
+        table = ConfigSQLAlchemy.ScrapeJob.__table__
+        with db.engine.connect() as connection:
+            return connection.scalar(
+                select(table.c.id).where(table.c.url == url, table.c.status.in_(ACTIVE_STATUSES))
+            )
+
+    def _work(self, app, stopping):
+        with app.app_context():
+            while not stopping.is_set():
+                try:
+                    job = self._claim(app.config)
+                    if job is None:
+                        self._cleanup(app.config)
+                        self._wakeup.wait(app.config.get('SCRAPE_JOB_POLL_SECONDS', 1))
+                        if not stopping.is_set():
+                            self._wakeup.clear()
+                        continue
+                    self._process(job, app.config)
+                except OperationalError as e:
+                    # Banco ocupado por outro processo: tenta de novo em seguida
+                    logger.warning("Fila de scraping indisponível: %s", e)
+                    stopping.wait(app.config.get('SCRAPE_JOB_POLL_SECONDS', 1))
+                except Exception:
+                    logger.exception("Erro inesperado no worker da fila de scraping")
+                    stopping.wait(app.config.get('SCRAPE_JOB_POLL_SECONDS', 1))
+
+    def _claim(self, config):
+        """
+        Pega o job mais antigo na fila (ou cujo worker perdeu o prazo) e o marca como running.
+        Jobs que já passaram de SCRAPE_JOB_MAX_ATTEMPTS são marcados como failed no caminho.
+
+        Returns:
+            Row or None: (id, url, attempts) do job.
+        """
+        table = ConfigSQLAlchemy.ScrapeJob.__table__
+        while True:
+            now = _now()
+            next_job = (
+                select(table.c.id)
+                .where(or_(table.c.status == QUEUED, and_(table.c.status == RUNNING, table.c.locked_until < now)))
+                .order_by(table.c.created_at)
+                .limit(1)
+                .scalar_subquery()
+            )
+
+            with db.engine.begin() as connection:
+                job = connection.execute(
+                    update(table)
+                    .where(table.c.id == next_job)
+                    .values(status=RUNNING, attempts=table.c.attempts + 1,
+                            locked_until=now + timedelta(seconds=config.get('SCRAPE_JOB_LEASE_SECONDS', 60)))
+                    .returning(table.c.id, table.c.url, table.c.attempts)
+                ).first()
+
+            if job is None or job.attempts <= config.get('SCRAPE_JOB_MAX_ATTEMPTS', 3):
+                return job
+            self._finish(job, FAILED, error="Job interrupted too many times")
+
+    def _process(self, job, config):
+        try:
+            title = title_scraper.fetch_title(job.url)
+        except ScrapeCapacityExceeded as e:
+            # Sem vaga no limite global de buscas: o job volta para a fila sem contar a tentativa
+            self._release(job)
+            time.sleep(e.retry_after)
+            return
+        except Exception as e:
+            self._finish(job, FAILED, error=str(e))
+            return
+        self._finish(job, DONE, title=title)
+
+    def _finish(self, job, status, title=None, error=None):
+        table = ConfigSQLAlchemy.ScrapeJob.__table__
+        with db.engine.begin() as connection:
+            # attempts identifica a posse: se o prazo venceu e outro worker retomou o job, vale o resultado dele
+            connection.execute(
+                update(table)
+                .where(table.c.id == job.id, table.c.attempts == job.attempts)
+                .values(status=status, title=title, error=error, locked_until=None, finished_at=_now())
+            )
+
+    def _release(self, job):
+        table = ConfigSQLAlchemy.ScrapeJob.__table__
+        with db.engine.begin() as connection:
+            connection.execute(
+                update(table)
+                .where(table.c.id == job.id, table.c.attempts == job.attempts)
+                .values(status=QUEUED, attempts=table.c.attempts - 1, locked_until=None)
+            )
+
+    def _cleanup(self, config):
+        if time.monotonic() < self._next_cleanup:
+            return
+        retention = config.get('SCRAPE_JOB_RETENTION_SECONDS', 86400)
+        self._next_cleanup = time.monotonic() + min(retention, 3600)
+
+        table = ConfigSQLAlchemy.ScrapeJob.__table__
+        with db.engine.begin() as connection:
+            connection.execute(delete(table).where(table.c.finished_at < _now() - timedelta(seconds=retention)))
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from api.app_factory import create_app
+    from usecases.scrape_jobsinit import scrape_jobs
+
+    parser = argparse.ArgumentParser(description='Processa a fila de buscas de título em segundo plano')
+    parser.add_argument('--workers', type=int, help='Threads deste processo (padrão: SCRAPE_JOB_WORKERS, mínimo 1)')
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers deve ser maior que zero')
+
+    logging.basicConfig(level=logging.INFO)
+    app = create_app(blueprints=['scraping'])
+    workers = args.workers if args.workers is not None else max(app.config['SCRAPE_JOB_WORKERS'], 1)
+    print(f"Processando a fila de scraping com {workers} threads (Ctrl+C para sair)")
+    scrape_jobs.run(app, workers)
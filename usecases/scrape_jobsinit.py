@@ -0,0 +1,5 @@
+from usecases.scrape_jobs import ScrapeJobQueue
+
+# Instância única da fila de scraping em segundo plano, ligada ao app quando o blueprint
+# 'scraping' é registrado (api/web_scraping_api.py)
+scrape_jobs = ScrapeJobQueue()
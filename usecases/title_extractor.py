@@ -0,0 +1,93 @@
+import codecs
+from html.parser import HTMLParser
+
+# Extração do <title> de uma página.
+# O caminho por streaming alimenta um parser incremental com o corpo em partes e para assim que
+# encontra </title> (ou o fim do <head>), sem baixar nem analisar o restante da página.
+# A análise completa com BeautifulSoup continua disponível como alternativa (e é usada quando o
+# streaming não encontra o título).
+
+
+class _TitleParser(HTMLParser):
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = None
+        self.done = False
+        self._in_title = False
+        self._parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'title' and self.title is None:
+            self._in_title = True
+        elif tag == 'body':
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == 'title' and self._in_title:
+            self._in_title = False
+            self.title = ''.join(self._parts)
+            self.done = True
+        elif tag == 'head':
+            self.done = True
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._parts.append(data)
+
+
+def charset_from_content_type(content_type, default='utf-8'):
+    for part in (content_type or '').split(';')[1:]:
+        name, _, value = part.strip().partition('=')
+        if name.lower() == 'charset' and value:
+            try:
+                return codecs.lookup(value.strip('"\'')).name
+            except LookupError:
+                break
+    return default
+
+
+def extract_title_streaming(chunks, max_bytes, encoding='utf-8'):
+    """
+    Lê o corpo da página em partes até encontrar o título.
+
+    Args:
+        chunks (iterable): Partes do corpo da resposta (bytes).
+        max_bytes (int): Limite de bytes lidos; ao atingi-lo a leitura é interrompida.
+        encoding (str): Codificação do corpo (normalmente vinda do Content-Type).
+
+    Returns:
+        tuple: (título ou None, bytes lidos até a interrupção).
+    """
+    parser = _TitleParser()
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    data = bytearray()
+
+    for chunk in chunks:
+        chunk = chunk[:max_bytes - len(data)]
+        data.extend(chunk)
+        parser.feed(decoder.decode(chunk))
+
+        if parser.done or len(data) >= max_bytes:
+            break
+
+    title = parser.title.strip() if parser.title is not None else None
+    return title or None, bytes(data)
+
+
+def extract_title_full(content):
+    """
+    Analisa o documento inteiro com BeautifulSoup e retorna o título.
+
+    Args:
+        content (bytes or str): Corpo da página.
+
+    Returns:
+        str or None: O título da página, ou None se não houver.
+    """
+    from bs4 import BeautifulSoup  # Importado apenas quando a análise completa é usada
+
+    soup = BeautifulSoup(content, 'html.parser')
+    if soup.title is None or soup.title.string is None:
+        return None
+    return soup.title.string.strip() or None
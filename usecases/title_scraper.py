@@ -0,0 +1,223 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+import requests
+
+from infrastructure.http.http_cache import CachingHTTPClient, DiskCacheBackend, MemoryCacheBackend
+from infrastructure.http.session import build_session
+from infrastructure.metrics.metricsinit import metrics
+from usecases.title_extractor import charset_from_content_type, extract_title_full, extract_title_streaming
+
+# Extração do título de páginas web, individualmente ou em lote.
+# No lote, as URLs são buscadas em paralelo por um pool de threads compartilhado, com limite de
+# requisições simultâneas por host (para não sobrecarregar um mesmo site), timeouts de conexão e
+# leitura em cada requisição e um prazo total para o lote inteiro.
+# Todas as buscas (individuais e dos lotes) também passam por um limite global de buscas simultâneas
+# (SCRAPE_MAX_CONCURRENT_FETCHES): acima dele, a busca espera no máximo SCRAPE_QUEUE_TIMEOUT segundos
+# por uma vaga e falha com ScrapeCapacityExceeded, em vez de formar uma fila sem fim.
+#
+# O cliente HTTP, o pool de threads e os limites são criados a partir da configuração do app
+# (TitleScraper.init_app), quando o blueprint 'scraping' é registrado.
+
+
+def build_http_client(config):
+    """
+    Cria o cliente HTTP do scraper conforme a configuração (SCRAPE_POOL_*, SCRAPE_RETRIES, SCRAPE_HTTP_CACHE*).
+
+    Args:
+        config (Config): Configuração do app Flask.
+    """
+    session = build_session(
+        pool_connections=config['SCRAPE_POOL_CONNECTIONS'],
+        pool_maxsize=config['SCRAPE_POOL_MAXSIZE'],
+        retries=config['SCRAPE_RETRIES'],
+        backoff_factor=config['SCRAPE_RETRY_BACKOFF']
+    )
+
+    if config['SCRAPE_HTTP_CACHE'] == 'memory':
+        backend = MemoryCacheBackend(config['SCRAPE_HTTP_CACHE_MAX_BYTES'])
+    elif config['SCRAPE_HTTP_CACHE'] == 'disk':
+        backend = DiskCacheBackend(config['SCRAPE_HTTP_CACHE_DIR'], config['SCRAPE_HTTP_CACHE_MAX_BYTES'])
+    else:
+        backend = None
+
+    return CachingHTTPClient(session, backend)
+
+
+class ScrapeDeadlineExceeded(Exception):
+    pass
+
+
+class ScrapeCapacityExceeded(Exception):
+    """
+    Limite global de buscas simultâneas atingido.
+
+    Attributes:
+        retry_after (int): Sugestão de espera, em segundos, antes de tentar de novo.
+    """
+
+    def __init__(self, retry_after):
+        super().__init__("Limite de buscas simultâneas atingido")
+        self.retry_after = retry_after
+
+
+class TitleScraper:
+    """
+    Extensão com o cliente HTTP, o pool de threads e os limites de busca do scraper.
+
+    Attributes:
+        http_client (CachingHTTPClient): Cliente compartilhado por todas as threads; reaproveita
+            conexões (keep-alive) e o cache de páginas.
+
+    Methods:
+        init_app(app):
+            Cria o cliente HTTP, o pool de threads e os limites a partir da configuração do app (SCRAPE_*).
+        fetch_title(url, timeout=None, queue_timeout=None):
+            Busca uma página e retorna o texto da sua tag <title>.
+        fetch_titles(urls, deadline_seconds=None):
+            Busca os títulos de várias páginas em paralelo.
+    """
+
+    def __init__(self, app=None):
+        self.config = None
+        self.http_client = None
+        self._executor = None
+        self._host_limits = {}
+        self._host_limits_lock = threading.Lock()
+        self._fetch_slots = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['title_scraper'] = self
+        if self._executor is not None:
+            # Ligada a outro app: as buscas seguintes usam os limites e o cliente da nova configuração
+            self._executor.shutdown(wait=False)
+
+        self.config = app.config
+        self.http_client = build_http_client(app.config)
+        self._executor = ThreadPoolExecutor(max_workers=app.config['SCRAPE_MAX_WORKERS'], thread_name_prefix='scraper')
+        with self._host_limits_lock:
+            self._host_limits = {}
+        self._fetch_slots = threading.BoundedSemaphore(app.config['SCRAPE_MAX_CONCURRENT_FETCHES'])
+
+    def fetch_title(self, url, timeout=None, queue_timeout=None):
+        """
+        Busca uma página e retorna o texto da sua tag <title>.
+
+        Args:
+            url (str): A URL da página a ser analisada.
+            timeout (tuple): Timeouts de conexão e leitura, em segundos.
+            queue_timeout (float): Espera máxima por uma vaga no limite global de buscas simultâneas.
+
+        Returns:
+            str: O título da página.
+
+        Raises:
+            requests.RequestException: Falha de rede, timeout ou status HTTP de erro.
+            ValueError: A página não possui título.
+            ScrapeCapacityExceeded: Nenhuma vaga liberada dentro de queue_timeout.
+        """
+        config = self.config
+        queue_timeout = config['SCRAPE_QUEUE_TIMEOUT'] if queue_timeout is None else queue_timeout
+        fetch_slots = self._fetch_slots
+        if not fetch_slots.acquire(timeout=queue_timeout):
+            raise ScrapeCapacityExceeded(config['SCRAPE_RETRY_AFTER'])
+
+        started_at = time.perf_counter()
+        try:
+            return self._fetch_title(url, timeout or (config['SCRAPE_CONNECT_TIMEOUT'], config['SCRAPE_READ_TIMEOUT']))
+        finally:
+            fetch_slots.release()
+            # Busca e leitura em partes até o </title> (métrica outbound_http_duration_seconds e Server-Timing)
+            metrics.record_http(time.perf_counter() - started_at)
+
+    def fetch_titles(self, urls, deadline_seconds=None):
+        """
+        Busca os títulos de várias páginas em paralelo.
+
+        Args:
+            urls (list): URLs a serem analisadas.
+            deadline_seconds (float): Prazo total do lote; URLs não concluídas a tempo retornam erro.
+
+        Returns:
+            list: Um dicionário por URL, na mesma ordem, com `title` ou `error`.
+        """
+        deadline_seconds = deadline_seconds or self.config['SCRAPE_TOTAL_DEADLINE']
+        deadline = time.monotonic() + deadline_seconds
+
+        # Cada busca roda com uma cópia do contexto de quem chamou, para que o tempo gasto entre no Server-Timing da requisição
+        futures = [
+            self._executor.submit(contextvars.copy_context().run, self._fetch_with_host_limit, url, deadline)
+            for url in urls
+        ]
+        wait(futures, timeout=deadline_seconds)
+
+        results = []
+        for url, future in zip(urls, futures):
+            if not future.done():
+                future.cancel()
+                results.append({"url": url, "error": "Prazo total do lote excedido"})
+                continue
+
+            try:
+                results.append({"url": url, "title": future.result()})
+            except Exception as e:
+                results.append({"url": url, "error": str(e)})
+
+        return results
+
+    def _host_semaphore(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._host_limits_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.config['SCRAPE_PER_HOST_LIMIT'])
+            return self._host_limits[host]
+
+    def _fetch_title(self, url, timeout):
+        config = self.config
+        if config['SCRAPE_TITLE_STREAMING']:
+            with self.http_client.open(url, timeout=timeout) as response:
+                if response.status_code >= 400:
+                    raise requests.HTTPError(f"{response.status_code} Error for url: {url}")
+
+                title, content = extract_title_streaming(
+                    response.iter_content(),
+                    max_bytes=config['SCRAPE_TITLE_MAX_BYTES'],
+                    encoding=charset_from_content_type(response.headers.get('content-type'))
+                )
+
+            # Sem título no trecho lido: analisa esse mesmo trecho com BeautifulSoup, que tolera HTML malformado
+            title = title or extract_title_full(content)
+        else:
+            response = self.http_client.get(url, timeout=timeout)
+            if response.status_code >= 400:
+                raise requests.HTTPError(f"{response.status_code} Error for url: {url}")
+
+            title = extract_title_full(response.content)
+
+        if title is None:
+            raise ValueError("A página não possui título")
+        return title
+
+    def _fetch_with_host_limit(self, url, deadline):
+        semaphore = self._host_semaphore(url)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not semaphore.acquire(timeout=remaining):
+            raise ScrapeDeadlineExceeded("Prazo total do lote excedido")
+
+        try:
+            # O timeout de leitura não passa do tempo que ainda resta para o lote
+            remaining = max(deadline - time.monotonic(), 0.001)
+            timeout = (
+                min(self.config['SCRAPE_CONNECT_TIMEOUT'], remaining),
+                min(self.config['SCRAPE_READ_TIMEOUT'], remaining)
+            )
+            return self.fetch_title(url, timeout=timeout, queue_timeout=remaining)
+        finally:
+            semaphore.release()
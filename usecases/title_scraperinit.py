@@ -0,0 +1,5 @@
+from usecases.title_scraper import TitleScraper
+
+# Instância única do scraper (cliente HTTP, pool de threads e limites), ligada ao app quando o
+# blueprint 'scraping' é registrado (api/web_scraping_api.py)
+title_scraper = TitleScraper()